@@ -0,0 +1,98 @@
+# ----- ----- ----- -----
+# bench_import_time.py
+# For Albion Online "Griffin Empire" Guild only
+# Do not distribute or modify
+# Author: DragonTaki (https://github.com/DragonTaki)
+# Create Date: 2026/10/19
+# Update Date: 2026/10/19
+# Version: v1.0
+# ----- ----- ----- -----
+
+# Import-time guard for the GUI cold start.
+# Usage (from the attendance-ocr-bot folder):
+#     python benchmarks/bench_import_time.py [--module gui.main_interface] [--budget-ms 800] [--top 15]
+# Exits with 1 if the budget is exceeded or a forbidden module is imported.
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+# ----- Constants ----- #
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+DEFAULT_MODULE = "gui.main_interface"
+DEFAULT_BUDGET_MS = 800
+DEFAULT_TOP = 15
+
+# The OCR stack must only be loaded on the first screenshot task
+FORBIDDEN_MODULES = ("cv2", "numpy", "pytesseract", "PIL", "fuzzywuzzy", "botcore.core.ocr_engine")
+
+# Format: 'import time:       123 |       4567 |   package.module'
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+# ----- Helper Functions ----- #
+def measure_imports(module: str) -> list[tuple[str, int, int, int]]:
+    """
+    Import a module in a fresh interpreter with `-X importtime`.
+
+    Args:
+        module (str): Module to import.
+
+    Returns:
+        list[tuple[str, int, int, int]]: (module name, self us, cumulative us, nesting depth) per import.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+
+    entries = []
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            entries.append((name, int(self_us), int(cumulative_us), len(indent) // 2))
+    return entries
+
+
+# ----- Main Function ----- #
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check the import time of the GUI entry module.")
+    parser.add_argument("--module", default=DEFAULT_MODULE, help="Module to import.")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="Maximum total import time.")
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP, help="Number of slowest imports to show.")
+    args = parser.parse_args()
+
+    entries = measure_imports(args.module)
+    total_ms = sum(cumulative for _, _, cumulative, depth in entries if depth == 0) / 1000
+
+    print(f"Slowest imports (cumulative) for {args.module}:")
+    for name, self_us, cumulative_us, _ in sorted(entries, key=lambda e: e[2], reverse=True)[:args.top]:
+        print(f"  {cumulative_us / 1000:8.1f} ms  (self {self_us / 1000:6.1f} ms)  {name}")
+
+    failed = False
+    print(f"Total import time: {total_ms:.1f} ms (budget {args.budget_ms:.0f} ms)")
+    if total_ms > args.budget_ms:
+        print("❌ Import time budget exceeded.")
+        failed = True
+
+    imported = {name for name, _, _, _ in entries}
+    forbidden = sorted(
+        name for name in imported
+        if any(name == prefix or name.startswith(prefix + ".") for prefix in FORBIDDEN_MODULES)
+    )
+    if forbidden:
+        print(f"❌ Forbidden modules imported at startup: {', '.join(forbidden)}")
+        failed = True
+
+    if not failed:
+        print("✅ Import time within budget.")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,456 @@
+# ----- ----- ----- -----
+# run_benchmarks.py
+# For Albion Online "Griffin Empire" Guild only
+# Do not distribute or modify
+# Author: DragonTaki (https://github.com/DragonTaki)
+# Create Date: 2026/10/19
+# Update Date: 2026/10/19
+# Version: v1.0
+# ----- ----- ----- -----
+
+# Hot-path benchmarks with accuracy and throughput regression gates.
+# Runs in a scratch workspace (own settings.json, cache and attendance folders), so real data is never touched.
+# Usage (from the attendance-ocr-bot folder):
+#     python benchmarks/synthetic_roster.py --out bench_data --images 200 --days 3
+#     python benchmarks/run_benchmarks.py --corpus bench_data --out results.json --save-baseline benchmarks/baseline.json
+#     python benchmarks/run_benchmarks.py --corpus bench_data --baseline benchmarks/baseline.json
+#     python benchmarks/run_benchmarks.py --only match_template dedupe --repeat 10
+# Exits with 1 if the accuracy run fails, a case is slower than the baseline beyond --tolerance,
+# or recall/precision drop beyond --accuracy-tolerance.
+# The corpus is copied into the workspace (re-dated to end today) and always OCR'd from scratch, so it can be reused.
+# No baseline is committed: timings only compare on the same machine. Save one there with --save-baseline before
+# the change under test (same corpus, same --repeat), then gate with --baseline; benchmarks/baseline.json is git-ignored.
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import Callable, Iterator
+
+# ----- Constants ----- #
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+DEFAULT_REPEAT = 5
+DEFAULT_TOLERANCE = 0.20            # Allowed slowdown vs baseline (20%)
+DEFAULT_ACCURACY_TOLERANCE = 0.01   # Allowed recall/precision drop vs baseline
+MIN_SAMPLE_SEC = 0.05               # Calls per sample are raised until one sample takes this long
+
+RESOLUTIONS = ((1280, 720), (1920, 1080), (2560, 1440))
+DEDUPE_POINT_COUNTS = (100, 1000, 5000)
+ROSTER_SIZES = (100, 500, 2000)
+INTERVAL_GRID = ((7, 100), (28, 300), (28, 1000))  # (days, players)
+CACHE_SIZES = (100, 1000, 10000)
+REPORT_ROSTER_SIZES = (100, 1000, 5000)
+
+BENCHMARKS: dict[str, Callable] = {}
+
+
+def benchmark(name: str):
+    """
+    Register a benchmark. The function receives the run context and yields (case, callable) pairs.
+    """
+    def register(func):
+        BENCHMARKS[name] = func
+        return func
+    return register
+
+
+# ----- Helper Functions ----- #
+def time_case(func: Callable[[], object], repeat: int) -> dict:
+    """
+    Time a callable: calibrate calls per sample, then take `repeat` samples.
+
+    Returns:
+        dict: Per-call min/median/p95 in ms, with calls per sample and sample count.
+    """
+    start = time.perf_counter()
+    func()
+    single = time.perf_counter() - start
+    number = max(int(MIN_SAMPLE_SEC / single), 1) if single > 0 else 1000
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number * 1000)
+
+    samples.sort()
+    return {
+        "min_ms": round(samples[0], 4),
+        "median_ms": round(statistics.median(samples), 4),
+        "p95_ms": round(samples[min(int(round(0.95 * (len(samples) - 1))), len(samples) - 1)], 4),
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def prepare_workspace() -> str:
+    """
+    Create a scratch working directory with the app data the OCR engine needs, and enter it.
+    Must run before importing `botcore`, whose paths are relative to the working directory.
+    """
+    workspace = tempfile.mkdtemp(prefix="attendance_bench_")
+    shutil.copytree(os.path.join(PROJECT_ROOT, "app_data"), os.path.join(workspace, "app_data"))
+    os.chdir(workspace)
+    sys.path.insert(0, PROJECT_ROOT)
+    return workspace
+
+
+def render_sample(ctx: SimpleNamespace, resolution: tuple[int, int], rows: int = 200):
+    """
+    Render one synthetic panel into the workspace and return it as a PIL image.
+    """
+    from PIL import Image
+    from synthetic_roster import load_roster, render_panel
+
+    rng = random.Random(0)
+    path = os.path.join(ctx.workspace, "samples", f"sample_{resolution[0]}x{resolution[1]}.png")
+    if not os.path.exists(path):
+        render_panel({
+            "path": path, "names": load_roster(None, rows, rng), "scale": 1.0, "resolution": resolution,
+            "fonts": [], "jpeg_quality": 90, "noise": 0.0, "seed": 0,
+        })
+    with Image.open(path) as image:
+        return image.convert("RGB")
+
+
+def sample_regions(ctx: SimpleNamespace, count: int = 20) -> list:
+    """
+    Name regions cropped by the engine from a synthetic 1080p panel.
+    """
+    if not hasattr(ctx, "regions"):
+        from botcore.core.ocr_engine import get_ocr_engine
+        engine = get_ocr_engine()
+        ctx.regions = engine.extract_name_regions(engine.enlarge_image(render_sample(ctx, (1920, 1080))))
+    return ctx.regions[:count]
+
+
+def write_cache(cache_type, json_data) -> None:
+    from botcore.core.cache import _save_to_cache
+    _save_to_cache({"timestamp": datetime.now(timezone.utc), "type": cache_type.value, "json_data": json_data})
+
+
+def clear_cache_folder() -> None:
+    from botcore.config.settings_manager import get_settings
+    shutil.rmtree(get_settings().folder_paths.cache, ignore_errors=True)
+
+
+# ----- Benchmarks ----- #
+@benchmark("match_template")
+def bench_match_template(ctx) -> Iterator[tuple[str, Callable]]:
+    from botcore.core.ocr_engine import MATCH_SCALES, _match_template, _pil_to_cv2_gray, get_ocr_engine
+    engine = get_ocr_engine()
+    for width, height in RESOLUTIONS:
+        gray = _pil_to_cv2_gray(engine.enlarge_image(render_sample(ctx, (width, height))))
+        yield f"{width}x{height}", lambda gray=gray: _match_template(gray, engine.button_template_cv2, MATCH_SCALES, threshold=0.8)
+
+
+@benchmark("dedupe")
+def bench_deduplicate_matches(ctx) -> Iterator[tuple[str, Callable]]:
+    from botcore.core.ocr_engine import _deduplicate_matches
+    rng = random.Random(1)
+    for n in DEDUPE_POINT_COUNTS:
+        # Clusters of ~5 nearby hits, like one button matched at several scales
+        points = [
+            (cx + rng.randint(-4, 4), cy + rng.randint(-4, 4), rng.choice((0.9, 1.0, 1.1)))
+            for cx, cy in ((rng.randint(0, 3840), rng.randint(0, 2160)) for _ in range(n // 5))
+            for _ in range(5)
+        ]
+        yield f"{n}_points", lambda points=points: _deduplicate_matches(list(points), tolerance=10)
+
+
+@benchmark("preprocess")
+def bench_preprocess(ctx) -> Iterator[tuple[str, Callable]]:
+    from botcore.core.ocr_engine import PREPROCESS_VERSIONS
+    region = sample_regions(ctx, 1)[0]
+    for label, preprocess in PREPROCESS_VERSIONS.items():
+        yield label, lambda preprocess=preprocess: preprocess(region)
+
+
+@benchmark("ocr_region")
+def bench_ocr_region(ctx) -> Iterator[tuple[str, Callable]]:
+    from botcore.core.ocr_engine import PREPROCESS_VERSIONS, get_ocr_engine
+    import pytesseract
+    engine = get_ocr_engine()
+    pytesseract.get_tesseract_version()  # Raises if Tesseract is not installed
+    region = sample_regions(ctx, 1)[0]
+    for label, preprocess in PREPROCESS_VERSIONS.items():
+        version = preprocess(region)
+        yield label, lambda version=version: engine.perform_ocr_on_versions([version], None)
+
+
+@benchmark("match_names")
+def bench_match_player_names(ctx) -> Iterator[tuple[str, Callable]]:
+    from botcore.core.ocr_engine import get_ocr_engine
+    from synthetic_roster import load_roster
+    engine = get_ocr_engine()
+    rng = random.Random(2)
+    for size in ROSTER_SIZES:
+        roster = load_roster(None, size, rng)
+        # Half exact reads, half OCR-like corruptions
+        recognized = [name if i % 2 else name[:-1] + "l" for i, name in enumerate(rng.sample(roster, 20))]
+        yield f"roster_{size}", lambda roster=roster, recognized=recognized: engine.match_player_names(recognized, roster, "[v1]")
+
+
+@benchmark("interval_summary")
+def bench_interval_summary(ctx) -> Iterator[tuple[str, Callable]]:
+    from botcore.config.constant import DATETIME_FORMATS
+    from botcore.core.daily_summary import DAILY_SUMMARY, calculate_interval_summary
+    from synthetic_roster import load_roster
+    rng = random.Random(3)
+    today = datetime.today()
+    for days, players in INTERVAL_GRID:
+        roster = load_roster(None, players, rng)
+        result_by_day = {
+            (today - timedelta(days=d)).strftime(DATETIME_FORMATS.folder): [
+                {"name": name, "attendance": rng.randint(1, 5)} for name in rng.sample(roster, players * 2 // 3)
+            ]
+            for d in range(days)
+        }
+        yield f"{days}d_x_{players}p", lambda r=result_by_day: calculate_interval_summary(DAILY_SUMMARY.SCREENSHOT, r)
+
+
+@benchmark("load_cache")
+def bench_load_from_cache(ctx) -> Iterator[tuple[str, Callable]]:
+    from botcore.config.constant import CacheType, INTERVALS
+    from botcore.core.cache import load_from_cache
+    from synthetic_roster import load_roster
+    rng = random.Random(4)
+    for size in CACHE_SIZES:
+        clear_cache_folder()
+        roster = load_roster(None, size, rng)
+        write_cache(CacheType.KILLBOARD, {i: {name: rng.randint(0, i) for name in roster} for i in INTERVALS})
+        yield f"killboard_{size}", lambda: load_from_cache(CacheType.KILLBOARD)
+
+
+@benchmark("report")
+def bench_generate_report(ctx) -> Iterator[tuple[str, Callable]]:
+    from botcore.config.constant import CacheType, INTERVALS
+    from botcore.core.generate_report import generate_report
+    from synthetic_roster import load_roster
+    rng = random.Random(5)
+    for size in REPORT_ROSTER_SIZES:
+        clear_cache_folder()
+        roster = load_roster(None, size, rng)
+        write_cache(CacheType.MEMBERLIST, roster)
+        write_cache(CacheType.KILLBOARD, {i: {name: rng.randint(0, i) for name in roster} for i in INTERVALS})
+        yield f"roster_{size}", lambda: generate_report(use_killboard=True)
+
+
+# ----- Accuracy ----- #
+def copy_corpus(corpus: str, truth: dict, workspace: str) -> dict[str, str]:
+    """
+    Copy the corpus images into a scratch attendance folder, re-dated so the newest day is today.
+
+    The pipeline stores OCR results and profiles next to the images, so running in place would make
+    every later run reuse them; and days older than DAYS_LOOKBACK would be skipped.
+
+    Returns:
+        dict[str, str]: Scratch folder name of each ground truth day.
+    """
+    from botcore.config.constant import DATETIME_FORMATS
+
+    attendance_folder = os.path.join(workspace, "attendance")
+    days = sorted(truth["days"], key=lambda day: datetime.strptime(day, DATETIME_FORMATS.folder), reverse=True)
+    today = datetime.today()
+    folder_by_day = {}
+    for offset, day in enumerate(days):
+        folder_name = (today - timedelta(days=offset)).strftime(DATETIME_FORMATS.folder)
+        target = os.path.join(attendance_folder, folder_name)
+        os.makedirs(target)
+        for image in truth["days"][day]["images"]:
+            shutil.copy2(os.path.join(corpus, day, image["file"]), target)
+        folder_by_day[day] = folder_name
+    return folder_by_day
+
+
+def run_accuracy(corpus: str, workspace: str) -> dict:
+    """
+    Run the full screenshot pipeline over a labeled corpus from `synthetic_roster.py`.
+
+    Returns:
+        dict: Name-level recall/precision, count accuracy and throughput, overall and per day.
+    """
+    from botcore.config.settings_manager import get_settings
+    from botcore.core.process_screenshot import create_word_list_file, parse_screenshot_file
+
+    corpus = os.path.abspath(corpus)
+    with open(os.path.join(corpus, "ground_truth.json"), "r", encoding="utf-8") as f:
+        truth = json.load(f)
+
+    settings = get_settings()
+    folder_by_day = copy_corpus(corpus, truth, workspace)
+    settings.folder_paths.attendance = os.path.join(workspace, "attendance")
+    settings.force_regenerate_daily_summary = True  # Never reuse stored OCR texts
+    settings.debug_images.enabled = False  # Writing debug images is not part of the measured pipeline
+    roster = truth["roster"]
+    wordlist_path = create_word_list_file(roster)
+
+    totals = {"true_positive": 0, "predicted": 0, "expected": 0, "count_matched": 0, "count_expected": 0}
+    images = regions = 0
+    elapsed = 0.0
+    per_day = {}
+    for day, day_truth in sorted(truth["days"].items()):
+        start = time.perf_counter()
+        attendance_list, _ = parse_screenshot_file(folder_by_day[day], roster, wordlist_path)
+        elapsed += time.perf_counter() - start
+        if attendance_list is None:
+            # Also returned for skipped folders, so it cannot be told apart from a broken run
+            raise RuntimeError(f"Screenshot pipeline returned no result for day \"{day}\".")
+
+        predicted = {entry["name"]: entry["attendance"] for entry in attendance_list}
+        expected = day_truth["attendance"]
+        true_positive = len(predicted.keys() & expected.keys())
+        count_matched = sum(min(predicted.get(name, 0), count) for name, count in expected.items())
+
+        per_day[day] = {
+            "recall": round(true_positive / len(expected), 4) if expected else 1.0,
+            "precision": round(true_positive / len(predicted), 4) if predicted else 0.0,
+        }
+        totals["true_positive"] += true_positive
+        totals["predicted"] += len(predicted)
+        totals["expected"] += len(expected)
+        totals["count_matched"] += count_matched
+        totals["count_expected"] += sum(expected.values())
+        images += len(day_truth["images"])
+        regions += sum(len(image["rows"]) for image in day_truth["images"])
+
+    return {
+        "recall": round(totals["true_positive"] / totals["expected"], 4) if totals["expected"] else 1.0,
+        "precision": round(totals["true_positive"] / totals["predicted"], 4) if totals["predicted"] else 0.0,
+        "count_accuracy": round(totals["count_matched"] / totals["count_expected"], 4) if totals["count_expected"] else 1.0,
+        "images_per_sec": round(images / elapsed, 3) if elapsed else 0.0,
+        "regions_per_sec": round(regions / elapsed, 3) if elapsed else 0.0,
+        "images": images,
+        "days": per_day,
+    }
+
+
+# ----- Baseline Comparison ----- #
+def compare_to_baseline(results: dict, baseline: dict, tolerance: float, accuracy_tolerance: float) -> list[str]:
+    """
+    Print the change of every case against the baseline.
+
+    Returns:
+        list[str]: Regressions beyond the tolerances.
+    """
+    regressions = []
+    print(f"\n{'case':<40} {'median ms':>12} {'baseline':>12} {'change':>9}")
+    for case, current in sorted(results["benchmarks"].items()):
+        previous = baseline.get("benchmarks", {}).get(case)
+        if not previous or "median_ms" not in current or "median_ms" not in previous:
+            print(f"{case:<40} {current.get('median_ms', float('nan')):>12.3f} {'-':>12} {'-':>9}")
+            continue
+        change = current["median_ms"] / previous["median_ms"] - 1 if previous["median_ms"] else 0.0
+        marker = " ❌" if change > tolerance else (" ✅" if change < -tolerance else "")
+        print(f"{case:<40} {current['median_ms']:>12.3f} {previous['median_ms']:>12.3f} {change:>+8.1%}{marker}")
+        if change > tolerance:
+            regressions.append(f"{case} is {change:.1%} slower than baseline")
+
+    current_accuracy = results.get("accuracy") or {}
+    previous_accuracy = baseline.get("accuracy") or {}
+    for metric in ("recall", "precision", "count_accuracy"):
+        if metric in current_accuracy and metric in previous_accuracy:
+            drop = previous_accuracy[metric] - current_accuracy[metric]
+            print(f"{metric:<40} {current_accuracy[metric]:>12.4f} {previous_accuracy[metric]:>12.4f} {-drop:>+9.4f}")
+            if drop > accuracy_tolerance:
+                regressions.append(f"{metric} dropped by {drop:.4f}")
+    return regressions
+
+
+# ----- Main Function ----- #
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run hot-path benchmarks and compare against a baseline.")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="Benchmarks to run (default: all).")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Samples per case.")
+    parser.add_argument("--corpus", help="Labeled corpus from synthetic_roster.py for accuracy/throughput.")
+    parser.add_argument("--out", help="Write results JSON here.")
+    parser.add_argument("--baseline", help="Compare against this results JSON.")
+    parser.add_argument("--save-baseline", help="Also write the results as the new baseline here.")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="Allowed slowdown ratio.")
+    parser.add_argument("--accuracy-tolerance", type=float, default=DEFAULT_ACCURACY_TOLERANCE, help="Allowed recall/precision drop.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    # Resolve user paths before switching into the scratch workspace
+    for attr in ("corpus", "out", "baseline", "save_baseline"):
+        if getattr(args, attr):
+            setattr(args, attr, os.path.abspath(getattr(args, attr)))
+
+    original_cwd = os.getcwd()
+    ctx = SimpleNamespace(workspace=prepare_workspace())
+    results = {
+        "meta": {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+        },
+        "benchmarks": {},
+        "skipped": {},
+        "accuracy": None,
+    }
+
+    for name in args.only or BENCHMARKS:
+        try:
+            for case, func in BENCHMARKS[name](ctx):
+                key = f"{name}[{case}]"
+                try:
+                    results["benchmarks"][key] = time_case(func, args.repeat)
+                    print(f"{key:<40} {results['benchmarks'][key]['median_ms']:>12.3f} ms")
+                except Exception as e:
+                    results["skipped"][key] = str(e)
+                    print(f"{key:<40} skipped: {e}")
+        except ImportError as e:
+            results["skipped"][name] = f"missing dependency: {e.name}"
+            print(f"{name:<40} skipped: missing dependency {e.name}")
+        except Exception as e:
+            results["skipped"][name] = str(e)
+            print(f"{name:<40} skipped: {e}")
+
+    failed = False
+    if args.corpus:
+        try:
+            results["accuracy"] = run_accuracy(args.corpus, ctx.workspace)
+            accuracy = results["accuracy"]
+            print(f"\nAccuracy: recall {accuracy['recall']:.4f}, precision {accuracy['precision']:.4f}, "
+                  f"count accuracy {accuracy['count_accuracy']:.4f}, {accuracy['images_per_sec']:.2f} images/s")
+        except Exception as e:
+            results["accuracy_error"] = str(e)
+            print(f"\n❌ Accuracy run failed: {e}")
+            failed = True
+
+    # A failed accuracy run must not become the baseline
+    for path in (args.out, None if failed else args.save_baseline):
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(results, f, indent=2)
+            print(f"Results written to \"{path}\".")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(results, baseline, args.tolerance, args.accuracy_tolerance)
+        for regression in regressions:
+            print(f"❌ {regression}")
+        failed = failed or bool(regressions)
+        if not regressions:
+            print("✅ No regressions against baseline.")
+
+    os.chdir(original_cwd)
+    shutil.rmtree(ctx.workspace, ignore_errors=True)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,291 @@
+# ----- ----- ----- -----
+# synthetic_roster.py
+# For Albion Online "Griffin Empire" Guild only
+# Do not distribute or modify
+# Author: DragonTaki (https://github.com/DragonTaki)
+# Create Date: 2026/10/19
+# Update Date: 2026/10/19
+# Version: v1.0
+# ----- ----- ----- -----
+
+# Synthetic guild attendance screenshots for offline benchmarking.
+# Renders panels of name rows, each followed by the minus button from `app_data/button.png`,
+# laid out with the same offsets `ocr_engine.NameRegion` crops, and writes ground truth JSON.
+# Usage (from the attendance-ocr-bot folder):
+#     python benchmarks/synthetic_roster.py --out bench_data --images 1000 --days 5 --workers 8
+#     python benchmarks/synthetic_roster.py --out bench_data --roster roster.txt --font arial.ttf --scale 0.9 1.2
+# Output layout:
+#     <out>/roster.txt                       All names used (the "guild member list")
+#     <out>/ground_truth.json                Per-day attendance and per-image rows
+#     <out>/<day>/<image>.jpg|png            Screenshots, in the attendance folder layout (DATETIME_FORMATS.folder)
+
+import argparse
+import json
+import os
+import random
+import string
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+
+from PIL import Image, ImageDraw, ImageFont
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)  # Run as a script from any folder
+from botcore.config.constant import DATETIME_FORMATS
+
+# ----- Constants ----- #
+BUTTON_TEMPLATE_PATH = os.path.join(PROJECT_ROOT, "app_data", "button.png")
+GROUND_TRUTH_FILENAME = "ground_truth.json"
+ROSTER_FILENAME = "roster.txt"
+
+# `NameRegion` is defined on screenshots enlarged by SCALE_FACTOR (2.0); these are the 1x values
+OCR_SCALE_FACTOR = 2.0
+NAME_OFFSET_X = -166 / OCR_SCALE_FACTOR
+NAME_OFFSET_Y = 0 / OCR_SCALE_FACTOR
+NAME_WIDTH = 163 / OCR_SCALE_FACTOR
+NAME_HEIGHT = 35 / OCR_SCALE_FACTOR
+
+# Panel look
+BACKGROUND_COLOR = (38, 31, 27)
+ROW_COLORS = ((52, 43, 37), (46, 38, 33))
+TEXT_COLOR = (226, 214, 190)
+ROW_SPACING = 1.35         # Row pitch in name-box heights
+COLUMN_GAP = 40            # Pixels between panel columns (1x UI scale)
+PANEL_MARGIN = 24
+
+# Names
+NAME_CHARS = string.ascii_letters + string.digits
+NAME_LENGTH = (3, 16)      # Albion names are 3-16 letters/digits
+
+
+# ----- Helper Functions ----- #
+def random_name(rng: random.Random) -> str:
+    length = rng.randint(*NAME_LENGTH)
+    return rng.choice(string.ascii_uppercase) + "".join(rng.choice(NAME_CHARS) for _ in range(length - 1))
+
+
+def load_roster(path: str | None, size: int, rng: random.Random) -> list[str]:
+    """
+    Read a roster file (one name per line), or generate `size` unique random names.
+    """
+    if path:
+        with open(path, "r", encoding="utf-8") as f:
+            return [line.strip() for line in f if line.strip()]
+
+    names = set()
+    while len(names) < size:
+        names.add(random_name(rng))
+    return sorted(names)
+
+
+def load_font(font_paths: list[str], size: int, rng: random.Random) -> tuple[ImageFont.ImageFont, str]:
+    """
+    Pick one of the given TrueType fonts, falling back to Pillow's default font.
+    """
+    if font_paths:
+        path = rng.choice(font_paths)
+        return ImageFont.truetype(path, size), os.path.basename(path)
+    try:
+        return ImageFont.load_default(size=size), "default"
+    except TypeError:  # Pillow < 10.1 has no sized default font
+        return ImageFont.load_default(), "default"
+
+
+def fit_text(draw: ImageDraw.ImageDraw, text: str, font: ImageFont.ImageFont, max_width: float) -> str:
+    """
+    Truncate text that would not fit into the name box, as the game UI does.
+    """
+    while len(text) > 1 and draw.textlength(text, font=font) > max_width:
+        text = text[:-1]
+    return text
+
+
+def add_noise(image: Image.Image, sigma: float, rng: random.Random) -> Image.Image:
+    """
+    Blend gaussian noise into an RGB image.
+    """
+    if sigma <= 0:
+        return image
+    noise = Image.effect_noise(image.size, sigma).convert("RGB")
+    # effect_noise is centered at 128; a fixed blend keeps the mean brightness close to the source
+    return Image.blend(image, noise, alpha=min(0.05 + sigma / 400, 0.35) * rng.uniform(0.8, 1.2))
+
+
+# ----- Rendering ----- #
+def render_panel(job: dict) -> dict:
+    """
+    Render one screenshot and save it.
+
+    Args:
+        job (dict): Output path, names, UI scale, resolution, fonts, quality, noise and seed.
+
+    Returns:
+        dict: Ground truth of the image (file, scale, font and one entry per row).
+    """
+    rng = random.Random(job["seed"])
+    scale = job["scale"]
+    width, height = job["resolution"]
+
+    image = Image.new("RGB", (width, height), BACKGROUND_COLOR)
+    draw = ImageDraw.Draw(image)
+
+    with Image.open(BUTTON_TEMPLATE_PATH) as template:
+        button = template.convert("RGBA")
+        button = button.resize((round(button.width * scale), round(button.height * scale)), Image.LANCZOS)
+
+    name_width = NAME_WIDTH * scale
+    name_height = NAME_HEIGHT * scale
+    row_pitch = round(name_height * ROW_SPACING)
+    column_width = round(-NAME_OFFSET_X * scale + button.width + COLUMN_GAP * scale)
+    font, font_name = load_font(job["fonts"], max(round(name_height * 0.7), 6), rng)
+
+    rows = []
+    names = iter(job["names"])
+    finished = False
+    column_left = PANEL_MARGIN
+    while not finished and column_left + column_width <= width:
+        top = PANEL_MARGIN
+        while top + row_pitch <= height - PANEL_MARGIN:
+            name = next(names, None)
+            if name is None:
+                finished = True
+                break
+
+            # Button top-left is the template match point; the name box sits left of it
+            button_x = round(column_left - NAME_OFFSET_X * scale)
+            button_y = top
+            name_box = (
+                round(button_x + NAME_OFFSET_X * scale),
+                round(button_y + NAME_OFFSET_Y * scale),
+                round(button_x + NAME_OFFSET_X * scale + name_width),
+                round(button_y + NAME_OFFSET_Y * scale + name_height),
+            )
+
+            draw.rectangle((column_left, top, button_x + button.width, top + row_pitch - 2), fill=ROW_COLORS[len(rows) % 2])
+            shown = fit_text(draw, name, font, name_width - 4)
+            draw.text((name_box[0] + 2, name_box[1] + name_height / 2), shown, fill=TEXT_COLOR, font=font, anchor="lm")
+            image.paste(button, (button_x, button_y), button)
+
+            rows.append({"name": name, "shown": shown, "button": [button_x, button_y], "name_box": list(name_box)})
+            top += row_pitch
+        column_left += column_width
+
+    image = add_noise(image, job["noise"], rng)
+    os.makedirs(os.path.dirname(job["path"]), exist_ok=True)
+    if job["path"].lower().endswith((".jpg", ".jpeg")):
+        image.save(job["path"], quality=job["jpeg_quality"])
+    else:
+        image.save(job["path"])
+
+    return {
+        "file": os.path.basename(job["path"]),
+        "scale": scale,
+        "font": font_name,
+        "rows": rows,
+    }
+
+
+def rows_per_image(resolution: tuple[int, int], scale: float) -> int:
+    """
+    Number of rows that fit a panel, so names are never cut off by the layout.
+    """
+    with Image.open(BUTTON_TEMPLATE_PATH) as template:
+        button_width = round(template.width * scale)
+    width, height = resolution
+    row_pitch = round(NAME_HEIGHT * scale * ROW_SPACING)
+    column_width = round(-NAME_OFFSET_X * scale + button_width + COLUMN_GAP * scale)
+    columns = max((width - PANEL_MARGIN) // column_width, 0)
+    rows = max((height - 2 * PANEL_MARGIN) // row_pitch, 0)
+    return columns * rows
+
+
+# ----- Main Function ----- #
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Generate synthetic guild attendance screenshots with ground truth.")
+    parser.add_argument("--out", required=True, help="Output folder (used as the attendance folder).")
+    parser.add_argument("--images", type=int, default=100, help="Total number of screenshots.")
+    parser.add_argument("--days", type=int, default=1, help="Spread screenshots over this many day folders, ending today.")
+    parser.add_argument("--roster", help="Roster file, one name per line. Random names if omitted.")
+    parser.add_argument("--roster-size", type=int, default=300, help="Random roster size.")
+    parser.add_argument("--attendance-rate", type=float, default=0.7, help="Share of the roster present each day.")
+    parser.add_argument("--font", action="append", default=[], help="TrueType font path (repeatable).")
+    parser.add_argument("--scale", type=float, nargs="+", default=[1.0], help="UI scales to pick from.")
+    parser.add_argument("--resolution", default="1280x720", help="Screenshot size, e.g., 1920x1080.")
+    parser.add_argument("--format", choices=("jpg", "png"), default="png", help="Image format.")
+    parser.add_argument("--jpeg-quality", type=int, default=85, help="JPEG quality (jpg only).")
+    parser.add_argument("--noise", type=float, default=0.0, help="Gaussian noise sigma, 0 for none.")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed; the same seed gives the same corpus.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Parallel render processes.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    rng = random.Random(args.seed)
+    width, height = (int(v) for v in args.resolution.lower().split("x"))
+
+    roster = load_roster(args.roster, args.roster_size, rng)
+    if not roster:
+        print("❌ Roster is empty.")
+        return 1
+
+    today = datetime.today()
+    day_names = [(today - timedelta(days=offset)).strftime(DATETIME_FORMATS.folder) for offset in range(args.days)]
+
+    jobs = []
+    day_present = {}
+    for day_index, day in enumerate(day_names):
+        present = rng.sample(roster, max(round(len(roster) * args.attendance_rate), 1))
+        day_present[day] = present
+        day_images = args.images // args.days + (1 if day_index < args.images % args.days else 0)
+
+        # Page through the present members like scrolling the panel, wrapping around
+        cursor = 0
+        for image_index in range(day_images):
+            scale = rng.choice(args.scale)
+            capacity = rows_per_image((width, height), scale)
+            names = [present[(cursor + i) % len(present)] for i in range(min(capacity, len(present)))]
+            cursor = (cursor + len(names)) % len(present)
+            jobs.append({
+                "day": day,
+                "path": os.path.join(args.out, day, f"synthetic_{image_index:05d}.{args.format}"),
+                "names": names,
+                "scale": scale,
+                "resolution": (width, height),
+                "fonts": args.font,
+                "jpeg_quality": args.jpeg_quality,
+                "noise": args.noise,
+                "seed": rng.getrandbits(32),
+            })
+
+    os.makedirs(args.out, exist_ok=True)
+    with ProcessPoolExecutor(max_workers=max(args.workers, 1)) as pool:
+        results = list(pool.map(render_panel, jobs, chunksize=16))
+
+    # Ground truth: images per day, and how many images each name appears in (the "attendance" count)
+    days = {day: {"present": sorted(day_present[day]), "attendance": {}, "images": []} for day in day_names}
+    for job, result in zip(jobs, results):
+        day = days[job["day"]]
+        day["images"].append(result)
+        for row in result["rows"]:
+            day["attendance"][row["name"]] = day["attendance"].get(row["name"], 0) + 1
+
+    with open(os.path.join(args.out, ROSTER_FILENAME), "w", encoding="utf-8") as f:
+        f.writelines(name + "\n" for name in roster)
+    with open(os.path.join(args.out, GROUND_TRUTH_FILENAME), "w", encoding="utf-8") as f:
+        json.dump({
+            "generated_at": datetime.now().isoformat(timespec="seconds"),
+            "args": vars(args),
+            "roster": roster,
+            "days": days,
+        }, f, indent=2)
+
+    total_rows = sum(len(r["rows"]) for r in results)
+    print(f"✅ Generated {len(results)} images ({total_rows} name rows) over {len(day_names)} day(s) in \"{args.out}\".")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
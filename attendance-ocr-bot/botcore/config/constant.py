@@ -4,8 +4,8 @@
 # Do not distribute or modify
 # Author: DragonTaki (https://github.com/DragonTaki)
 # Create Date: 2025/04/25
-# Update Date: 2025/04/25
-# Version: v1.0
+# Update Date: 2026/10/19
+# Version: v1.1
 # ----- ----- ----- -----
 
 import re
@@ -43,6 +43,7 @@ EXTENSIONS = SafeNamespace(
     log   = ".log",
     text  = (".txt",),
     image = (".jpg", ".jpeg", ".png"),
+    video = (".mp4", ".mkv", ".avi", ".mov", ".webm"),
 )
 
 
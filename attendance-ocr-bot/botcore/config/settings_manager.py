@@ -4,32 +4,49 @@
 # Do not distribute or modify
 # Author: DragonTaki (https://github.com/DragonTaki)
 # Create Date: 2025/04/27
-# Update Date: 2025/04/27
-# Version: v1.0
+# Update Date: 2026/10/19
+# Version: v1.1
 # ----- ----- ----- -----
 
+import copy
+import json
 import os
+import threading
 import json5
 from collections import OrderedDict
 from shutil import copyfile
-from typing import Any, Union
+from typing import Any, Callable, Optional, Union
 
 from .constant import TEXTFILE_ENCODING
-from .static_settings import GUILD_INFO_LIST, USED_DATA, DATE_FORMAT, FOLDER_PATHS, MAX_CSV_VERSIONS, IF_DEBUG_MODE, IF_FORCE_NEW_DAILY_SUMMARY
+from .static_settings import GUILD_INFO_LIST, USED_DATA, KILLBOARD_MODE, DATE_FORMAT, FOLDER_PATHS, MAX_CSV_VERSIONS, NETWORK_SETTINGS, IF_DEBUG_MODE, IF_FORCE_NEW_DAILY_SUMMARY, DEBUG_IMAGE_SETTINGS, PROFILING_SETTINGS, METRICS_SETTINGS, PREFETCH_SETTINGS, WATCH_SETTINGS, VIDEO_SETTINGS, SERVICE_SETTINGS
 from botcore.safe_namespace import SafeNamespace
 
 
 # ----- Constants ----- #
 SETTINGS_PATH = "settings.json"
+SETTINGS_WATCH_INTERVAL_SEC = 2.0
+# Dict settings keyed by user-chosen names (e.g. hosts): entries added in settings.json are kept,
+# and filled from the "default" entry
+MAP_SETTING_KEYS = ("rate_limit",)
+MAP_TEMPLATE_KEY = "default"
 
 SETTING_KEYS = SafeNamespace(
     current_user="current_user",
     guild_info="guild_info",
     used_data="used_data",
+    killboard_mode="killboard_mode",
     date_format="date_format",
     folder_paths="folder_paths",
     max_csv_versions="max_csv_versions",
+    network="network",
     enable_debug_mode="enable_debug_mode",
+    debug_images="debug_images",
+    profiling="profiling",
+    metrics="metrics",
+    prefetch="prefetch",
+    watch="watch",
+    video="video",
+    service="service",
     force_regenerate_daily_summary="force_regenerate_daily_summary",
 )
 
@@ -40,10 +57,19 @@ current_settings = {
         "list": GUILD_INFO_LIST,
     },
     SETTING_KEYS.used_data: USED_DATA,
+    SETTING_KEYS.killboard_mode: KILLBOARD_MODE,
     SETTING_KEYS.date_format: DATE_FORMAT,
     SETTING_KEYS.folder_paths: FOLDER_PATHS,
     SETTING_KEYS.max_csv_versions: MAX_CSV_VERSIONS,
+    SETTING_KEYS.network: NETWORK_SETTINGS,
     SETTING_KEYS.enable_debug_mode: IF_DEBUG_MODE,
+    SETTING_KEYS.debug_images: DEBUG_IMAGE_SETTINGS,
+    SETTING_KEYS.profiling: PROFILING_SETTINGS,
+    SETTING_KEYS.metrics: METRICS_SETTINGS,
+    SETTING_KEYS.prefetch: PREFETCH_SETTINGS,
+    SETTING_KEYS.watch: WATCH_SETTINGS,
+    SETTING_KEYS.video: VIDEO_SETTINGS,
+    SETTING_KEYS.service: SERVICE_SETTINGS,
     SETTING_KEYS.force_regenerate_daily_summary: IF_FORCE_NEW_DAILY_SUMMARY,
 }
 
@@ -84,6 +110,14 @@ class Settings:
 # settings: Settings = None
 _settings_instance = None
 
+# Parsed file cache: path -> ((mtime_ns, size), parsed dict)
+_parsed_cache: dict[str, tuple[tuple[int, int], dict]] = {}
+# File state last read or written by this process, used by the watcher to detect external edits
+_known_file_state: Optional[tuple[int, int]] = None
+_settings_lock = threading.RLock()
+_watcher_thread: Optional[threading.Thread] = None
+_watcher_stop = threading.Event()
+
 def get_settings():
     """
     Make sure to set a single instance and load it when needed.
@@ -95,26 +129,111 @@ def get_settings():
 
 
 # ----- Helper Functions ----- #
-def _safe_load_json5(path: str) -> dict:
+def _get_file_state(path: str) -> Optional[tuple[int, int]]:
+    """Get the (mtime_ns, size) of a file, used as the key of the parsed cache.
+
+    Args:
+        path (str): File path.
+
+    Returns:
+        Optional[tuple[int, int]]: The file state, or None if missing.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _safe_load_json5(path: str, recover: bool = True) -> dict:
     """Try load JSON5. If fails, attempt partial load.
+    Parsed results are cached by file mtime and size, so an unchanged file is not parsed again.
 
     Args:
         path (str): Path to the JSON5 file.
+        recover (bool): Whether to recover a broken file partially instead of raising.
 
     Returns:
         dict: Parsed settings dictionary.
     """
+    state = _get_file_state(path)
+    cached = _parsed_cache.get(path)
+    if state and cached and cached[0] == state:
+        return copy.deepcopy(cached[1])
+
     try:
         with open(path, "r", encoding=TEXTFILE_ENCODING) as f:
-            return json5.load(f, object_pairs_hook=OrderedDict)  # Ensure it loads as ordered dict
+            parsed = json5.load(f, object_pairs_hook=OrderedDict)  # Ensure it loads as ordered dict
     except Exception as e:
+        if not recover:
+            raise
         print(f"[Warn] Failed to fully load {path}: {e}")
         print("[Info] Trying to recover as much as possible...")
         return _recover_partial_json5(path)
 
+    if state:
+        _parsed_cache[path] = (state, copy.deepcopy(parsed))
+    return parsed
+
+
+def _split_top_level_members(text: str) -> list[str]:
+    """Split a JSON5 object text into its top-level `key: value` members in one pass.
+    Strings and comments are skipped, so commas and brackets inside them are ignored.
+
+    Args:
+        text (str): Raw JSON5 text, with or without the outer braces.
+
+    Returns:
+        list[str]: Raw member texts.
+    """
+    has_outer = text.lstrip().startswith("{")
+    base_depth = 1 if has_outer else 0
+    members = []
+    depth = 0
+    start = None if has_outer else 0
+    quote = None
+    i, n = 0, len(text)
+
+    while i < n:
+        char = text[i]
+        if quote:
+            if char == "\\":
+                i += 2
+                continue
+            if char == quote:
+                quote = None
+        elif char in "\"'":
+            quote = char
+        elif text.startswith("//", i):
+            end = text.find("\n", i)
+            i = n if end < 0 else end
+            continue
+        elif text.startswith("/*", i):
+            end = text.find("*/", i + 2)
+            i = n if end < 0 else end + 2
+            continue
+        elif char in "{[":
+            depth += 1
+            if has_outer and depth == 1:
+                start = i + 1
+        elif char in "}]":
+            if has_outer and depth == 1 and start is not None:
+                members.append(text[start:i])
+                start = None
+            depth = max(depth - 1, 0)
+        elif char == "," and depth == base_depth and start is not None:
+            members.append(text[start:i])
+            start = i + 1
+        i += 1
+
+    if start is not None:
+        members.append(text[start:])  # Truncated file: keep the last member
+    return members
+
 
 def _recover_partial_json5(path: str) -> dict:
-    """Try load parts of JSON5 even if some lines are broken.
+    """Try load parts of JSON5 even if some members are broken.
+    Each top-level member is parsed once on its own, so recovery is linear in the file size.
 
     Args:
         path (str): Path to the JSON5 file.
@@ -122,16 +241,21 @@ def _recover_partial_json5(path: str) -> dict:
     Returns:
         dict: Partially recovered dictionary.
     """
-    recovered = {}
-    current = ""
-    with open(path, "r", encoding=TEXTFILE_ENCODING) as f:
-        for line in f:
-            try:
-                current += line
-                partial = json5.loads(f"{{{current}}}")
-                recovered = partial
-            except Exception:
-                continue
+    recovered = OrderedDict()
+    try:
+        with open(path, "r", encoding=TEXTFILE_ENCODING) as f:
+            text = f.read()
+    except Exception as e:
+        print(f"[Warn] Failed to read {path}: {e}")
+        return recovered
+
+    for member in _split_top_level_members(text):
+        if not member.strip():
+            continue
+        try:
+            recovered.update(json5.loads(f"{{{member}}}", object_pairs_hook=OrderedDict))
+        except Exception:
+            continue
     return recovered
 
 
@@ -159,9 +283,28 @@ def _save_settings(settings_dict: Union[dict, SafeNamespace]) -> None:
         settings_dict (Union[dict, SafeNamespace]): Settings data to save.
     """
     # Convert SafeNamespace objects to dict before saving
+    global _known_file_state
+
     settings_dict = settings_dict.to_dict() if isinstance(settings_dict, SafeNamespace) else settings_dict
-    with open(SETTINGS_PATH, "w", encoding=TEXTFILE_ENCODING) as f:
-        json5.dump(settings_dict, f, indent=4, ensure_ascii=False, default=_safe_namespace_default)
+    with _settings_lock:
+        tmp_path = SETTINGS_PATH + ".tmp"
+        with open(tmp_path, "w", encoding=TEXTFILE_ENCODING) as f:
+            json5.dump(settings_dict, f, indent=4, ensure_ascii=False, default=_safe_namespace_default)
+        os.replace(tmp_path, SETTINGS_PATH)
+        _known_file_state = _get_file_state(SETTINGS_PATH)
+        _parsed_cache.pop(SETTINGS_PATH, None)
+
+
+def _normalize(settings_dict: Union[dict, SafeNamespace]) -> Any:
+    """Convert settings into plain JSON types, so file content and merged settings compare equal.
+
+    Args:
+        settings_dict (Union[dict, SafeNamespace]): Settings data.
+
+    Returns:
+        Any: Plain JSON data.
+    """
+    return json.loads(json.dumps(settings_dict, default=_safe_namespace_default))
 
 
 def _merge_settings(settings_dict: Union[dict, SafeNamespace], default_dict: dict) -> dict:
@@ -184,7 +327,9 @@ def _merge_settings(settings_dict: Union[dict, SafeNamespace], default_dict: dic
             settings_value = settings_dict.get(key, None)
 
         # If value is a SafeNamespace, recursively merge using __dict__
-        if isinstance(value, SafeNamespace):
+        if key in MAP_SETTING_KEYS and isinstance(value, (dict, SafeNamespace)):
+            merged_dict[key] = _merge_map_settings(settings_value, value.__dict__ if isinstance(value, SafeNamespace) else value)
+        elif isinstance(value, SafeNamespace):
             merged_dict[key] = _merge_settings(settings_value or {}, value.__dict__)
         elif isinstance(value, dict):  # Handle normal dictionaries
             merged_dict[key] = _merge_settings(settings_value or {}, value)
@@ -195,6 +340,61 @@ def _merge_settings(settings_dict: Union[dict, SafeNamespace], default_dict: dic
     return merged_dict
 
 
+def _merge_map_settings(settings_value: Any, default_map: dict) -> dict:
+    """Merge a map-valued setting as the union of default and user entries.
+
+    Args:
+        settings_value (Any): The user's map, or None if missing.
+        default_map (dict): Default entries; the merged MAP_TEMPLATE_KEY entry fills user-added ones.
+
+    Returns:
+        dict: Merged map.
+    """
+    if isinstance(settings_value, SafeNamespace):
+        settings_value = settings_value.__dict__
+    if not isinstance(settings_value, dict):
+        settings_value = {}
+
+    merged_dict = _merge_settings(settings_value, default_map)
+    template = merged_dict.get(MAP_TEMPLATE_KEY)  # Includes the user's own changes to it
+    for key, value in settings_value.items():
+        if key in merged_dict:
+            continue
+        if isinstance(template, dict) and isinstance(value, (dict, SafeNamespace)):
+            merged_dict[key] = _merge_settings(value, template)
+        elif value is not None:
+            merged_dict[key] = value
+    return merged_dict
+
+
+def _load_merged_settings() -> dict:
+    """Read settings.json, merge it with defaults, and write it back only if the merge changed it.
+
+    Returns:
+        dict: Merged settings dictionary.
+    """
+    global _known_file_state
+
+    with _settings_lock:
+        if not os.path.exists(SETTINGS_PATH):
+            print("[DEBUG] No settings found, saving default settings.")
+            _save_settings(current_settings)
+            return current_settings
+
+        _known_file_state = _get_file_state(SETTINGS_PATH)
+        loaded_dict = _safe_load_json5(SETTINGS_PATH)
+        if not loaded_dict:
+            print("[Warn] No valid settings found, restoring default settings.")
+            copyfile(SETTINGS_PATH, SETTINGS_PATH + ".broken")
+            _save_settings(current_settings)
+            return current_settings
+
+        settings_dict = _merge_settings(loaded_dict, current_settings)
+        if _normalize(settings_dict) != _normalize(loaded_dict):
+            _save_settings(settings_dict)  # Add missing keys, drop unknown ones
+        return settings_dict
+
+
 # ----- Main Function ----- #
 def load_and_apply_settings() -> None:
     """Load settings.json and apply to global settings object.
@@ -206,22 +406,7 @@ def load_and_apply_settings() -> None:
     if _settings_instance is not None:
         return
 
-    if not os.path.exists(SETTINGS_PATH):
-        print("[DEBUG] No settings found, saving default settings.")
-        _save_settings(current_settings)
-        settings_dict = current_settings
-    else:
-        settings_dict = _safe_load_json5(SETTINGS_PATH)
-        if not settings_dict:
-            print("[Warn] No valid settings found, restoring default settings.")
-            copyfile(SETTINGS_PATH, SETTINGS_PATH + ".broken")
-            _save_settings(current_settings)
-            settings_dict = current_settings
-
-        settings_dict = _merge_settings(settings_dict, current_settings)
-        _save_settings(settings_dict)
-
-    _settings_instance = Settings(settings_dict)
+    _settings_instance = Settings(_load_merged_settings())
 
 
 # Save specific setting
@@ -258,6 +443,69 @@ def save_setting(key_path: str, value: Any) -> None:
     _save_settings(settings.to_dict())
 
 
+# ----- Hot Reload ----- #
+def reload_settings_if_changed() -> bool:
+    """Reload settings.json if it was modified outside this process.
+    The global settings object is updated in place, so modules holding it see the new values.
+    The logged-in user is kept. A file that does not fully parse (e.g. saved mid-edit) is
+    ignored rather than recovered, so the user's file is never rewritten by a reload.
+
+    Returns:
+        bool: True if settings were reloaded.
+    """
+    global _known_file_state
+
+    with _settings_lock:
+        state = _get_file_state(SETTINGS_PATH)
+        if _settings_instance is None or state is None or state == _known_file_state:
+            return False
+
+        _known_file_state = state
+        try:
+            loaded_dict = _safe_load_json5(SETTINGS_PATH, recover=False)
+        except Exception as e:
+            print(f"[Warn] Ignoring settings edit, file is not valid JSON5: {e}")
+            return False
+
+        current_user = _settings_instance.current_user
+        reloaded = Settings(_merge_settings(loaded_dict, current_settings))
+        reloaded.current_user = current_user
+        _settings_instance.__dict__.update(reloaded.__dict__)
+        return True
+
+
+def start_settings_watcher(
+    interval_sec: float = SETTINGS_WATCH_INTERVAL_SEC,
+    on_reload: Optional[Callable[[], None]] = None
+) -> None:
+    """Start a background thread polling settings.json for external edits.
+
+    Args:
+        interval_sec (float): Seconds between mtime checks.
+        on_reload (Callable[[], None], optional): Called after each reload (e.g. to log it).
+    """
+    global _watcher_thread
+    if _watcher_thread and _watcher_thread.is_alive():
+        return
+
+    def watch() -> None:
+        while not _watcher_stop.wait(interval_sec):
+            try:
+                if reload_settings_if_changed() and on_reload:
+                    on_reload()
+            except Exception as e:
+                print(f"[Warn] Failed to reload settings: {e}")
+
+    _watcher_stop.clear()
+    _watcher_thread = threading.Thread(target=watch, name="settings-watcher", daemon=True)
+    _watcher_thread.start()
+
+
+def stop_settings_watcher() -> None:
+    """Stop the settings watcher thread, if running."""
+    _watcher_stop.set()
+
+
 # ----- Manual Init ----- #
 # if settings is None:
 #    load_and_apply_settings()
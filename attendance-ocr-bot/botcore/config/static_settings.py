@@ -4,8 +4,8 @@
 # Do not distribute or modify
 # Author: DragonTaki (https://github.com/DragonTaki)
 # Create Date: 2025/04/18
-# Update Date: 2025/04/25
-# Version: v2.0
+# Update Date: 2026/10/19
+# Version: v2.1
 # ----- ----- ----- -----
 
 from botcore.safe_namespace import SafeNamespace
@@ -23,6 +23,9 @@ USED_DATA = SafeNamespace(
     screenshot = True,
 )
 
+# Killboard source: "aggregate" (pre-aggregated intervals) or "battles" (incremental battle ingestion)
+KILLBOARD_MODE = "aggregate"
+
 
 # Date Time Main Format
 DATE_FORMAT = "DDMMYYYY"
@@ -44,10 +47,90 @@ FOLDER_PATHS = SafeNamespace(
 MAX_CSV_VERSIONS = 3
 
 
+# Network Settings
+NETWORK_SETTINGS = SafeNamespace(
+    connect_timeout_sec = 5.0,
+    read_timeout_sec = 30.0,
+    max_retries = 3,
+    # Token bucket per host, "default" is used for hosts not listed
+    rate_limit = {
+        "default"                      : {"rate_per_sec": 2.0, "burst": 4},
+        "gameinfo-sgp.albiononline.com": {"rate_per_sec": 1.0, "burst": 3},
+        "api-east.albionbattles.com"   : {"rate_per_sec": 1.0, "burst": 3},
+    },
+    # Fail fast after repeated 5xx/429 responses, probe again after cooldown
+    circuit_breaker = {
+        "failure_threshold": 5,
+        "cooldown_sec": 60.0,
+    },
+)
+
+
 # Debug Settings
 IF_DEBUG_MODE = True
 IF_FORCE_NEW_DAILY_SUMMARY = False
 
+# OCR debug images (only written while debug mode is on)
+DEBUG_IMAGE_SETTINGS = SafeNamespace(
+    enabled = True,
+    sample_every_n_images = 1,     # Save debug images of every n-th screenshot only
+    failed_regions_only = False,   # Only save name regions that matched no player
+    png_compress_level = 1,        # 0-9, low is fast
+    max_folder_mb = 512,           # Oldest images are deleted beyond this size
+    max_queue = 256,               # Images waiting to be written, more are dropped
+)
+
+# Task profiling (cProfile + tracemalloc dumps into the log folder, also enabled by ATTENDANCE_BOT_PROFILE=1)
+PROFILING_SETTINGS = SafeNamespace(
+    enabled = False,
+    top_allocations = 25,          # Allocation sites listed in the report
+    top_functions = 40,            # Functions listed in the report, by cumulative time
+)
+
+# Metrics export in Prometheus text format
+METRICS_SETTINGS = SafeNamespace(
+    enabled = True,
+    textfile = "",                 # Empty: "<log folder>/attendance_bot.prom"
+    write_interval_sec = 15.0,
+    http_port = 0,                 # > 0 also serves http://127.0.0.1:<port>/metrics
+)
+
+# Background refresh of the member list and killboard caches before they expire
+PREFETCH_SETTINGS = SafeNamespace(
+    enabled = True,
+    lead_time_min = 30,            # Refresh this long before a cache expires
+    jitter_sec = 120,              # Random delay added to every refresh
+    daily_times = [],              # Extra local refresh times, e.g. ["06:00", "18:30"]
+    refresh_missing = True,        # Also fetch caches that do not exist yet
+    retry_after_min = 10,          # Wait after a refresh that did not produce a cache
+)
+
+# Watch the attendance folder and OCR new screenshots as they arrive
+WATCH_SETTINGS = SafeNamespace(
+    enabled = False,
+    poll_interval_sec = 2.0,
+    settle_sec = 3.0,              # An image must stay unchanged this long before it is read
+)
+
+# Screen recordings of the roster in the attendance folders
+VIDEO_SETTINGS = SafeNamespace(
+    sample_fps = 5.0,              # Frames decoded per second of video
+    min_frame_diff = 2.0,          # Mean grayscale change (0-255) below which a frame is skipped
+    row_hash_distance = 6,         # Name rows whose hashes differ in at most this many bits are the same row
+    row_cache_size = 512,          # Recent name rows remembered per video
+)
+
+# Local HTTP service (`python cli.py serve`)
+SERVICE_SETTINGS = SafeNamespace(
+    host = "127.0.0.1",            # Local only by default
+    port = 8765,
+    workers = 2,                   # Warm OCR/report worker threads
+    max_queue = 32,                # Queued jobs beyond this get HTTP 503
+    max_upload_mb = 20,
+    job_retention = 500,           # Finished jobs kept for GET /jobs/<id>
+    wait_timeout_sec = 60.0,       # Longest `?wait=` a request may block for
+)
+
 
 # Limit Version
 IF_TRIAL_VERSION = False
@@ -0,0 +1,496 @@
+# ----- ----- ----- -----
+# attendance_service.py
+# For Albion Online "Griffin Empire" Guild only
+# Do not distribute or modify
+# Author: DragonTaki (https://github.com/DragonTaki)
+# Create Date: 2026/10/19
+# Update Date: 2026/10/19
+# Version: v1.0
+# ----- ----- ----- -----
+
+import csv
+import io
+import json
+import queue
+import threading
+import time
+import uuid
+from collections import OrderedDict, defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Optional
+from urllib.parse import parse_qs, urlparse
+
+from botcore.config.constant import TEXTFILE_ENCODING
+from botcore.config.settings_manager import get_settings
+settings = get_settings()
+from botcore.logging.app_logger import LogLevel, log
+from botcore.utils.job_scheduler import JOB_KILLBOARD, JOB_MEMBERS, JOB_SCREENSHOT, JOB_TEXTFILE, JobScheduler, JobState, get_job_scheduler
+from botcore.utils.metrics import counter
+from .daily_summary import DAILY_SUMMARY
+from .fetch_daily_attendance import fetch_daily_attendance
+from .fetch_guild_members import fetch_guild_members
+from .fetch_killboard_attendance import fetch_killboard_attendance
+from .generate_report import ATTENDANCE_HEADERS, generate_report
+from .process_screenshot import create_word_list_file, get_valid_player_list, ocr_screenshot
+
+# ----- Constants ----- #
+JOB_SCREENSHOT_OCR = "screenshot_ocr"
+JOB_SUMMARY = "summary"
+JOB_REPORT = "report"
+
+SUMMARY_SOURCES = ("members", "killboard", "textfile", "screenshot")
+# Summaries run as these jobs of the shared scheduler, so they never overlap the same task
+# started by the folder watcher or the cache prefetcher
+SUMMARY_JOB_NAMES = {"members": JOB_MEMBERS, "killboard": JOB_KILLBOARD, "textfile": JOB_TEXTFILE, "screenshot": JOB_SCREENSHOT}
+REPORT_SOURCES = ("killboard", "textfile", "screenshot")
+
+JSON_CONTENT_TYPE = "application/json; charset=utf-8"
+CSV_CONTENT_TYPE = "text/csv; charset=utf-8"
+RETRY_AFTER_SEC = 5
+
+SERVICE_JOBS = counter("service_jobs_total", "Service jobs by kind and final state.", ("kind", "state"))
+SERVICE_REJECTED = counter("service_rejected_total", "Service requests rejected because the job queue was full.")
+
+
+# ----- Helper Functions ----- #
+def _interval_counts(summary: Optional[dict]) -> dict[str, int]:
+    return {str(interval): len(players) for interval, players in (summary or {}).items()}
+
+
+def _parse_report_sources(value: Optional[str]) -> dict[str, bool]:
+    """
+    Raises:
+        ValueError: If an unknown source is requested.
+    """
+    if not value:
+        return {source: bool(getattr(settings.used_data, source)) for source in REPORT_SOURCES}
+    requested = {part.strip() for part in value.split(",") if part.strip()}
+    unknown = requested - set(REPORT_SOURCES)
+    if unknown:
+        raise ValueError(f"Unknown report source(s): {', '.join(sorted(unknown))}.")
+    return {source: source in requested for source in REPORT_SOURCES}
+
+
+def report_rows_to_csv(rows: list[dict]) -> str:
+    """
+    Returns:
+        str: The report rows in the same CSV layout as the report files.
+    """
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=["Player"] + ATTENDANCE_HEADERS)
+    writer.writeheader()
+    writer.writerows(rows)
+    return buffer.getvalue()
+
+
+# ----- Service Job ----- #
+class ServiceJob:
+    """
+    One queued request. `result` is JSON-serializable once the job is done.
+    """
+
+    def __init__(self, kind: str, func: Callable[[], Any], params: dict):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.func = func
+        self.params = params
+        self.state = "queued"
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.submitted_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.finished = threading.Event()
+
+    def to_dict(self) -> dict:
+        data = {
+            "id": self.id,
+            "kind": self.kind,
+            "state": self.state,
+            "params": self.params,
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+        if self.state == "done":
+            data["result"] = self.result
+        if self.error:
+            data["error"] = self.error
+        return data
+
+
+class QueueFullError(Exception):
+    pass
+
+
+# ----- Attendance Service ----- #
+class AttendanceService:
+    """
+    Bounded job queue served by a pool of warm worker threads.
+
+    The OCR engine (Tesseract setup, button template) and the roster (member list and
+    Tesseract word list) are loaded once at start and shared by all workers. Summaries of the
+    same source never run concurrently, since they write the same cache files: they run as jobs
+    of the shared scheduler, alongside the folder watcher and the cache prefetcher.
+    """
+
+    def __init__(self, workers: int, max_queue: int, job_retention: int, scheduler: Optional[JobScheduler] = None):
+        self.workers = max(int(workers), 1)
+        self.scheduler = scheduler or get_job_scheduler()
+        self.job_retention = max(int(job_retention), 1)
+        self._queue: queue.Queue = queue.Queue(maxsize=max(int(max_queue), 1))
+        self._jobs: "OrderedDict[str, ServiceJob]" = OrderedDict()
+        self._jobs_lock = threading.Lock()
+        self._source_locks: dict[str, threading.Lock] = defaultdict(threading.Lock)
+        self._roster_lock = threading.Lock()
+        self._roster: Optional[tuple[list[str], str]] = None
+        self._engine = None
+        self._threads: list[threading.Thread] = []
+        self._stopping = threading.Event()
+
+    # ----- Lifecycle ----- #
+    def start(self) -> None:
+        self._warm_up()
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._worker, name=f"service-worker-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self) -> None:
+        self._stopping.set()
+        for _ in self._threads:
+            try:
+                self._queue.put_nowait(None)
+            except queue.Full:
+                break
+        self._threads.clear()
+
+    def _warm_up(self) -> None:
+        try:
+            from .ocr_engine import get_ocr_engine
+            self._engine = get_ocr_engine()
+        except Exception as e:
+            log(f"OCR engine unavailable, screenshot uploads will fail: {e}", LogLevel.WARN)
+        try:
+            self._get_roster()
+        except Exception as e:
+            log(f"Member list not loaded yet: {e}", LogLevel.WARN)
+
+    def _get_roster(self, reload: bool = False) -> tuple[list[str], str]:
+        with self._roster_lock:
+            if self._roster is None or reload:
+                player_list = list(get_valid_player_list() or [])
+                if not player_list:
+                    raise RuntimeError("No guild member list available.")
+                self._roster = (player_list, create_word_list_file(player_list))
+            return self._roster
+
+    # ----- Jobs ----- #
+    def submit(self, kind: str, func: Callable[[], Any], params: dict) -> ServiceJob:
+        """
+        Queue a job.
+
+        Raises:
+            QueueFullError: If the queue is at capacity.
+        """
+        job = ServiceJob(kind, func, params)
+        with self._jobs_lock:
+            try:
+                self._queue.put_nowait(job)
+            except queue.Full:
+                SERVICE_REJECTED.inc()
+                raise QueueFullError(f"Job queue is full ({self._queue.maxsize} jobs).")
+            self._jobs[job.id] = job
+            self._prune_jobs()
+        return job
+
+    def get_job(self, job_id: str) -> Optional[ServiceJob]:
+        with self._jobs_lock:
+            return self._jobs.get(job_id)
+
+    def stats(self) -> dict:
+        with self._jobs_lock:
+            states = defaultdict(int)
+            for job in self._jobs.values():
+                states[job.state] += 1
+        return {
+            "workers": self.workers,
+            "queue_size": self._queue.qsize(),
+            "queue_capacity": self._queue.maxsize,
+            "ocr_ready": self._engine is not None,
+            "roster_size": len(self._roster[0]) if self._roster else 0,
+            "jobs": dict(states),
+        }
+
+    def _prune_jobs(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished.is_set()]
+        for job_id in finished[:max(len(finished) - self.job_retention, 0)]:
+            del self._jobs[job_id]
+
+    def _worker(self) -> None:
+        while not self._stopping.is_set():
+            job = self._queue.get()
+            if job is None:
+                return
+            job.state = "running"
+            job.started_at = time.time()
+            try:
+                job.result = job.func()
+                job.state = "done"
+            except Exception as e:
+                job.state = "failed"
+                job.error = str(e)
+                log(f"Service job {job.kind} ({job.id}) failed: {e}", LogLevel.ERROR)
+            finally:
+                job.finished_at = time.time()
+                SERVICE_JOBS.inc(kind=job.kind, state=job.state)
+                job.finished.set()
+                with self._jobs_lock:
+                    self._prune_jobs()
+
+    # ----- Job Bodies ----- #
+    def ocr_screenshot_bytes(self, data: bytes, name: str) -> dict:
+        """
+        Read the player names of one uploaded screenshot.
+        """
+        if self._engine is None:
+            raise RuntimeError("OCR engine is not available.")
+        player_list, wordlist_path = self._get_roster()
+
+        start = time.perf_counter()
+        image = self._engine.open_image(io.BytesIO(data))
+        region_matches = ocr_screenshot(self._engine, image, player_list, wordlist_path, name)
+
+        players: dict[str, dict] = {}
+        for matches in region_matches:
+            for player, versions in matches.items():
+                entry = players.setdefault(player, {"name": player, "regions": 0, "versions": set()})
+                entry["regions"] += 1
+                entry["versions"] |= versions
+        return {
+            "image": name,
+            "regions": len(region_matches),
+            "players": [
+                {**entry, "versions": sorted(entry["versions"])}
+                for entry in sorted(players.values(), key=lambda e: e["name"].lower())
+            ],
+            "elapsed_sec": round(time.perf_counter() - start, 3),
+        }
+
+    def _run_scheduled(self, job_name: str, func: Callable[[], Any], label: str) -> Any:
+        """
+        Run a task as a job of the shared scheduler and wait for its result.
+
+        If a job of that name is already queued or running (GUI, watcher, prefetcher), it is
+        waited for first and then the task runs as its own job, which mostly reads what that job cached.
+
+        Raises:
+            RuntimeError: If the task failed or was cancelled.
+        """
+        while True:
+            job = self.scheduler.submit(job_name, func, label)
+            job.wait()
+            if job.func is not func:
+                continue
+            if job.state == JobState.CANCELLED:
+                raise RuntimeError(f"\"{label}\" was cancelled.")
+            if job.state == JobState.FAILED:
+                raise RuntimeError(str(job.error))
+            return job.result
+
+    def run_summary(self, source: str) -> dict:
+        label = f"Service: {source} summary"
+        if source == "members":
+            members = self._run_scheduled(JOB_MEMBERS, fetch_guild_members, label)
+            if members:
+                self._get_roster(reload=True)  # Match uploads against the fresh list
+            return {"source": source, "members": len(members or {})}
+
+        if source == "killboard":
+            task = fetch_killboard_attendance
+        else:
+            summary_type = DAILY_SUMMARY.TEXTFILE if source == "textfile" else DAILY_SUMMARY.SCREENSHOT
+            task = lambda: fetch_daily_attendance(summary_type)
+        summary = self._run_scheduled(SUMMARY_JOB_NAMES[source], task, label)
+        return {"source": source, "players_per_interval": _interval_counts(summary)}
+
+    def run_report(self, sources: dict[str, bool]) -> dict:
+        with self._source_locks[JOB_REPORT]:
+            rows = generate_report(sources["killboard"], sources["textfile"], sources["screenshot"], False)
+        return {"sources": [name for name, used in sources.items() if used], "rows": rows}
+
+
+# ----- HTTP Handler ----- #
+class _ServiceHandler(BaseHTTPRequestHandler):
+    """
+    Endpoints (all jobs accept `?wait=<sec>` to block until done, up to `service.wait_timeout_sec`):
+
+        GET  /health
+        POST /screenshots?name=<file>          body: image bytes      -> 202 {"job_id"}
+        POST /summaries/<members|killboard|textfile|screenshot>       -> 202 {"job_id"}
+        POST /reports?sources=killboard,screenshot                    -> 202 {"job_id"}
+        GET  /reports?sources=...&format=json|csv  (waits by default)
+        GET  /jobs/<id>[?format=csv]
+    """
+
+    server_version = "AttendanceBot"
+    service: AttendanceService = None  # Set by `serve`
+
+    # ----- Responses ----- #
+    def _send(self, status: int, body: bytes, content_type: str, headers: Optional[dict] = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, str(value))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status: int, data: Any, headers: Optional[dict] = None) -> None:
+        body = json.dumps(data, ensure_ascii=False).encode(TEXTFILE_ENCODING)
+        self._send(status, body, JSON_CONTENT_TYPE, headers)
+
+    def _send_error_json(self, status: int, message: str, headers: Optional[dict] = None) -> None:
+        self._send_json(status, {"error": message}, headers)
+
+    def _send_job(self, job: ServiceJob, query: dict, default_wait: float = 0.0) -> None:
+        try:
+            wait = float(query.get("wait", [default_wait])[0] or 0)
+        except ValueError:
+            wait = default_wait
+        wait = min(wait, float(settings.service.wait_timeout_sec))
+        if wait > 0:
+            job.finished.wait(wait)
+
+        if not job.finished.is_set():
+            self._send_json(202, {"job_id": job.id, "state": job.state}, {"Location": f"/jobs/{job.id}"})
+            return
+        if job.state == "failed":
+            self._send_json(500, job.to_dict())
+            return
+        if query.get("format", ["json"])[0] == "csv":
+            if job.kind != JOB_REPORT:
+                self._send_error_json(400, "CSV is only available for report jobs.")
+                return
+            self._send(200, report_rows_to_csv(job.result["rows"]).encode(TEXTFILE_ENCODING), CSV_CONTENT_TYPE)
+            return
+        self._send_json(200, job.to_dict())
+
+    def _submit(self, kind: str, func: Callable[[], Any], params: dict) -> Optional[ServiceJob]:
+        try:
+            return self.service.submit(kind, func, params)
+        except QueueFullError as e:
+            self._send_error_json(503, str(e), {"Retry-After": RETRY_AFTER_SEC})
+            return None
+
+    # ----- Routes ----- #
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        parts = [part for part in url.path.split("/") if part]
+
+        if parts == ["health"]:
+            self._send_json(200, {"status": "ok", **self.service.stats()})
+        elif len(parts) == 2 and parts[0] == "jobs":
+            job = self.service.get_job(parts[1])
+            if job is None:
+                self._send_error_json(404, "Unknown or expired job id.")
+            else:
+                self._send_job(job, query)
+        elif parts == ["reports"]:
+            self._post_report(query, default_wait=float(settings.service.wait_timeout_sec))
+        else:
+            self._send_error_json(404, "Not found.")
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        parts = [part for part in url.path.split("/") if part]
+
+        if parts == ["screenshots"]:
+            self._post_screenshot(query)
+        elif len(parts) == 2 and parts[0] == "summaries":
+            source = parts[1]
+            if source not in SUMMARY_SOURCES:
+                self._send_error_json(400, f"Unknown source \"{source}\", expected one of {', '.join(SUMMARY_SOURCES)}.")
+                return
+            job = self._submit(JOB_SUMMARY, lambda: self.service.run_summary(source), {"source": source})
+            if job:
+                self._send_job(job, query)
+        elif parts == ["reports"]:
+            self._post_report(query)
+        else:
+            self._send_error_json(404, "Not found.")
+
+    def _post_screenshot(self, query: dict) -> None:
+        try:
+            length = int(self.headers.get("Content-Length", ""))
+        except ValueError:
+            self._send_error_json(411, "Content-Length is required.")
+            return
+        # A negative length would make read() consume the stream until the client closes it
+        if length < 0:
+            self._send_error_json(400, "Invalid Content-Length.")
+            return
+        if length == 0:
+            self._send_error_json(400, "Empty upload.")
+            return
+        max_bytes = int(float(settings.service.max_upload_mb) * 1024 * 1024)
+        if length > max_bytes:
+            self._send_error_json(413, f"Upload is larger than {settings.service.max_upload_mb} MB.")
+            return
+        data = self.rfile.read(length)
+        if not data:
+            self._send_error_json(400, "Empty upload.")
+            return
+
+        name = query.get("name", ["upload"])[0]
+        job = self._submit(JOB_SCREENSHOT_OCR, lambda: self.service.ocr_screenshot_bytes(data, name),
+                           {"name": name, "bytes": len(data)})
+        if job:
+            self._send_job(job, query)
+
+    def _post_report(self, query: dict, default_wait: float = 0.0) -> None:
+        try:
+            sources = _parse_report_sources(query.get("sources", [None])[0])
+        except ValueError as e:
+            self._send_error_json(400, str(e))
+            return
+        job = self._submit(JOB_REPORT, lambda: self.service.run_report(sources),
+                           {"sources": [name for name, used in sources.items() if used]})
+        if job:
+            self._send_job(job, query, default_wait)
+
+    def log_message(self, format, *args):
+        log(f"[service] {self.address_string()} {format % args}", LogLevel.DEBUG)
+
+
+# ----- Main Functions ----- #
+def serve(host: Optional[str] = None, port: Optional[int] = None, workers: Optional[int] = None,
+          ready: Optional[Callable[[ThreadingHTTPServer], None]] = None) -> None:
+    """
+    Run the local attendance service until interrupted.
+
+    Args:
+        host (str, optional): Bind address. Defaults to `settings.service.host`.
+        port (int, optional): Port. Defaults to `settings.service.port`.
+        workers (int, optional): Worker threads. Defaults to `settings.service.workers`.
+        ready (Callable, optional): Called with the bound server before serving (e.g. to stop it).
+    """
+    config = settings.service
+    service = AttendanceService(workers or config.workers, config.max_queue, config.job_retention)
+    service.start()
+
+    handler = type("ServiceHandler", (_ServiceHandler,), {"service": service})
+    server = ThreadingHTTPServer((host or config.host, int(port or config.port)), handler)
+    server.daemon_threads = True
+    log(f"Attendance service listening on http://{server.server_address[0]}:{server.server_address[1]} "
+        f"with {service.workers} workers.")
+    if ready:
+        ready(server)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        service.stop()
+        log("Attendance service stopped.")
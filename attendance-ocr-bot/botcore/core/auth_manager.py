@@ -4,20 +4,22 @@
 # Do not distribute or modify
 # Author: DragonTaki (https://github.com/DragonTaki)
 # Create Date: 2025/04/27
-# Update Date: 2025/04/27
-# Version: v1.0
+# Update Date: 2026/10/19
+# Version: v1.1
 # ----- ----- ----- -----
 
 import base64
 import json
 import hashlib
 import os
+import threading
 from typing import Any, Dict, Literal, Optional
 
 from botcore.config.constant import TEXTFILE_ENCODING
 from botcore.config.settings_manager import get_settings
 settings = get_settings()
 from botcore.utils.network_utils import safe_web_fetch
+from .auth_session import clear_session_ticket, load_session_ticket, save_session_ticket
 
 # Constants
 AUTH_FILENAME = "auth.json"
@@ -174,6 +176,29 @@ def _validate_user(username: str, key: str, api_keys: Dict[str, Any]) -> bool:
     return False
 
 
+def _revalidate_session(username: str, key: str, token: str, auth_data: Dict[str, str]) -> None:
+    """
+    Re-check a ticket-based login against GitHub. Renews the ticket on success,
+    revokes it if the user is no longer authorized, and keeps it if offline.
+
+    Args:
+        username (str): The username in 'auth.json'.
+        key (str): The user's key.
+        token (str): GitHub token.
+        auth_data (Dict[str, str]): Content of 'auth.json'.
+    """
+    api_keys = _get_keys_from_github(token)
+    if not api_keys:
+        print("Session revalidation skipped: GitHub keys unavailable (offline?).")
+        return
+
+    if _validate_user(username, key, api_keys):
+        save_session_ticket(username, auth_data)
+    else:
+        print(f"❌ User '{username}' is no longer authorized. Session ticket revoked.")
+        clear_session_ticket()
+
+
 # ----- Main Function ----- #
 def auth_manager() -> Literal["success", "fail", "undefined"]:
     """
@@ -193,6 +218,15 @@ def auth_manager() -> Literal["success", "fail", "undefined"]:
     key = auth_data[AuthConfig.KEY_FIELD]
     token = auth_data[AuthConfig.TOKEN_FIELD]
 
+    # Fast path: a valid session ticket skips the GitHub request and key derivation
+    if load_session_ticket(username, auth_data):
+        print(f"✅ User '{username}' is authorized (session ticket).")
+        settings.current_user = username
+        threading.Thread(
+            target=_revalidate_session, args=(username, key, token, auth_data), name="auth-revalidate", daemon=True
+        ).start()
+        return "success"
+
     api_keys = _get_keys_from_github(token)
     if not api_keys:
         return "undefined"
@@ -200,9 +234,11 @@ def auth_manager() -> Literal["success", "fail", "undefined"]:
     if _validate_user(username, key, api_keys):
         print(f"✅ User '{username}' is authorized.")
         settings.current_user = username
+        save_session_ticket(username, auth_data)
         return "success"
     else:
         print(f"❌ User '{username}' is not authorized.")
+        clear_session_ticket()
         return "fail"
 
 
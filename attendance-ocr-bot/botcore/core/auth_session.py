@@ -0,0 +1,140 @@
+# ----- ----- ----- -----
+# auth_session.py
+# For Albion Online "Griffin Empire" Guild only
+# Do not distribute or modify
+# Author: DragonTaki (https://github.com/DragonTaki)
+# Create Date: 2026/10/19
+# Update Date: 2026/10/19
+# Version: v1.0
+# ----- ----- ----- -----
+
+import hashlib
+import json
+import os
+import time
+from typing import Dict, Optional
+
+from cryptography.fernet import Fernet, InvalidToken
+
+from botcore.config.constant import TEXTFILE_ENCODING
+from generate_key import KEY_FILE, generate_random_key
+
+# Constants
+SESSION_FILENAME = "session.ticket"
+SESSION_VALIDITY_HOURS = 72
+
+
+# ----- Helper Functions ----- #
+def _get_session_cipher(key_path: str = KEY_FILE) -> Optional[Fernet]:
+    """
+    Load the local Fernet key, generating it on first use.
+
+    Args:
+        key_path (str): Path to the key file created by `generate_key.py`.
+
+    Returns:
+        Optional[Fernet]: The cipher, or None if the key cannot be loaded or created.
+    """
+    try:
+        if not os.path.exists(key_path) or os.path.getsize(key_path) == 0:
+            tmp_path = key_path + ".tmp"
+            with open(tmp_path, "wb") as key_file:
+                key_file.write(generate_random_key())
+            os.replace(tmp_path, key_path)
+
+        with open(key_path, "rb") as key_file:
+            return Fernet(key_file.read().strip())
+    except Exception as e:
+        print(f"Warning: Session key unavailable: {e}")
+        return None
+
+
+def get_credentials_fingerprint(auth_data: Dict[str, str]) -> str:
+    """
+    Fingerprint the local credentials, so a ticket is dropped as soon as 'auth.json' changes.
+
+    Args:
+        auth_data (Dict[str, str]): Content of 'auth.json'.
+
+    Returns:
+        str: Hexadecimal SHA-256 of the credentials.
+    """
+    serialized = json.dumps(auth_data, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(serialized.encode(TEXTFILE_ENCODING)).hexdigest()
+
+
+# ----- Main Functions ----- #
+def load_session_ticket(username: str, auth_data: Dict[str, str], file_path: str = SESSION_FILENAME) -> bool:
+    """
+    Check whether a valid session ticket exists for the given credentials.
+
+    Args:
+        username (str): The username in 'auth.json'.
+        auth_data (Dict[str, str]): Content of 'auth.json'.
+        file_path (str): Path to the ticket file.
+
+    Returns:
+        bool: True if the ticket is authentic, unexpired and issued for these credentials.
+    """
+    if not os.path.exists(file_path):
+        return False
+
+    cipher = _get_session_cipher()
+    if not cipher:
+        return False
+
+    try:
+        with open(file_path, "rb") as file:
+            ticket = json.loads(cipher.decrypt(file.read()).decode(TEXTFILE_ENCODING))
+    except (InvalidToken, OSError, ValueError) as e:
+        print(f"Warning: Ignoring invalid session ticket: {e or 'signature mismatch'}")
+        return False
+
+    return (
+        ticket.get("username") == username
+        and ticket.get("fingerprint") == get_credentials_fingerprint(auth_data)
+        and time.time() < ticket.get("expires_at", 0)
+    )
+
+
+def save_session_ticket(username: str, auth_data: Dict[str, str], file_path: str = SESSION_FILENAME) -> None:
+    """
+    Store an encrypted, signed session ticket after a successful online validation.
+
+    Args:
+        username (str): The validated username.
+        auth_data (Dict[str, str]): Content of 'auth.json'.
+        file_path (str): Path to the ticket file.
+    """
+    cipher = _get_session_cipher()
+    if not cipher:
+        return
+
+    now = time.time()
+    ticket = {
+        "username": username,
+        "fingerprint": get_credentials_fingerprint(auth_data),
+        "issued_at": now,
+        "expires_at": now + SESSION_VALIDITY_HOURS * 3600,
+    }
+    try:
+        tmp_path = file_path + ".tmp"
+        with open(tmp_path, "wb") as file:
+            file.write(cipher.encrypt(json.dumps(ticket).encode(TEXTFILE_ENCODING)))
+        os.replace(tmp_path, file_path)
+    except Exception as e:
+        print(f"Warning: Failed to save session ticket: {e}")
+
+
+def clear_session_ticket(file_path: str = SESSION_FILENAME) -> None:
+    """
+    Remove the session ticket, forcing a full online validation on next launch.
+
+    Args:
+        file_path (str): Path to the ticket file.
+    """
+    try:
+        if os.path.exists(file_path):
+            os.remove(file_path)
+    except Exception as e:
+        print(f"Warning: Failed to remove session ticket: {e}")
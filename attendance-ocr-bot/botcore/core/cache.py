@@ -4,8 +4,8 @@
 # Do not distribute or modify
 # Author: DragonTaki (https://github.com/DragonTaki)
 # Create Date: 2025/04/18
-# Update Date: 2025/04/26
-# Version: v1.6
+# Update Date: 2026/10/19
+# Version: v1.7
 # ----- ----- ----- -----
 
 import os
@@ -17,6 +17,7 @@ from botcore.config.constant import CacheType, EXTENSIONS
 from botcore.config.settings_manager import get_settings
 settings = get_settings()
 from botcore.logging.app_logger import LogLevel, log
+from botcore.utils.metrics import counter
 from botcore.utils.file_utils import (
     generate_cache_filename,
     get_cache_file_path,
@@ -30,6 +31,9 @@ MAX_CACHE_VERSIONS = 1
 
 CACHE_TYPES = list(CacheType)
 
+# Metrics
+CACHE_LOOKUPS = counter("cache_lookups_total", "Data cache lookups by cache type and result.", ("type", "result"))
+
 
 # ----- Helper Functions ----- #
 def _is_valid_cache_structure(data: dict) -> bool:
@@ -181,13 +185,55 @@ def load_from_cache(cache_type: CacheType) -> Any:
             _remove_file_safely(full_path, f"exception while loading: {e}")
 
     if latest_valid:
+        CACHE_LOOKUPS.inc(type=cache_type.value, result="hit")
         relative_path = get_relative_path_to_target(latest_file)
         log(f"Loaded valid cache from '{relative_path}'.")
         return latest_valid["json_data"]
 
+    CACHE_LOOKUPS.inc(type=cache_type.value, result="miss")
     return None
 
 
+def get_cache_saved_at(cache_type: CacheType) -> datetime | None:
+    """
+    Save time of the newest cache file of a type, from its modification time, without loading it.
+
+    Args:
+        cache_type (CacheType): CacheType enum member.
+
+    Returns:
+        datetime | None: UTC save time, or None if there is no cache file.
+    """
+    cache_folder = os.path.abspath(settings.folder_paths.cache)
+    if not os.path.isdir(cache_folder):
+        return None
+
+    cache_prefix = f"{cache_type.value}_"
+    newest = None
+    for fname in os.listdir(cache_folder):
+        if not (fname.startswith(cache_prefix) and fname.endswith(EXTENSIONS.cache)):
+            continue
+        try:
+            full_path = os.path.join(cache_folder, fname)
+            if os.path.getsize(full_path) == 0:
+                continue
+            mtime = os.path.getmtime(full_path)
+        except OSError:
+            continue  # Removed while listing
+        newest = mtime if newest is None else max(newest, mtime)
+
+    return datetime.fromtimestamp(newest, timezone.utc) if newest is not None else None
+
+
+def get_cache_expiry(cache_type: CacheType) -> datetime | None:
+    """
+    Returns:
+        datetime | None: UTC time the newest cache of a type expires, or None if there is none.
+    """
+    saved_at = get_cache_saved_at(cache_type)
+    return saved_at + timedelta(hours=CACHE_EXPIRY_HOURS) if saved_at else None
+
+
 def save_to_cache_if_needed(cache_type: CacheType, data: Any, if_save: bool, saved_item_name: str = "") -> None:
     """
     Save cache data only if the if_save flag is True and data is not empty.
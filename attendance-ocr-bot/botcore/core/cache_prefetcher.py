@@ -0,0 +1,203 @@
+# ----- ----- ----- -----
+# cache_prefetcher.py
+# For Albion Online "Griffin Empire" Guild only
+# Do not distribute or modify
+# Author: DragonTaki (https://github.com/DragonTaki)
+# Create Date: 2026/10/19
+# Update Date: 2026/10/19
+# Version: v1.0
+# ----- ----- ----- -----
+
+import random
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional
+
+from botcore.config.constant import CacheType
+from botcore.config.settings_manager import get_settings
+settings = get_settings()
+from botcore.logging.app_logger import LogLevel, log
+from botcore.utils.job_scheduler import JOB_KILLBOARD, JOB_MEMBERS, JobScheduler, get_job_scheduler
+from .cache import CACHE_EXPIRY_HOURS, get_cache_saved_at
+from .fetch_guild_members import fetch_guild_members
+from .fetch_killboard_attendance import fetch_killboard_attendance
+
+# ----- Constants ----- #
+PREFETCH_POLL_MAX_SEC = 300  # Re-check at least this often, e.g. after the cache was cleared
+
+
+class PrefetchTarget:
+    """
+    A cache kept warm, and the scheduler job that refreshes it.
+    """
+
+    def __init__(self, cache_type: CacheType, job_name: str, label: str, fetch: Callable[[], object],
+                 is_used: Callable[[], bool] = lambda: True):
+        self.cache_type = cache_type
+        self.job_name = job_name
+        self.label = label
+        self.fetch = fetch
+        self.is_used = is_used
+
+
+DEFAULT_TARGETS = (
+    PrefetchTarget(CacheType.MEMBERLIST, JOB_MEMBERS, "member list", fetch_guild_members),
+    PrefetchTarget(CacheType.KILLBOARD, JOB_KILLBOARD, "killboard attendance", fetch_killboard_attendance,
+                   is_used=lambda: bool(settings.used_data.killboard)),
+)
+
+
+# ----- Helper Functions ----- #
+def _parse_daily_times(values) -> list[tuple[int, int]]:
+    times = []
+    for value in values or []:
+        try:
+            hour, minute = (int(part) for part in str(value).split(":"))
+            if 0 <= hour < 24 and 0 <= minute < 60:
+                times.append((hour, minute))
+                continue
+        except ValueError:
+            pass
+        log(f"Ignoring invalid prefetch time \"{value}\", expected \"HH:MM\".", LogLevel.WARN, max_per_sec=0.01)
+    return times
+
+
+def next_daily_time(after: datetime, daily_times: list[tuple[int, int]]) -> Optional[datetime]:
+    """
+    First local "HH:MM" slot strictly after a moment.
+
+    Args:
+        after (datetime): Timezone-aware moment.
+        daily_times (list[tuple[int, int]]): (hour, minute) slots in local time.
+
+    Returns:
+        datetime | None: The next slot in UTC, or None without slots.
+    """
+    if not daily_times:
+        return None
+    local_after = after.astimezone()
+    candidates = []
+    for day_offset in (0, 1):
+        day = local_after + timedelta(days=day_offset)
+        for hour, minute in daily_times:
+            slot = day.replace(hour=hour, minute=minute, second=0, microsecond=0)
+            if slot > local_after:
+                candidates.append(slot)
+    return min(candidates).astimezone(timezone.utc)
+
+
+# ----- Cache Prefetcher ----- #
+class CachePrefetcher:
+    """
+    Refresh caches shortly before they expire, and at optional daily times, in the background.
+
+    Refreshes go through the job scheduler under the same job names as the GUI buttons, so a
+    prefetch never runs twice alongside a user-started fetch, and reports wait for it.
+    Every refresh is delayed by a random jitter, so several bots do not hit the API together.
+    """
+
+    def __init__(self, scheduler: Optional[JobScheduler] = None, targets: tuple[PrefetchTarget, ...] = DEFAULT_TARGETS):
+        self.scheduler = scheduler or get_job_scheduler()
+        self.targets = targets
+        self._jitter: dict[CacheType, tuple[datetime, float]] = {}  # base due time -> jitter drawn for it
+        self._last_attempt: dict[CacheType, datetime] = {}
+        self._missing_since: dict[CacheType, datetime] = {}
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="cache-prefetcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+    def next_refresh_at(self, target: PrefetchTarget, now: datetime) -> Optional[datetime]:
+        """
+        When a cache should be refreshed next.
+
+        Returns:
+            datetime | None: UTC due time (may be in the past), or None if it needs no refresh.
+        """
+        config = settings.prefetch
+        saved_at = get_cache_saved_at(target.cache_type)
+        if saved_at is None:
+            if not config.refresh_missing:
+                return None
+            # Anchor to when the cache was first seen missing, so the due time stays put
+            base = self._missing_since.setdefault(target.cache_type, now)
+        else:
+            self._missing_since.pop(target.cache_type, None)
+            base = saved_at + timedelta(hours=CACHE_EXPIRY_HOURS, minutes=-float(config.lead_time_min))
+            daily = next_daily_time(saved_at, _parse_daily_times(config.daily_times))
+            if daily is not None:
+                base = min(base, daily)
+
+        # Draw the jitter once per due time, so it does not change on every check
+        drawn = self._jitter.get(target.cache_type)
+        if drawn is None or drawn[0] != base:
+            drawn = (base, random.uniform(0, max(float(config.jitter_sec), 0)))
+            self._jitter[target.cache_type] = drawn
+        due = base + timedelta(seconds=drawn[1])
+
+        last_attempt = self._last_attempt.get(target.cache_type)
+        if last_attempt is not None:
+            due = max(due, last_attempt + timedelta(minutes=float(config.retry_after_min)))
+        return due
+
+    def _refresh(self, target: PrefetchTarget) -> None:
+        def task():
+            log(f"Refreshing {target.label} cache in the background...")
+            target.fetch()
+
+        self._last_attempt[target.cache_type] = datetime.now(timezone.utc)
+        self.scheduler.submit(target.job_name, task, f"Prefetch {target.label}")
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            wait_sec = PREFETCH_POLL_MAX_SEC
+            if settings.prefetch.enabled:
+                now = datetime.now(timezone.utc)
+                for target in self.targets:
+                    if not target.is_used():
+                        continue
+                    try:
+                        due = self.next_refresh_at(target, now)
+                        if due is None:
+                            continue
+                        if due <= now:
+                            self._refresh(target)
+                            continue
+                        wait_sec = min(wait_sec, (due - now).total_seconds())
+                    except Exception as e:
+                        log(f"Prefetch check of {target.label} failed: {e}", LogLevel.WARN, max_per_sec=0.01)
+            self._stop_event.wait(max(wait_sec, 1.0))
+
+
+# ----- Main Functions ----- #
+_prefetcher: Optional[CachePrefetcher] = None
+_prefetcher_lock = threading.Lock()
+
+def start_cache_prefetcher() -> Optional[CachePrefetcher]:
+    """
+    Start keeping the member list (and killboard, if used) caches warm.
+
+    Returns:
+        CachePrefetcher | None: The running prefetcher, or None if prefetching is disabled.
+    """
+    global _prefetcher
+    if not settings.prefetch.enabled:
+        return None
+    with _prefetcher_lock:
+        if _prefetcher is None:
+            _prefetcher = CachePrefetcher()
+            _prefetcher.start()
+    return _prefetcher
+
+
+def stop_cache_prefetcher() -> None:
+    global _prefetcher
+    with _prefetcher_lock:
+        if _prefetcher is not None:
+            _prefetcher.stop()
+            _prefetcher = None
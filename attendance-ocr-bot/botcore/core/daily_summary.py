@@ -4,14 +4,15 @@
 # Do not distribute or modify
 # Author: DragonTaki (https://github.com/DragonTaki)
 # Create Date: 2025/04/23
-# Update Date: 2025/04/26
-# Version: v2.0
+# Update Date: 2026/10/19
+# Version: v2.1
 # ----- ----- ----- -----
 
 import json
 import os
 from datetime import datetime, timedelta
 from types import SimpleNamespace
+from typing import Iterable, Optional
 from collections import Counter
 
 from botcore.config.constant import CacheType, EXTENSIONS, DATETIME_FORMATS, INTERVALS, DAYS_LOOKBACK, TEXTFILE_ENCODING
@@ -19,7 +20,9 @@ from botcore.config.settings_manager import get_settings
 settings = get_settings()
 from botcore.logging.app_logger import LogLevel, log
 from .process_textfile import parse_txt_file
-from .process_screenshot import parse_screenshot_file, get_valid_player_list, create_word_list_file
+from .process_screenshot import SCREENSHOT_IMAGE_RESULTS_FILENAME, SCREENSHOT_PROFILE_FILENAME, parse_screenshot_file, get_valid_player_list, create_word_list_file
+from botcore.utils.job_scheduler import check_cancelled
+from botcore.utils.metrics import counter
 from botcore.utils.file_utils import ensure_folder_exists, get_file_checksum, get_path, get_relative_path_to_target, is_valid_folder_name, list_dirs_sorted_by_date
 
 
@@ -35,10 +38,15 @@ DAILY_SUMMARY = SimpleNamespace(
     SCREENSHOT=SimpleNamespace(
         META=FILENAME_TEMPLATE.format(prefix="screenshot_", name="meta", ext=".meta"),
         SUMMARY=FILENAME_TEMPLATE.format(prefix="screenshot_", name="summary", ext=".json"),
+        IMAGES=SCREENSHOT_IMAGE_RESULTS_FILENAME,
+        PROFILE=SCREENSHOT_PROFILE_FILENAME,
         cache_type=CacheType.SCREENSHOT
     )
 )
 
+# Metrics
+DAILY_SUMMARIES = counter("daily_summaries_total", "Daily summaries rebuilt from raw data or reused from disk.", ("type", "result"))
+
 
 # ----- Helper Functions ----- #
 def _get_summary_file_paths(folder_input: str, summary_type: SimpleNamespace) -> tuple[str, str]:
@@ -181,7 +189,7 @@ def save_daily_summary(summary_type: SimpleNamespace, folder_name: str, attendan
     return attendance_list
 
 
-def collect_all_daily_attendance(summary_type: SimpleNamespace) -> dict[str, list[dict]]:
+def collect_all_daily_attendance(summary_type: SimpleNamespace, folder_names: Optional[Iterable[str]] = None) -> dict[str, list[dict]]:
     """
     Automatically collect all daily attendance data.
 
@@ -192,6 +200,8 @@ def collect_all_daily_attendance(summary_type: SimpleNamespace) -> dict[str, lis
 
     Args:
         summary_type (SimpleNamespace): Type of summary (either textfile or screenshot).
+        folder_names (Iterable[str], optional): Only verify and rebuild these day folders; the saved
+            summaries of the other days are loaded as they are. Defaults to all folders.
 
     Returns:
         dict[str, list[dict]]: A dictionary where each key is the folder name and the corresponding value is the attendance summary list.
@@ -208,15 +218,25 @@ def collect_all_daily_attendance(summary_type: SimpleNamespace) -> dict[str, lis
     elif summary_type not in vars(DAILY_SUMMARY).values():
         raise ValueError(f"Unsupported summary type: {summary_type}")
 
+    only_folders = set(folder_names) if folder_names is not None else None
+
     # Iterate over all folders in the attendance directory
     ensure_folder_exists(settings.folder_paths.attendance)
     for folder_name in os.listdir(settings.folder_paths.attendance):
+        check_cancelled()
         folder_path = os.path.join(settings.folder_paths.attendance, folder_name)
 
         # Skip if the folder is invalid or does not contain the correct name format
         if not os.path.isdir(folder_path) or not is_valid_folder_name(folder_name):
             continue
 
+        # Days outside an incremental update keep their saved summary
+        if only_folders is not None and folder_name not in only_folders:
+            summary, _ = load_daily_summary(summary_type, folder_name)
+            if summary:
+                result_by_day[folder_name] = summary
+            continue
+
         # Determine if the summary needs to be re-parsed or is outdated
         needs_reparse = settings.force_regenerate_daily_summary or not _check_summary_valid(summary_type, folder_path)
 
@@ -257,12 +277,14 @@ def collect_all_daily_attendance(summary_type: SimpleNamespace) -> dict[str, lis
 
             # Save the newly parsed summary and metadata
             save_daily_summary(summary_type, folder_name, summary_data, meta)
+            DAILY_SUMMARIES.inc(type=_get_summary_type_name(summary_type), result="rebuilt")
             result_by_day[folder_name] = summary_data  # Add the parsed data to the result dictionary
 
         else:
             # If the summary is valid, load it from the disk
             summary, _ = load_daily_summary(summary_type, folder_name)
             if summary:
+                DAILY_SUMMARIES.inc(type=_get_summary_type_name(summary_type), result="reused")
                 result_by_day[folder_name] = summary
 
     return result_by_day
@@ -333,7 +355,8 @@ def cleanup_old_daily_summary_files(keep_count: int) -> int:
         summary_files = [
             f for f in os.listdir(folder_path)
             if f.endswith(DAILY_SUMMARY.TEXTFILE.SUMMARY) or f.endswith(DAILY_SUMMARY.TEXTFILE.META) or
-               f.endswith(DAILY_SUMMARY.SCREENSHOT.SUMMARY) or f.endswith(DAILY_SUMMARY.SCREENSHOT.META)
+               f.endswith(DAILY_SUMMARY.SCREENSHOT.SUMMARY) or f.endswith(DAILY_SUMMARY.SCREENSHOT.META) or
+               f.endswith(DAILY_SUMMARY.SCREENSHOT.IMAGES) or f.endswith(DAILY_SUMMARY.SCREENSHOT.PROFILE)
         ]
 
         # Sort files by their modification time, keeping the latest `keep_count`
@@ -356,7 +379,7 @@ def cleanup_old_daily_summary_files(keep_count: int) -> int:
 
 def clear_all_daily_summary_files() -> int:
     """
-    Delete all summary and meta files in attendance folders.
+    Delete all summary, meta, per-image result and profile files in attendance folders.
 
     This function deletes every summary and meta file in the attendance folders.
 
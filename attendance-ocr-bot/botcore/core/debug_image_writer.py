@@ -0,0 +1,200 @@
+# ----- ----- ----- -----
+# debug_image_writer.py
+# For Albion Online "Griffin Empire" Guild only
+# Do not distribute or modify
+# Author: DragonTaki (https://github.com/DragonTaki)
+# Create Date: 2026/10/19
+# Update Date: 2026/10/19
+# Version: v1.0
+# ----- ----- ----- -----
+
+import os
+import queue
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from botcore.config.constant import EXTENSIONS
+from botcore.config.settings_manager import get_settings
+settings = get_settings()
+from botcore.logging.app_logger import LogLevel, log
+
+# ----- Constants ----- #
+DEBUG_IMAGE_EXTENSION = ".png"
+
+
+# ----- Helper Functions ----- #
+def _strip_image_extension(filename: str) -> str:
+    base_name, ext = os.path.splitext(filename)
+    return base_name if ext.lower() in EXTENSIONS.image else filename
+
+
+# ----- Debug Image Writer ----- #
+class DebugImageWriter:
+    """
+    Background writer of OCR debug images.
+
+    The OCR thread only enqueues images; one writer thread PNG-encodes them with fast compression.
+    The queue is bounded and never blocks the OCR thread: when full, images are dropped and counted.
+    The debug folder is kept under a size cap by deleting the oldest images first.
+    """
+
+    def __init__(self, folder: str, max_queue: int, max_folder_bytes: int, compress_level: int):
+        """
+        Args:
+            folder (str): Debug folder.
+            max_queue (int): Maximum images waiting to be written.
+            max_folder_bytes (int): Size cap of the debug folder.
+            compress_level (int): PNG compression level (0-9, 1 is fast).
+        """
+        self.folder = folder
+        self.max_folder_bytes = max_folder_bytes
+        self.compress_level = compress_level
+        self.saved_count = 0
+        self.dropped_count = 0
+
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._files: "OrderedDict[str, int]" = OrderedDict()  # path -> size, oldest first
+        self._folder_bytes = 0
+        self._thread = threading.Thread(target=self._run, name="debug-image-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, images, original_filename: str, prefix: str, subfolder: Optional[str] = None) -> None:
+        """
+        Queue one or more images for saving as "<name>_<prefix>_<idx>.png".
+
+        Args:
+            images: A single PIL.Image or an iterable of PIL.Images.
+            original_filename (str): Source screenshot name.
+            prefix (str): Filename prefix to identify image purpose, e.g., 's0_enlarged'.
+            subfolder (str, optional): Subfolder under the debug folder.
+        """
+        if hasattr(images, "save"):
+            images = [images]
+
+        name_without_ext = _strip_image_extension(original_filename)
+        folder_path = os.path.join(self.folder, subfolder) if subfolder else self.folder
+        for idx, img in enumerate(images):
+            if not hasattr(img, "save"):
+                continue  # skip if not an image
+            path = os.path.join(folder_path, f"{name_without_ext}_{prefix}_{idx}{DEBUG_IMAGE_EXTENSION}")
+            try:
+                self._queue.put_nowait((img, path))
+            except queue.Full:
+                self.dropped_count += 1
+
+    def join(self) -> None:
+        """
+        Wait until all queued images are written.
+        """
+        self._queue.join()
+
+    def _index_existing_files(self) -> None:
+        """
+        Register images left from previous runs, so they count toward the cap and are evicted first.
+        """
+        existing = []
+        for root, _, files in os.walk(self.folder):
+            for file in files:
+                if file.lower().endswith(EXTENSIONS.image):
+                    path = os.path.join(root, file)
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue
+                    existing.append((stat.st_mtime, path, stat.st_size))
+
+        for _, path, size in sorted(existing):
+            self._track_file(path, size)
+
+    def _track_file(self, path: str, size: int) -> None:
+        """
+        Register a written image as the newest one. Rewriting a path (e.g. OCR of the same day again)
+        replaces its old entry instead of adding a second one.
+        """
+        self._folder_bytes += size - self._files.pop(path, 0)
+        self._files[path] = size
+
+    def _evict_oldest(self) -> None:
+        while self._folder_bytes > self.max_folder_bytes and self._files:
+            path, size = self._files.popitem(last=False)
+            self._folder_bytes -= size
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                log(f"Failed to delete debug image \"{path}\": {e}.", LogLevel.ERROR)
+                continue
+
+            # Remove the subfolder once empty
+            parent = os.path.dirname(path)
+            if os.path.abspath(parent) != os.path.abspath(self.folder):
+                try:
+                    os.rmdir(parent)
+                except OSError:
+                    pass
+
+    def _run(self) -> None:
+        self._index_existing_files()
+        self._evict_oldest()
+
+        while True:
+            img, path = self._queue.get()
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                img.save(path, compress_level=self.compress_level)
+                size = os.path.getsize(path)
+                self._track_file(path, size)
+                self.saved_count += 1
+                self._evict_oldest()
+            except Exception as e:
+                log(f"Failed to save image \"{os.path.basename(path)}\": {e}", LogLevel.ERROR)
+            finally:
+                self._queue.task_done()
+
+
+# ----- Main Functions ----- #
+_writer_instance: Optional[DebugImageWriter] = None
+_writer_lock = threading.Lock()
+
+def get_debug_image_writer() -> DebugImageWriter:
+    """
+    Get the shared debug image writer configured from `settings.debug_images`.
+
+    Returns:
+        DebugImageWriter: The shared writer instance.
+    """
+    global _writer_instance
+    if _writer_instance is None:
+        with _writer_lock:
+            if _writer_instance is None:
+                config = settings.debug_images
+                _writer_instance = DebugImageWriter(
+                    folder=settings.folder_paths.debug,
+                    max_queue=config.max_queue,
+                    max_folder_bytes=int(config.max_folder_mb * 1024 * 1024),
+                    compress_level=config.png_compress_level,
+                )
+    return _writer_instance
+
+
+def is_debug_image_enabled() -> bool:
+    """
+    Returns:
+        bool: True if debug images should be produced at all.
+    """
+    return settings.enable_debug_mode and settings.debug_images.enabled
+
+
+def should_save_debug_image(image_index: int) -> bool:
+    """
+    Apply image sampling: only every n-th screenshot of a folder gets debug images.
+
+    Args:
+        image_index (int): 0-based index of the screenshot in its folder.
+
+    Returns:
+        bool: True if debug images of this screenshot should be saved.
+    """
+    return is_debug_image_enabled() and image_index % max(settings.debug_images.sample_every_n_images, 1) == 0
@@ -4,11 +4,12 @@
 # Do not distribute or modify
 # Author: DragonTaki (https://github.com/DragonTaki)
 # Create Date: 2025/04/22
-# Update Date: 2025/04/26
-# Version: v1.3
+# Update Date: 2026/10/19
+# Version: v1.4
 # ----- ----- ----- -----
 
 from types import SimpleNamespace
+from typing import Iterable, Optional
 
 from botcore.logging.app_logger import LogLevel, log
 from .cache import save_to_cache_if_needed
@@ -18,7 +19,8 @@ from .daily_summary import collect_all_daily_attendance, calculate_interval_summ
 # ----- Main Function ----- #
 def fetch_daily_attendance(
     data_type: SimpleNamespace,
-    if_save_to_cache: bool = True
+    if_save_to_cache: bool = True,
+    folder_names: Optional[Iterable[str]] = None
 ) -> dict:
     """
     Process daily attendance records for a given data source (textfiles or screenshots),
@@ -27,6 +29,8 @@ def fetch_daily_attendance(
     Args:
         data_type (SimpleNamespace): One of the entries from DAILY_SUMMARY (e.g., DAILY_SUMMARY.TEXTFILE).
         if_save_to_cache (bool, optional): Whether to persist the interval summary to the cache. Default is True.
+        folder_names (Iterable[str], optional): Only rebuild these day folders, e.g. the ones with new files.
+            Defaults to all folders.
 
     Returns:
         dict: A dictionary with keys like "7d", "14d", "28d", each mapping to
@@ -35,7 +39,7 @@ def fetch_daily_attendance(
 
     cache_type = data_type.cache_type # Mapping back to cache_type
 
-    result_by_day = collect_all_daily_attendance(data_type)
+    result_by_day = collect_all_daily_attendance(data_type, folder_names)
     summary_by_interval = calculate_interval_summary(data_type, result_by_day)
 
     if summary_by_interval:
@@ -4,44 +4,58 @@
 # Do not distribute or modify
 # Author: DragonTaki (https://github.com/DragonTaki)
 # Create Date: 2025/04/18
-# Update Date: 2025/05/01
-# Version: v1.3
+# Update Date: 2026/10/19
+# Version: v1.4
 # ----- ----- ----- -----
 
 from botcore.config.constant import CacheType
 from botcore.config.static_settings import GUILD_INFO_LIST
 from botcore.logging.app_logger import LogLevel, log
 from .cache import save_to_cache_if_needed
-from botcore.utils.network_utils import safe_web_fetch
+from botcore.utils.network_utils import MAX_FETCH_WORKERS, fetch_concurrently, log_throttle_metrics, safe_web_stream
 
 
 # ----- Constants ----- #
 API_BASE_URL = "https://gameinfo-sgp.albiononline.com/api/gameinfo"
 API_ENDPOINT_TEMPLATE = f"{API_BASE_URL}/guilds/{{guild_id}}/members"
 HEADERS = {"Accept": "application/json, text/plain, */*"}
+MEMBER_FIELDS = ("Name",)  # The only field we use out of the full player records
 
 
 # ----- Main Function ----- #
-def fetch_guild_members(if_save_to_cache: bool = True) -> dict[str, str]:
+def fetch_guild_members(if_save_to_cache: bool = True, max_workers: int = MAX_FETCH_WORKERS) -> dict[str, str]:
     """
     Fetch member lists from the API for all configured guilds.
 
+    Guilds are fetched concurrently and merged in configuration order.
+
     Args:
         if_save_to_cache (bool): Whether to store the fetched member map in cache.
+        max_workers (int): Maximum number of concurrent requests. 1 fetches serially.
 
     Returns:
         dict[str, str]: A mapping from player names to their respective guild names.
     """
     result_map = {}
 
-    for guild in GUILD_INFO_LIST:
+    def fetch_one(guild: dict):
         guild_name = guild.get("name")
-        guild_id = guild.get("id")
-        url = API_ENDPOINT_TEMPLATE.format(guild_id=guild_id)
+        url = API_ENDPOINT_TEMPLATE.format(guild_id=guild.get("id"))
 
         log(f"Fetching members for guild: {guild_name}...")
+        records = safe_web_stream(url, fields=MEMBER_FIELDS, headers=HEADERS, context=f"{guild_name} members", use_cache=True)
+        if records is None:
+            return None
+        try:
+            return list(records)
+        except ValueError as e:
+            log(f"Malformed member list of {guild_name}: {e}", LogLevel.ERROR)
+            return None
+
+    results = fetch_concurrently(fetch_one, GUILD_INFO_LIST, max_workers=max_workers)
 
-        data = safe_web_fetch(url, headers=HEADERS, context=f"{guild_name} members")
+    for guild, data in zip(GUILD_INFO_LIST, results):
+        guild_name = guild.get("name")
         if not data:
             log(f"No data returned from API for {guild_name}.", LogLevel.ERROR)
             continue
@@ -53,5 +67,6 @@ def fetch_guild_members(if_save_to_cache: bool = True) -> dict[str, str]:
 
         log(f"Successfully fetched {len(data)} members from {guild_name}.")
 
+    log_throttle_metrics()
     save_to_cache_if_needed(CacheType.MEMBERLIST, result_map, if_save_to_cache, "Member list")
     return result_map
@@ -4,50 +4,75 @@
 # Do not distribute or modify
 # Author: DragonTaki (https://github.com/DragonTaki)
 # Create Date: 2025/04/18
-# Update Date: 2025/05/01
-# Version: v1.3
+# Update Date: 2026/10/19
+# Version: v1.4
 # ----- ----- ----- -----
 
-import requests
-
 from botcore.config.constant import CacheType, INTERVALS
+from botcore.config.settings_manager import get_settings
+settings = get_settings()
 from botcore.config.static_settings import GUILD_INFO_LIST
 from botcore.logging.app_logger import LogLevel, log
 from .cache import save_to_cache_if_needed
-from botcore.utils.network_utils import safe_web_fetch
+from .fetch_killboard_battles import MIN_GP, fetch_killboard_battle_attendance
+from botcore.utils.network_utils import MAX_FETCH_WORKERS, fetch_concurrently, log_throttle_metrics, safe_web_stream
 
 
 # ----- Constants ----- #
 API_BASE_URL = "https://api-east.albionbattles.com/player"
-MIN_GP = 50
 API_ENDPOINT_TEMPLATE = f"{API_BASE_URL}?guildSearch={{guild_name}}&interval={{interval}}&minGP={MIN_GP}"
 HEADERS = {"Accept": "application/json, text/plain, */*"}
+PLAYER_FIELDS = ("name", "battleNumber")
+KILLBOARD_MODE_BATTLES = "battles"
 
 
 # ----- Main Function ----- #
-def fetch_killboard_attendance(if_save_to_cache: bool = True) -> dict:
+def fetch_killboard_attendance(if_save_to_cache: bool = True, max_workers: int = MAX_FETCH_WORKERS) -> dict:
     """
     Fetch attendance data from killboard API for all configured guilds over defined intervals.
 
+    All (interval, guild) requests are sent concurrently and merged in configuration order.
+    If `settings.killboard_mode` is "battles", battles are ingested incrementally instead.
+
     Args:
         if_save_to_cache (bool): Whether to store the fetched data in cache.
+        max_workers (int): Maximum number of concurrent requests. 1 fetches serially.
 
     Returns:
         dict: Nested dictionary where keys are interval days, and values are maps of player names to kill counts.
     """
+    if settings.killboard_mode == KILLBOARD_MODE_BATTLES:
+        return fetch_killboard_battle_attendance(if_save_to_cache, max_workers)
+
     fetched_data = {interval: {} for interval in INTERVALS}
-    for interval in INTERVALS:
-        for guild in GUILD_INFO_LIST:
-            guild_name = guild.get("name")
-            url = API_ENDPOINT_TEMPLATE.format(guild_name=guild_name, interval=interval)
-
-            data = safe_web_fetch(url, headers=HEADERS, context=f"{guild_name} at {interval}d")
-            if isinstance(data, list):
-                for player in data:
-                    if "name" in player and isinstance(player.get("battleNumber"), int):
-                        name = player["name"]
-                        num = player["battleNumber"]
-                        fetched_data[interval][name] = fetched_data[interval].get(name, 0) + num
+    jobs = [
+        (interval, guild.get("name"))
+        for interval in INTERVALS
+        for guild in GUILD_INFO_LIST
+    ]
+
+    def fetch_one(job: tuple[int, str]):
+        interval, guild_name = job
+        url = API_ENDPOINT_TEMPLATE.format(guild_name=guild_name, interval=interval)
+        records = safe_web_stream(url, fields=PLAYER_FIELDS, headers=HEADERS, context=f"{guild_name} at {interval}d", use_cache=True)
+        if records is None:
+            return None
+        try:
+            return list(records)
+        except ValueError as e:
+            log(f"Malformed killboard data of {guild_name} at {interval}d: {e}", LogLevel.ERROR)
+            return None
+
+    results = fetch_concurrently(fetch_one, jobs, max_workers=max_workers)
+
+    for (interval, guild_name), data in zip(jobs, results):
+        if isinstance(data, list):
+            for player in data:
+                if player.get("name") and isinstance(player.get("battleNumber"), int):
+                    name = player["name"]
+                    num = player["battleNumber"]
+                    fetched_data[interval][name] = fetched_data[interval].get(name, 0) + num
 
+    log_throttle_metrics()
     save_to_cache_if_needed(CacheType.KILLBOARD, fetched_data, if_save_to_cache, "Killboard attendance")
     return fetched_data
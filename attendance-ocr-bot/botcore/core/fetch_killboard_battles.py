@@ -0,0 +1,285 @@
+# ----- ----- ----- -----
+# fetch_killboard_battles.py
+# For Albion Online "Griffin Empire" Guild only
+# Do not distribute or modify
+# Author: DragonTaki (https://github.com/DragonTaki)
+# Create Date: 2026/10/19
+# Update Date: 2026/10/19
+# Version: v1.0
+# ----- ----- ----- -----
+
+import json
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from urllib.parse import quote
+
+from botcore.config.constant import CacheType, INTERVALS, DAYS_LOOKBACK, TEXTFILE_ENCODING
+from botcore.config.settings_manager import get_settings
+settings = get_settings()
+from botcore.config.static_settings import GUILD_INFO_LIST
+from botcore.logging.app_logger import LogLevel, log
+from .cache import save_to_cache_if_needed
+from botcore.utils.file_utils import get_cache_file_path
+from botcore.utils.network_utils import MAX_FETCH_WORKERS, fetch_concurrently, log_throttle_metrics, safe_web_fetch
+
+
+# ----- Constants ----- #
+API_BASE_URL = "https://api-east.albionbattles.com"
+BATTLE_LIST_TEMPLATE = f"{API_BASE_URL}/battles?offset={{offset}}&limit={{limit}}&sort=recent&search={{guild_name}}"
+BATTLE_DETAIL_TEMPLATE = f"{API_BASE_URL}/battles/{{battle_id}}"
+HEADERS = {"Accept": "application/json, text/plain, */*"}
+
+BATTLE_PAGE_SIZE = 50
+MAX_BATTLE_PAGES = 20  # Safety bound per guild and refresh
+
+BATTLE_STORE_FILENAME = "killboard_battles.json"
+BATTLE_STORE_VERSION = 2  # v2: players filtered by MIN_GP, failed battles kept for retry
+
+# A battle only counts for a guild that took part with at least this many players,
+# the same filter the aggregate mode asks the API for (minGP)
+MIN_GP = 50
+
+
+# ----- Helper Functions ----- #
+def _parse_battle_time(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parse an ISO 8601 battle timestamp (e.g. '2025-05-01T18:04:12.000Z') as UTC.
+
+    Args:
+        value (str | None): Raw timestamp.
+
+    Returns:
+        datetime | None: Aware UTC datetime, or None if invalid.
+    """
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _battle_id(battle: dict) -> Optional[str]:
+    battle_id = battle.get("albionId") or battle.get("id")
+    return str(battle_id) if battle_id is not None else None
+
+
+def _load_battle_store() -> tuple[dict, dict]:
+    """
+    Load the local store of seen battles.
+
+    Returns:
+        tuple[dict, dict]: Battle ID to {"started_at": iso str, "players": [names]},
+            and battle ID to start time (iso str) of battles whose details failed to download.
+    """
+    store_path = get_cache_file_path(BATTLE_STORE_FILENAME)
+    if not os.path.exists(store_path):
+        return {}, {}
+
+    try:
+        with open(store_path, "r", encoding=TEXTFILE_ENCODING) as f:
+            store = json.load(f)
+        if store.get("version") != BATTLE_STORE_VERSION:
+            log("Killboard battle store has an old format. Starting over.", LogLevel.WARN)
+            return {}, {}
+        return store.get("battles", {}), store.get("failed", {})
+    except Exception as e:
+        log(f"Failed to load killboard battle store: {e}. Starting over.", LogLevel.WARN)
+        return {}, {}
+
+
+def _save_battle_store(battles: dict, failed: dict) -> None:
+    """
+    Persist the local store of seen battles atomically.
+
+    Args:
+        battles (dict): Mapping of battle ID to battle record.
+        failed (dict): Mapping of battle ID to start time of battles to retry.
+    """
+    store_path = get_cache_file_path(BATTLE_STORE_FILENAME)
+    tmp_path = store_path + ".tmp"
+    try:
+        with open(tmp_path, "w", encoding=TEXTFILE_ENCODING) as f:
+            json.dump({"version": BATTLE_STORE_VERSION, "battles": battles, "failed": failed}, f, ensure_ascii=False)
+        os.replace(tmp_path, store_path)
+    except Exception as e:
+        log(f"Failed to save killboard battle store: {e}", LogLevel.ERROR)
+
+
+def _list_new_battles(guild_name: str, seen_ids: set[str], oldest: datetime) -> dict[str, datetime]:
+    """
+    Page through the recent battles of a guild until reaching known or too old battles.
+
+    Args:
+        guild_name (str): Guild to search for.
+        seen_ids (set[str]): Battle IDs already in the store.
+        oldest (datetime): Battles started before this are not needed.
+
+    Returns:
+        dict[str, datetime]: New battle IDs mapped to their start time.
+    """
+    new_battles = {}
+
+    for page in range(MAX_BATTLE_PAGES):
+        url = BATTLE_LIST_TEMPLATE.format(
+            offset=page * BATTLE_PAGE_SIZE, limit=BATTLE_PAGE_SIZE, guild_name=quote(guild_name)
+        )
+        data = safe_web_fetch(url, headers=HEADERS, context=f"{guild_name} battles (page {page + 1})")
+        if not isinstance(data, list) or not data:
+            break
+
+        reached_known = False
+        for battle in data:
+            battle_id = _battle_id(battle)
+            started_at = _parse_battle_time(battle.get("startedAt"))
+            if not battle_id or not started_at:
+                continue
+            if started_at < oldest:
+                reached_known = True
+                continue
+            if battle_id in seen_ids:
+                reached_known = True
+                continue
+            new_battles[battle_id] = started_at
+
+        # Results are sorted by most recent, everything after this page is already known
+        if reached_known or len(data) < BATTLE_PAGE_SIZE:
+            break
+
+    return new_battles
+
+
+def _extract_guild_players(detail: dict, guild_names: set[str]) -> list[str]:
+    """
+    Get the names of the players from our guilds who took part in a battle.
+
+    Guilds with fewer than MIN_GP players in the battle are left out, like `minGP` in aggregate mode.
+
+    Args:
+        detail (dict): Battle detail response.
+        guild_names (set[str]): Names of the configured guilds.
+
+    Returns:
+        list[str]: Sorted, unique player names.
+    """
+    players = detail.get("players") or []
+    if isinstance(players, dict):
+        players = players.values()
+
+    names_by_guild: dict[str, set[str]] = {}
+    for player in players:
+        if isinstance(player, dict) and player.get("name") and player.get("guildName") in guild_names:
+            names_by_guild.setdefault(player["guildName"], set()).add(player["name"])
+
+    names = set()
+    for guild_players in names_by_guild.values():
+        if len(guild_players) >= MIN_GP:
+            names |= guild_players
+    return sorted(names)
+
+
+def compute_battle_windows(battles: dict, intervals: list[int] = INTERVALS, now: Optional[datetime] = None) -> dict[int, dict[str, int]]:
+    """
+    Count battles per player over any set of day windows from the local store.
+
+    All windows are computed from the same battle set, so they are always consistent with each other.
+
+    Args:
+        battles (dict): Mapping of battle ID to {"started_at", "players"}.
+        intervals (list[int]): Window sizes in days.
+        now (datetime, optional): Reference time. Defaults to current UTC time.
+
+    Returns:
+        dict[int, dict[str, int]]: Mapping from interval to player battle counts.
+    """
+    now = now or datetime.now(timezone.utc)
+    windows = {interval: {} for interval in intervals}
+
+    for battle in battles.values():
+        started_at = _parse_battle_time(battle.get("started_at"))
+        if not started_at:
+            continue
+        age = now - started_at
+        for interval in intervals:
+            if age < timedelta(days=interval):
+                counts = windows[interval]
+                for name in battle.get("players", []):
+                    counts[name] = counts.get(name, 0) + 1
+
+    return windows
+
+
+# ----- Main Function ----- #
+def fetch_killboard_battle_attendance(if_save_to_cache: bool = True, max_workers: int = MAX_FETCH_WORKERS) -> dict:
+    """
+    Incrementally ingest battles of all configured guilds and compute attendance windows locally.
+
+    Only battles not seen before are downloaded in detail, so the refresh cost is proportional
+    to the number of new battles instead of the whole lookback history.
+
+    Args:
+        if_save_to_cache (bool): Whether to store the computed windows in cache.
+        max_workers (int): Maximum number of concurrent requests.
+
+    Returns:
+        dict: Nested dictionary where keys are interval days, and values are maps of player names to battle counts.
+    """
+    now = datetime.now(timezone.utc)
+    oldest = now - timedelta(days=DAYS_LOOKBACK)
+    guild_names = {guild.get("name") for guild in GUILD_INFO_LIST}
+
+    # Drop battles that fell out of every window
+    stored_battles, stored_failed = _load_battle_store()
+    battles = {
+        battle_id: battle
+        for battle_id, battle in stored_battles.items()
+        if (_parse_battle_time(battle.get("started_at")) or oldest) > oldest
+    }
+
+    # Step 1: List new battles of every guild
+    listed = fetch_concurrently(
+        lambda guild_name: _list_new_battles(guild_name, set(battles), oldest),
+        sorted(guild_names),
+        max_workers=max_workers,
+    )
+    new_battles = {}
+    for guild_battles in listed:
+        new_battles.update(guild_battles)
+
+    # Listing stops at the first known battle, so earlier failures are retried explicitly
+    for battle_id, started_at in stored_failed.items():
+        started_at = _parse_battle_time(started_at)
+        if started_at and started_at > oldest and battle_id not in battles:
+            new_battles.setdefault(battle_id, started_at)
+
+    # Step 2: Fetch details of new battles only
+    new_ids = sorted(new_battles)
+    details = fetch_concurrently(
+        lambda battle_id: safe_web_fetch(
+            BATTLE_DETAIL_TEMPLATE.format(battle_id=battle_id), headers=HEADERS, context=f"battle {battle_id}"
+        ),
+        new_ids,
+        max_workers=max_workers,
+    )
+
+    failed = {}
+    for battle_id, detail in zip(new_ids, details):
+        if not isinstance(detail, dict):
+            failed[battle_id] = new_battles[battle_id].isoformat()  # Retried on the next refresh
+            continue
+        battles[battle_id] = {
+            "started_at": new_battles[battle_id].isoformat(),
+            "players": _extract_guild_players(detail, guild_names),
+        }
+
+    log(f"Ingested {len(new_ids) - len(failed)} new battles ({len(failed)} failed), {len(battles)} battles in the last {DAYS_LOOKBACK} days.")
+    if failed:
+        log(f"{len(failed)} battles will be retried on the next refresh.", LogLevel.WARN)
+    _save_battle_store(battles, failed)
+    log_throttle_metrics()
+
+    fetched_data = compute_battle_windows(battles, INTERVALS, now)
+    save_to_cache_if_needed(CacheType.KILLBOARD, fetched_data, if_save_to_cache, "Killboard attendance")
+    return fetched_data
@@ -0,0 +1,422 @@
+# ----- ----- ----- -----
+# ocr_engine.py
+# For Albion Online "Griffin Empire" Guild only
+# Do not distribute or modify
+# Author: DragonTaki (https://github.com/DragonTaki)
+# Create Date: 2026/10/19
+# Update Date: 2026/10/19
+# Version: v1.0
+# ----- ----- ----- -----
+
+# Heavy OCR stack (OpenCV, NumPy, Tesseract, PIL, fuzzy matching).
+# Only import this module from screenshot tasks, never at GUI startup.
+
+import os
+import threading
+from enum import Enum
+from typing import Optional
+
+import cv2
+import numpy as np
+import pytesseract
+from fuzzywuzzy import fuzz
+from PIL import Image, ImageOps, ImageFilter
+
+from botcore.config.settings_manager import get_settings
+settings = get_settings()
+from botcore.logging.app_logger import LogLevel, log
+from botcore.utils.file_utils import get_path
+from botcore.utils.metrics import counter
+from botcore.utils.stage_timer import stage
+
+# ----- Screenshot Processing Settings ----- #
+# Sys paths
+APP_DATA_FOLDER = "app_data"
+THIRD_PARTY_FOLDER = "third-party"
+
+# Screenshot preprossing step 1: enlarge image
+SCALE_FACTOR = 2.0  # Scale factor for enlarging the image
+
+# Screenshot preprossing step 2: matching area
+min_scale = 0.7
+max_scale = 1.9
+step = 0.1
+MATCH_SCALES = np.arange(min_scale, max_scale + step, step).round(2).tolist()
+MAX_VERTICAL_DIFF = 3
+
+class NameRegion:
+    class Offset:
+        X = -166
+        Y = 0
+
+    class Size:
+        Width = 163
+        Height = 35
+
+class MergeStrategy(Enum):
+    LEFTMOST = "left"
+    MIDDLE = "middle"
+    RIGHTMOST = "right"
+
+# Screenshot preprossing step 3: image preprocessing
+SHARPEN_KERNEL = np.array([
+    [0, -0.2, 0],
+    [-0.2, 2.5, -0.2],
+    [0, -0.2, 0]
+])
+
+# Matching option
+FUZZY_MATCH_THRESHOLD = 75
+
+# Template image
+BUTTON_TEMPLATE_FILENAME = "button.png"
+
+# Metrics
+OCR_CALLS = counter("ocr_calls_total", "Tesseract calls by result.", ("result",))
+
+# Tesseract setup
+TESSERACT_DIR = os.path.join(os.path.dirname(__file__), "..", "..", THIRD_PARTY_FOLDER, "tesseract")
+TESSERACT_EXEC = os.path.join(TESSERACT_DIR, "tesseract.exe")
+TESSDATA_DIR = os.path.join(TESSERACT_DIR, "tessdata")
+
+
+# ----- Helper Functions ----- #
+def enlarge_image(image: Image.Image) -> Image.Image:
+    enlarged_size = (int (image.width * SCALE_FACTOR), int (image.height * SCALE_FACTOR))
+    image = image.resize(enlarged_size, Image.LANCZOS)
+    return image
+
+
+def _pil_to_cv2_gray(image: Image.Image):
+    """
+    Convert a PIL image to a grayscale OpenCV image.
+
+    Args:
+        image (PIL.Image): Input image.
+
+    Returns:
+        np.ndarray: Grayscale image in OpenCV format.
+    """
+    rgb = np.array(image)
+    bgr = cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR)
+    gray = cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY)
+    return gray
+
+
+def _configure_tesseract() -> None:
+    """
+    Use the bundled Tesseract if present, otherwise keep the one found on PATH.
+    """
+    if os.path.isfile(TESSERACT_EXEC):
+        pytesseract.pytesseract.tesseract_cmd = TESSERACT_EXEC
+        os.environ["TESSDATA_PREFIX"] = TESSDATA_DIR
+    else:
+        log(f"Bundled Tesseract not found at \"{TESSERACT_EXEC}\". Using Tesseract from PATH.", LogLevel.DEBUG)
+
+
+def _match_template(
+    image_gray: np.ndarray,
+    template_gray: np.ndarray,
+    scales: list[float],
+    threshold: float = 0.8
+) -> list[tuple[int, int]]:
+    """
+    Match a grayscale template within a grayscale image, with optional scaling.
+
+    Args:
+        image_gray: The target image in grayscale.
+        template_gray: The template image in grayscale.
+        threshold: Matching threshold between 0 and 1.
+        scales: A list of scale factors to resize the template.
+
+    Returns:
+        A list of (x, y) coordinates where matches were found.
+    """
+    matched_points = []
+
+    for scale in scales:
+        if scale != 1.0:
+            resized_template = cv2.resize(template_gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        else:
+            resized_template = template_gray
+
+        with stage(f"match_template/x{scale:.1f}"):
+            result = cv2.matchTemplate(image_gray, resized_template, cv2.TM_CCOEFF_NORMED)
+            loc = np.where(result >= threshold)
+            points = list(zip(*loc[::-1]))  # (x, y)
+
+        # Optional: remove duplicates from overlapping scale matches
+        matched_points.extend([(x, y, scale) for (x, y) in points])
+        matched_points = _deduplicate_matches(matched_points, tolerance=10)
+
+    return matched_points
+
+
+def _deduplicate_matches(points: list[tuple[int, int, float]], tolerance: int = 10,
+                        strategy: MergeStrategy = MergeStrategy.MIDDLE) -> list[tuple[int, int, float]]:
+    """
+    Merge nearby matching points (possibly from different scales) into unique points.
+
+    Args:
+        points: List of (x, y, scale) match points.
+        tolerance: Pixel distance within which to merge points.
+        strategy: Strategy to choose representative point from a group.
+
+    Returns:
+        List of deduplicated (x, y, scale) points.
+    """
+    clusters = []
+
+    for x, y, scale in points:
+        added = False
+        for cluster in clusters:
+            cx, cy, _ = cluster[0]
+            if abs(x - cx) <= tolerance and abs(y - cy) <= tolerance:
+                cluster.append((x, y, scale))
+                added = True
+                break
+        if not added:
+            clusters.append([(x, y, scale)])
+
+    # Select representative point from each cluster
+    result = []
+    for cluster in clusters:
+        if strategy == MergeStrategy.LEFTMOST:
+            representative = min(cluster, key=lambda pt: pt[0])  # 最左邊 x 最小
+        elif strategy == MergeStrategy.RIGHTMOST:
+            representative = max(cluster, key=lambda pt: pt[0])  # 最右邊 x 最大
+        elif strategy == MergeStrategy.MIDDLE:
+            sorted_cluster = sorted(cluster, key=lambda pt: pt[0])
+            representative = sorted_cluster[len(sorted_cluster) // 2]
+        else:
+            representative = cluster[0]  # 預設 fallback
+
+        result.append(representative)
+
+    return result
+
+
+# V1: Convert to grayscale, and optionally increase contrast slightly
+def _preprocess_v1(image: Image.Image) -> Image.Image:
+    gray = image.convert("L")
+    contrast = ImageOps.autocontrast(gray, cutoff=10)  # Apply slight contrast enhancement
+    return contrast
+
+# V2: Contrast enhancement and moderate sharpening
+def _preprocess_v2(image: Image.Image) -> Image.Image:
+    gray = image.convert("L")
+    # Enhance contrast (slightly higher cutoff to preserve more details)
+    enhanced = ImageOps.autocontrast(gray, cutoff=15)
+    # Apply sharpening filter
+    sharpened = enhanced.filter(ImageFilter.UnsharpMask(radius=1, percent=150, threshold=3))
+    return sharpened
+
+# V3: Moderate sharpening with a customized kernel
+def _preprocess_v3(image: Image.Image) -> Image.Image:
+    gray = np.array(image.convert("L"))
+    # Custom sharpening kernel (slightly less aggressive)
+    sharpened = cv2.filter2D(gray, -1, SHARPEN_KERNEL)
+    return Image.fromarray(sharpened)
+
+# V4: CLAHE (Contrast Limited Adaptive Histogram Equalization) with optimized parameters
+def _preprocess_v4(image: Image.Image) -> Image.Image:
+    gray = np.array(image.convert("L"))
+    # Apply CLAHE with moderate clipping limit and a larger grid size for better general contrast
+    clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(16, 16))  # Reduced clipLimit, increased gridSize
+    equalized = clahe.apply(gray)
+    return Image.fromarray(equalized)
+
+PREPROCESS_VERSIONS = {
+    "v1": _preprocess_v1,
+    "v2": _preprocess_v2,
+    "v3": _preprocess_v3,
+    "v4": _preprocess_v4,
+}
+
+
+# ----- OCR Engine ----- #
+class OcrEngine:
+    """
+    Screenshot OCR pipeline: minus-button template matching, name region cropping,
+    preprocessing, Tesseract recognition and fuzzy player name matching.
+
+    Created once on the first screenshot task through `get_ocr_engine()`.
+    """
+
+    def __init__(self):
+        _configure_tesseract()
+
+        template_path = get_path(APP_DATA_FOLDER, BUTTON_TEMPLATE_FILENAME, use_meipass=True)
+        with Image.open(template_path) as template:
+            self.button_template_cv2 = _pil_to_cv2_gray(enlarge_image(template))
+
+    def open_image(self, path: str) -> Image.Image:
+        """
+        Args:
+            path (str): Path to a screenshot.
+
+        Returns:
+            PIL.Image: The loaded screenshot.
+        """
+        with stage("decode"):
+            image = Image.open(path)
+            image.load()  # Decode now, so the cost is not hidden in the first pixel access
+        return image
+
+    def enlarge_image(self, image: Image.Image) -> Image.Image:
+        """
+        Enlarge a screenshot by `SCALE_FACTOR`, the scale all region offsets are defined in.
+        """
+        with stage("enlarge"):
+            return enlarge_image(image)
+
+    def extract_name_regions(self, enlarged_image: Image.Image, tolerance: int = 5) -> list[Image.Image]:
+        """
+        Crop name regions by detecting minus buttons in an already enlarged image.
+
+        Args:
+            enlarged_image (PIL.Image): Pre-enlarged image.
+
+        Returns:
+            List[PIL.Image]: Cropped name regions.
+        """
+        try:
+            with stage("to_gray"):
+                image_cv2 = _pil_to_cv2_gray(enlarged_image)
+
+            matched_points_with_scale = _match_template(image_cv2, self.button_template_cv2, MATCH_SCALES, threshold=0.8)
+            if not matched_points_with_scale:
+                log("No area matched with template.", LogLevel.WARN)
+                return []
+
+            # Group matched y-values into rows
+            matched_points_with_scale.sort(key=lambda pt: pt[1])
+            grouped_rows = []
+            current_row = [matched_points_with_scale[0]]
+
+            for pt in matched_points_with_scale[1:]:
+                if abs(pt[1] - current_row[-1][1]) <= MAX_VERTICAL_DIFF:
+                    current_row.append(pt)
+                else:
+                    grouped_rows.append(current_row)
+                    current_row = [pt]
+            grouped_rows.append(current_row)
+
+            processed_regions = []
+            name_regions = []
+            for row in grouped_rows:
+                row.sort(key=lambda pt: pt[0])  # sort left to right
+                for (x, y, scale) in row:
+                    left = max(int(x + NameRegion.Offset.X * scale), 0)
+                    top = max(int(y + NameRegion.Offset.Y * scale), 0)
+                    right = left + int(NameRegion.Size.Width * scale)
+                    bottom = top + int(NameRegion.Size.Height * scale)
+
+                    # Check if the region is already processed using tolerance
+                    region = (left, top, right, bottom)
+
+                    # Check if there is a previously processed region with a similar location within tolerance
+                    is_duplicate = False
+                    for processed in processed_regions:
+                        (prev_left, prev_top, prev_right, prev_bottom) = processed
+                        if abs(prev_left - left) <= tolerance and abs(prev_top - top) <= tolerance:
+                            is_duplicate = True
+                            break
+
+                    if not is_duplicate:
+                        with stage("crop"):
+                            cropped = enlarged_image.crop((left, top, right, bottom))
+                        name_regions.append(cropped)
+                        processed_regions.append(region)
+
+            return name_regions
+
+        except Exception as e:
+            log(f"Failed to extract name regions: {e}", LogLevel.ERROR)
+            return []
+
+    def preprocess_all_versions(self, image: Image.Image) -> dict[str, Image.Image]:
+        """
+        Apply multiple preprocessing versions to the input image.
+
+        Returns:
+            A dictionary with version names as keys and processed PIL.Images as values.
+        """
+        versions = {}
+        for label, preprocess in PREPROCESS_VERSIONS.items():
+            with stage(f"preprocess_{label}"):
+                versions[label] = preprocess(image)
+        return versions
+
+    def perform_ocr_on_versions(self, name_images, whitelist_path):
+        config = f"--psm 7"
+
+        ocr_results = []
+        for img in name_images:
+            if img:
+                try:
+                    with stage("tesseract"):
+                        result = pytesseract.image_to_string(img, config=config).strip()
+                    OCR_CALLS.inc(result="text" if result else "empty")
+                    if result:
+                        ocr_results.append(result)
+                    else:
+                        #log(f"Empty OCR result for image \"{img}\".", LogLevel.DEBUG)
+                        continue
+                except Exception as e:
+                    OCR_CALLS.inc(result="error")
+                    log(f"Error during OCR processing: {e}.", LogLevel.ERROR)
+            else:
+                log("Skipping empty image...", LogLevel.WARN)
+
+        return ocr_results
+
+    def match_player_names(self, recognized_names, player_list, version_label):
+        with stage("match_names"):
+            return self._match_player_names(recognized_names, player_list, version_label)
+
+    def _match_player_names(self, recognized_names, player_list, version_label):
+        matched = []
+
+        for name in recognized_names:
+            try:
+                lowered_name = name.lower()
+
+                # Fuzzy match using original (lowercased) names
+                best_match = max(
+                    player_list,
+                    key=lambda player: fuzz.ratio(lowered_name, player.lower()),
+                )
+                best_score = fuzz.ratio(lowered_name, best_match.lower())
+                # log(f"[{version_label}] Matching \"{name}\" against \"{best_match}\" (score: {best_score})")
+
+                if best_score > FUZZY_MATCH_THRESHOLD:
+                    matched.append((best_match, version_label))
+                else:
+                    # log(f"[{version_label}] No match above threshold for \"{name}\" (score: {best_score}).", LogLevel.DEBUG)
+                    continue
+
+            except Exception as e:
+                log(f"[{version_label}] Failed to match \"{name}\": {e}.", LogLevel.DEBUG)
+
+        return matched
+
+
+# ----- Main Functions ----- #
+_engine_instance: Optional[OcrEngine] = None
+_engine_lock = threading.Lock()
+
+def get_ocr_engine() -> OcrEngine:
+    """
+    Get the shared OCR engine, creating it on first use.
+
+    Returns:
+        OcrEngine: The shared engine instance.
+    """
+    global _engine_instance
+    if _engine_instance is None:
+        with _engine_lock:
+            if _engine_instance is None:
+                log("Initializing OCR engine...")
+                _engine_instance = OcrEngine()
+    return _engine_instance
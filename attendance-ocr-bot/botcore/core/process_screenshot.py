@@ -4,22 +4,14 @@
 # Do not distribute or modify
 # Author: DragonTaki (https://github.com/DragonTaki)
 # Create Date: 2025/04/18
-# Update Date: 2025/04/25
-# Version: v2.1
+# Update Date: 2026/10/19
+# Version: v2.2
 # ----- ----- ----- -----
 
+import json
 import os
-import numpy as np
 from datetime import datetime
 from collections import defaultdict
-from PIL import Image
-from fuzzywuzzy import fuzz
-from enum import Enum
-
-import cv2
-import pytesseract
-import shutil
-from PIL import Image, ImageOps, ImageFilter
 
 from botcore.config.constant import CacheType, EXTENSIONS, DATETIME_FORMATS, DAYS_LOOKBACK, TEXTFILE_ENCODING
 from botcore.config.settings_manager import get_settings
@@ -27,97 +19,91 @@ settings = get_settings()
 from botcore.logging.app_logger import LogLevel, log
 from .cache import load_from_cache
 from .fetch_guild_members import fetch_guild_members
-from botcore.utils.file_utils import get_file_checksum, get_path, ensure_folder_exists
+from .debug_image_writer import get_debug_image_writer, is_debug_image_enabled, should_save_debug_image
+from botcore.utils.file_utils import get_file_checksum, ensure_folder_exists
+from botcore.utils.job_scheduler import check_cancelled, report_progress
+from botcore.utils.metrics import DEFAULT_COUNT_BUCKETS, counter, histogram
+from botcore.utils.stage_timer import StageProfiler, count, load_profile_history, profile_run, stage
 
-# ----- Screenshot Processing Settings ----- #
-# Sys paths
-APP_DATA_FOLDER = "app_data"
-THIRD_PARTY_FOLDER = "third-party"
+# The OCR stack (cv2, numpy, pytesseract, PIL, fuzzywuzzy) lives in `ocr_engine`,
+# imported on the first screenshot task only.
 
-# Debug mode
-AUTO_DELETE_TEMP_FILE = False  # Toggle this to `True` to clean up debug folder
-SCREENSHOT_DEBUG_MODE = True  # Toggle this to `True` to enable screenshot processing debug mode
+# ----- Screenshot Processing Settings ----- #
+# Debug log limits for per-region / per-image messages
+DEBUG_LOG_MAX_PER_SEC = 5
 
-# Screenshot preprossing step 1: enlarge image
-SCALE_FACTOR = 2.0  # Scale factor for enlarging the image
+# Per-run stage profiles (JSON Lines, one run each), written next to the screenshot summary
+SCREENSHOT_PROFILE_FILENAME = "screenshot_profile.jsonl"
+SCREENSHOT_PROFILE_HISTORY = 50  # Runs kept per day folder
 
-# Screenshot preprossing step 2: matching area
-min_scale = 0.7
-max_scale = 1.9
-step = 0.1
-MATCH_SCALES = np.arange(min_scale, max_scale + step, step).round(2).tolist()
+# Per-image OCR texts, so unchanged images are only re-matched, never re-read
+SCREENSHOT_IMAGE_RESULTS_FILENAME = "screenshot_images.json"
+IMAGE_RESULTS_VERSION = 1
 
-class NameRegion:
-    class Offset:
-        X = -166
-        Y = 0
+# Metrics
+OCR_RUN_IMAGES = histogram("ocr_run_images", "Screenshots processed per folder run.", buckets=DEFAULT_COUNT_BUCKETS)
+OCR_REGIONS = counter("ocr_regions_detected_total", "Name regions detected in screenshots.")
+OCR_VERSION_ATTEMPTS = counter("ocr_version_attempts_total", "Name regions read with each preprocess version.", ("version",))
+OCR_VERSION_MATCHES = counter("ocr_version_matches_total", "Name regions whose read matched a player, per preprocess version.", ("version",))
 
-    class Size:
-        Width = 163
-        Height = 35
+# File paths
+WORDLIST_TEMP_FILENAME = "temp_wordlist.txt"
+WORDLIST_TEMP_FILE = os.path.join(settings.folder_paths.temp, WORDLIST_TEMP_FILENAME)
 
-class MergeStrategy(Enum):
-    LEFTMOST = "left"
-    MIDDLE = "middle"
-    RIGHTMOST = "right"
 
-# Screenshot preprossing step 3: image preprocessing
-SHARPEN_KERNEL = np.array([
-    [0, -0.2, 0],
-    [-0.2, 2.5, -0.2],
-    [0, -0.2, 0]
-])
+# ----- Per-image Result Store ----- #
+def load_image_results(folder_path: str) -> dict[str, dict]:
+    """
+    Load the stored OCR texts of a day folder's images.
 
-# Matching option
-FUZZY_MATCH_THRESHOLD = 75
+    Returns:
+        dict[str, dict]: Image name -> {"checksum": str, "regions": [{version: [texts]}]}.
+    """
+    path = os.path.join(folder_path, SCREENSHOT_IMAGE_RESULTS_FILENAME)
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding=TEXTFILE_ENCODING) as f:
+            data = json.load(f)
+        if data.get("version") != IMAGE_RESULTS_VERSION:
+            return {}
+        return data.get("images", {})
+    except Exception as e:
+        log(f"Ignoring unreadable image results in \"{path}\": {e}.", LogLevel.WARN)
+        return {}
 
 
-# ----- Helper Functions used by Constants ----- #
-def _enlarge_image(image: Image.Image):
-    enlarged_size = (int (image.width * SCALE_FACTOR), int (image.height * SCALE_FACTOR))
-    image = image.resize(enlarged_size, Image.LANCZOS)
-    return image
+def save_image_results(folder_path: str, images: dict[str, dict]) -> None:
+    path = os.path.join(folder_path, SCREENSHOT_IMAGE_RESULTS_FILENAME)
+    temp_path = f"{path}.tmp"
+    try:
+        with open(temp_path, "w", encoding=TEXTFILE_ENCODING) as f:
+            json.dump({"version": IMAGE_RESULTS_VERSION, "images": images}, f, ensure_ascii=False)
+        os.replace(temp_path, path)
+    except OSError as e:
+        log(f"Failed to save image results in \"{folder_path}\": {e}.", LogLevel.WARN)
 
 
-def _pil_to_cv2_gray(image: Image.Image):
+def match_region_texts(engine, region_texts: list[dict[str, list[str]]], player_list) -> list[dict[str, set[str]]]:
     """
-    Convert a PIL image to a grayscale OpenCV image.
-    
-    Args:
-        image (PIL.Image): Input image.
+    Match stored OCR texts against the current player list.
 
     Returns:
-        np.ndarray: Grayscale image in OpenCV format.
+        list[dict[str, set[str]]]: Same shape as `ocr_screenshot`.
     """
-    rgb = np.array(image)
-    bgr = cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR)
-    gray = cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY)
-    return gray
-
-# ----- Constants ----- #
-# File paths
-WORDLIST_TEMP_FILENAME = "temp_wordlist.txt"
-WORDLIST_TEMP_FILE = os.path.join(settings.folder_paths.temp, WORDLIST_TEMP_FILENAME)
-ensure_folder_exists(settings.folder_paths.temp)
-BUTTON_TEMPLATE_FILENAME = "button.png"
-BUTTON_TEMPLATE_PATH = get_path(APP_DATA_FOLDER, BUTTON_TEMPLATE_FILENAME, use_meipass=True)
-
-# Template image
-BUTTON_TEMPLATE_ORIG = Image.open(BUTTON_TEMPLATE_PATH)
-BUTTON_TEMPLATE_ENLARGED = _enlarge_image(BUTTON_TEMPLATE_ORIG)
-BUTTON_TEMPLATE_CV2 = _pil_to_cv2_gray(BUTTON_TEMPLATE_ENLARGED)
-MAX_VERTICAL_DIFF = 3
-
-# Tesseract setup
-TESSERACT_DIR = os.path.join(os.path.dirname(__file__), "..", "..", THIRD_PARTY_FOLDER, "tesseract")
-TESSERACT_EXEC = os.path.join(TESSERACT_DIR, "tesseract.exe")
-TESSDATA_DIR = os.path.join(TESSERACT_DIR, "tessdata")
-pytesseract.pytesseract.tesseract_cmd = TESSERACT_EXEC
-os.environ["TESSDATA_PREFIX"] = TESSDATA_DIR
+    region_matches = []
+    for texts_by_version in region_texts:
+        region_matched_players: dict[str, set[str]] = defaultdict(set)
+        for version_label, recognized_names in texts_by_version.items():
+            for name, version in engine.match_player_names(recognized_names, player_list, version_label):
+                region_matched_players[name].add(version)
+        region_matches.append(dict(region_matched_players))
+    return region_matches
 
 
 # ----- Daily summary Main Functions ----- #
 def create_word_list_file(player_list):
+    ensure_folder_exists(settings.folder_paths.temp)
     with open(WORDLIST_TEMP_FILE, "w", encoding=TEXTFILE_ENCODING) as f:
         for name in player_list:
             f.write(name + "\n")
@@ -142,328 +128,118 @@ def get_valid_player_list():
     return player_list
 
 
-# ----- Helper Functions ----- #
-def _save_debug_pictures(images, original_filename, prefix, subfolder=None):
+def _report_profile(profiler: StageProfiler, folder_path: str) -> None:
     """
-    Save debug images to disk only if DEBUG_MODE is enabled.
-
-    Args:
-        images: A single PIL.Image or a list of PIL.Images.
-        prefix: Filename prefix to identify image purpose, e.g., 'v0_enlarged'.
-        subfolder: Optional. Save to a subfolder under DEBUG_FOLDER if specified.
-    """
-    if not settings.enable_debug_mode:
-        return
-
-    # Check and strip known image extensions
-    base_name, ext = os.path.splitext(original_filename)
-    if ext.lower() in EXTENSIONS.image:
-        name_without_ext = base_name
-    else:
-        name_without_ext = original_filename
-
-    # Prepare folder path
-    folder_path = os.path.join(settings.folder_paths.debug, subfolder) if subfolder else settings.folder_paths.debug
-    os.makedirs(folder_path, exist_ok=True)
-
-    # Ensure images is a list
-    if not isinstance(images, list):
-        images = [images]
-
-    for idx, img in enumerate(images):
-        if not isinstance(img, Image.Image):
-            continue  # skip if not a PIL image
-
-        filename = f"{name_without_ext}_{prefix}_{idx}.png"
-        save_path = os.path.join(folder_path, filename)
-
-        try:
-            img.save(save_path)
-        except Exception as e:
-            log(f"Failed to save image \"{filename}\": {e}", LogLevel.ERROR)
-
-
-def _clear_debug_folder():
-    """
-    Clear all generated debug images in the DEBUG_FOLDER. 
-    If subfolders are empty after deletion, remove them as well.
-    """
-    # Check if the DEBUG_FOLDER exists
-    if not os.path.exists(settings.folder_paths.debug):
-        log(f"DEBUG_FOLDER \"{settings.folder_paths.debug}\" does not exist.", LogLevel.WARN)
-        return
-    
-    # Iterate over all items in the DEBUG_FOLDER
-    for root, dirs, files in os.walk(settings.folder_paths.debug, topdown=False):  # Walk in reverse to delete files first
-        for file in files:
-            # Only delete image files
-            if file.lower().endswith(EXTENSIONS.image):
-                file_path = os.path.join(root, file)
-                try:
-                    os.remove(file_path)
-                    log(f"Deleted image: \"{file_path}\".", LogLevel.DEBUG)
-                except Exception as e:
-                    log(f"Failed to delete image \"{file_path}\": {e}.", LogLevel.ERROR)
-
-        # After files are deleted, check if the folder is empty, and remove it if so
-        for dir_name in dirs:
-            dir_path = os.path.join(root, dir_name)
-            if not os.listdir(dir_path):  # Check if directory is empty
-                try:
-                    shutil.rmtree(dir_path)
-                    log(f"Deleted empty folder: \"{dir_path}\".", LogLevel.DEBUG)
-                except Exception as e:
-                    log(f"Failed to delete folder \"{dir_path}\": {e}.", LogLevel.ERROR)
-
-
-def _extract_name_regions(image: Image.Image):
-    """
-    Extracts name regions from the image using OpenCV and returns them as PIL images.
-    """
-    # Use the minus button detection method to crop name regions
-    return _crop_name_regions_by_minus_buttons(image)
-
-
-# Crop name regions using minus button positions
-def _crop_name_regions_by_minus_buttons(enlarged_image: Image.Image, tolerance: int = 5) -> list[Image.Image]:
-    """
-    Crop name regions by detecting minus buttons in an already enlarged image.
-
-    Args:
-        enlarged_image (PIL.Image): Pre-enlarged image.
-
-    Returns:
-        List[PIL.Image]: Cropped name regions.
+    Log the per-stage breakdown of one folder run, compared with the previous run of the folder,
+    and append it to the profile history next to the summary.
     """
+    profile = profiler.summary()
+    rates = profile["rates_per_sec"]
+    log(f"OCR run \"{profiler.name}\" took {profile['elapsed_sec']:.2f}s: "
+        f"{rates.get('images', 0):.2f} images/s, {rates.get('regions', 0):.2f} regions/s.")
+    for line in profiler.format_table():
+        log(line, LogLevel.DEBUG)
+
+    profile_path = os.path.join(folder_path, SCREENSHOT_PROFILE_FILENAME)
     try:
-        image_cv2 = _pil_to_cv2_gray(enlarged_image)
+        history = load_profile_history(profile_path)
+        previous_rate = history[-1].get("rates_per_sec", {}).get("regions", 0) if history else 0
+        if previous_rate and rates.get("regions"):
+            log(f"OCR run \"{profiler.name}\": {rates['regions'] / previous_rate - 1:+.1%} regions/s "
+                f"vs. the previous run ({history[-1].get('started_at')}).", LogLevel.DEBUG)
+        profiler.append_json_line(profile_path, SCREENSHOT_PROFILE_HISTORY)
+    except OSError as e:
+        log(f"Failed to save OCR profile for \"{profiler.name}\": {e}.", LogLevel.WARN)
 
-        matched_points_with_scale = _match_template(image_cv2, BUTTON_TEMPLATE_CV2, MATCH_SCALES, threshold=0.8)
-        if not matched_points_with_scale:
-            log("No area matched with template.", LogLevel.WARN)
-            return []
 
-        # Group matched y-values into rows
-        matched_points_with_scale.sort(key=lambda pt: pt[1])
-        grouped_rows = []
-        current_row = [matched_points_with_scale[0]]
-
-        for pt in matched_points_with_scale[1:]:
-            if abs(pt[1] - current_row[-1][1]) <= MAX_VERTICAL_DIFF:
-                current_row.append(pt)
-            else:
-                grouped_rows.append(current_row)
-                current_row = [pt]
-        grouped_rows.append(current_row)
-
-        processed_regions = []
-        name_regions = []
-        for row in grouped_rows:
-            row.sort(key=lambda pt: pt[0])  # sort left to right
-            for (x, y, scale) in row:
-                left = max(int(x + NameRegion.Offset.X * scale), 0)
-                top = max(int(y + NameRegion.Offset.Y * scale), 0)
-                right = left + int(NameRegion.Size.Width * scale)
-                bottom = top + int(NameRegion.Size.Height * scale)
-
-                # Check if the region is already processed using tolerance
-                region = (left, top, right, bottom)
-                
-                # Check if there is a previously processed region with a similar location within tolerance
-                is_duplicate = False
-                for processed in processed_regions:
-                    (prev_left, prev_top, prev_right, prev_bottom) = processed
-                    if abs(prev_left - left) <= tolerance and abs(prev_top - top) <= tolerance:
-                        is_duplicate = True
-                        break
-                
-                if not is_duplicate:
-                    cropped = enlarged_image.crop((left, top, right, bottom))
-                    name_regions.append(cropped)
-                    processed_regions.append(region)
-
-        return name_regions
-
-    except Exception as e:
-        log(f"Failed to extract name regions: {e}", LogLevel.ERROR)
-        return []
-
-
-def _match_template(
-    image_gray: np.ndarray,
-    template_gray: np.ndarray,
-    scales: list[float],
-    threshold: float = 0.8
-) -> list[tuple[int, int]]:
+def read_name_region(engine, region, player_list, wordlist_path) -> tuple[dict[str, set[str]], dict[str, list[str]], dict]:
     """
-    Match a grayscale template within a grayscale image, with optional scaling.
-
-    Args:
-        image_gray: The target image in grayscale.
-        template_gray: The template image in grayscale.
-        threshold: Matching threshold between 0 and 1.
-        scales: A list of scale factors to resize the template.
+    Preprocess one name region into every version, OCR each version and match the texts.
 
     Returns:
-        A list of (x, y) coordinates where matches were found.
+        tuple: (matched player -> versions that read it, version -> OCR texts, version -> preprocessed image).
     """
-    matched_points = []
+    version_images = engine.preprocess_all_versions(region)
+    region_matched_players: dict[str, set[str]] = defaultdict(set)
+    texts_by_version = {}
 
-    for scale in scales:
-        if scale != 1.0:
-            resized_template = cv2.resize(template_gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
-        else:
-            resized_template = template_gray
+    for version_label, version_image in version_images.items():
+        recognized_names = engine.perform_ocr_on_versions([version_image], wordlist_path)
+        texts_by_version[version_label] = recognized_names
+        #log(f"[{version_label}] OCR recognized: {recognized_names}", LogLevel.DEBUG)
 
-        result = cv2.matchTemplate(image_gray, resized_template, cv2.TM_CCOEFF_NORMED)
-        loc = np.where(result >= threshold)
-        points = list(zip(*loc[::-1]))  # (x, y)
+        matched_results = engine.match_player_names(recognized_names, player_list, version_label)
+        OCR_VERSION_ATTEMPTS.inc(version=version_label)
+        if matched_results:
+            OCR_VERSION_MATCHES.inc(version=version_label)
+        #log(f"[{version_label}] Matched results: {matched_results}", LogLevel.DEBUG)
 
-        # Optional: remove duplicates from overlapping scale matches
-        matched_points.extend([(x, y, scale) for (x, y) in points])
-        matched_points = _deduplicate_matches(matched_points, tolerance=10)
+        for name, version in matched_results:
+            region_matched_players[name].add(version)
 
-    return matched_points
+    return dict(region_matched_players), texts_by_version, version_images
 
 
-def _deduplicate_matches(points: list[tuple[int, int, float]], tolerance: int = 10,
-                        strategy: MergeStrategy = MergeStrategy.MIDDLE) -> list[tuple[int, int, float]]:
+def ocr_screenshot(engine, image, player_list, wordlist_path, file: str = "", folder_name: str = "",
+                   debug_writer=None, failed_regions_only: bool = False,
+                   region_texts: list | None = None) -> list[dict[str, set[str]]]:
     """
-    Merge nearby matching points (possibly from different scales) into unique points.
+    Read the player names of one screenshot.
 
     Args:
-        points: List of (x, y, scale) match points.
-        tolerance: Pixel distance within which to merge points.
-        strategy: Strategy to choose representative point from a group.
-
-    Returns:
-        List of deduplicated (x, y, scale) points.
-    """
-    clusters = []
-
-    for x, y, scale in points:
-        added = False
-        for cluster in clusters:
-            cx, cy, _ = cluster[0]
-            if abs(x - cx) <= tolerance and abs(y - cy) <= tolerance:
-                cluster.append((x, y, scale))
-                added = True
-                break
-        if not added:
-            clusters.append([(x, y, scale)])
-
-    # Select representative point from each cluster
-    result = []
-    for cluster in clusters:
-        if strategy == MergeStrategy.LEFTMOST:
-            representative = min(cluster, key=lambda pt: pt[0])  # 最左邊 x 最小
-        elif strategy == MergeStrategy.RIGHTMOST:
-            representative = max(cluster, key=lambda pt: pt[0])  # 最右邊 x 最大
-        elif strategy == MergeStrategy.MIDDLE:
-            sorted_cluster = sorted(cluster, key=lambda pt: pt[0])
-            representative = sorted_cluster[len(sorted_cluster) // 2]
-        else:
-            representative = cluster[0]  # 預設 fallback
-
-        result.append(representative)
-
-    return result
-
+        engine (OcrEngine): The shared OCR engine.
+        image (PIL.Image): The screenshot, not yet enlarged.
+        player_list: Names to match the OCR results against.
+        wordlist_path (str): Tesseract word list of the player names.
+        file (str): Image name, for logs and debug images.
+        folder_name (str): Day folder, for debug images.
+        debug_writer (DebugImageWriter, optional): Writer for intermediate images of this screenshot.
+        failed_regions_only (bool): Save debug images of unmatched regions only.
+        region_texts (list, optional): Receives the OCR texts of each region, {version: [texts]}.
 
-# V1: Convert to grayscale, and optionally increase contrast slightly
-def _preprocess_v1(image: Image.Image) -> Image.Image:
-    gray = image.convert("L")
-    contrast = ImageOps.autocontrast(gray, cutoff=10)  # Apply slight contrast enhancement
-    return contrast
-
-# V2: Contrast enhancement and moderate sharpening
-def _preprocess_v2(image: Image.Image) -> Image.Image:
-    gray = image.convert("L")
-    # Enhance contrast (slightly higher cutoff to preserve more details)
-    enhanced = ImageOps.autocontrast(gray, cutoff=15)
-    # Apply sharpening filter
-    sharpened = enhanced.filter(ImageFilter.UnsharpMask(radius=1, percent=150, threshold=3))
-    return sharpened
-
-# V3: Moderate sharpening with a customized kernel
-def _preprocess_v3(image: Image.Image) -> Image.Image:
-    gray = np.array(image.convert("L"))
-    # Custom sharpening kernel (slightly less aggressive)
-    sharpened = cv2.filter2D(gray, -1, SHARPEN_KERNEL)
-    return Image.fromarray(sharpened)
-
-# V4: CLAHE (Contrast Limited Adaptive Histogram Equalization) with optimized parameters
-def _preprocess_v4(image: Image.Image) -> Image.Image:
-    gray = np.array(image.convert("L"))
-    # Apply CLAHE with moderate clipping limit and a larger grid size for better general contrast
-    clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(16, 16))  # Reduced clipLimit, increased gridSize
-    equalized = clahe.apply(gray)
-    return Image.fromarray(equalized)
-
-def _preprocess_all_versions(image: Image.Image) -> dict[str, Image.Image]:
-    """
-    Apply multiple preprocessing versions to the input image.
-    
     Returns:
-        A dictionary with version names as keys and processed PIL.Images as values.
+        list[dict[str, set[str]]]: One entry per name region, mapping each matched player
+            to the preprocess versions that read it (empty if nothing matched).
     """
-    return {
-        "v1": _preprocess_v1(image),
-        "v2": _preprocess_v2(image),
-        "v3": _preprocess_v3(image),
-        "v4": _preprocess_v4(image),
-    }
-
-
-def _perform_ocr_on_versions(name_images, whitelist_path):
-    config = f"--psm 7"
-    
-    ocr_results = []
-    for img in name_images:
-        if img:
-            try:
-                result = pytesseract.image_to_string(img, config=config).strip()
-                if result:
-                    ocr_results.append(result)
-                else:
-                    #log(f"Empty OCR result for image \"{img}\".", LogLevel.DEBUG)
-                    continue
-            except Exception as e:
-                log(f"Error during OCR processing: {e}.", LogLevel.ERROR)
+    # Step 1: Enlarge the image first
+    enlarged_image = engine.enlarge_image(image)
+    if debug_writer and not failed_regions_only:
+        with stage("debug_submit"):
+            debug_writer.submit(enlarged_image, file, "s0_enlarged", folder_name)
+
+    # Step 2: Detect name regions
+    with stage("extract_regions"):
+        name_region_images = engine.extract_name_regions(enlarged_image)
+    count("regions", len(name_region_images))
+    OCR_REGIONS.inc(len(name_region_images))
+    if debug_writer and not failed_regions_only:
+        with stage("debug_submit"):
+            debug_writer.submit(name_region_images, file, "s1_extracted", folder_name)
+
+    # Step 3: For each name region, preprocess into multiple versions and OCR
+    region_matches = []
+    for idx, region in enumerate(name_region_images):
+        region_matched_players, texts_by_version, version_images = read_name_region(engine, region, player_list, wordlist_path)
+        if debug_writer and not failed_regions_only:
+            with stage("debug_submit"):
+                debug_writer.submit(version_images.values(), file, f"s2_preprocessed_{idx}", folder_name)
+
+        if region_matched_players:
+            count("matched_regions")
+            for name in region_matched_players:
+                log("[Region %d] Matched player name: \"%s\".", LogLevel.DEBUG,
+                    idx, name, max_per_sec=DEBUG_LOG_MAX_PER_SEC)
         else:
-            log("Skipping empty image...", LogLevel.WARNING)
-    
-    return ocr_results
-
-
-def _match_player_names(recognized_names, player_list, version_label):
-    matched = []
-
-    # Normalize player list to lowercase
-    lowered_player_list = [player.lower() for player in player_list]
-
-    for name in recognized_names:
-        try:
-            lowered_name = name.lower()
-
-            # Fuzzy match using original (lowercased) names
-            best_match = max(
-                player_list,
-                key=lambda player: fuzz.ratio(lowered_name, player.lower()),
-            )
-            best_score = fuzz.ratio(lowered_name, best_match.lower())
-            # log(f"[{version_label}] Matching \"{name}\" against \"{best_match}\" (score: {best_score})")
-
-            if best_score > FUZZY_MATCH_THRESHOLD:
-                matched.append((best_match, version_label))
-            else:
-                # log(f"[{version_label}] No match above threshold for \"{name}\" (score: {best_score}).", LogLevel.DEBUG)
-                continue
-
-        except Exception as e:
-            log(f"[{version_label}] Failed to match \"{name}\": {e}.", LogLevel.DEBUG)
+            log("[Region %d] No matched player.", LogLevel.DEBUG, idx, max_per_sec=DEBUG_LOG_MAX_PER_SEC)
+            if debug_writer and failed_regions_only:
+                with stage("debug_submit"):
+                    debug_writer.submit(region, file, f"s1_failed_{idx}", folder_name)
+                    debug_writer.submit(version_images.values(), file, f"s2_failed_{idx}", folder_name)
+        region_matches.append(region_matched_players)
+        if region_texts is not None:
+            region_texts.append(texts_by_version)
 
-    return matched
+    return region_matches
 
 
 # ----- Daily summary Main Functions ----- #
@@ -482,65 +258,87 @@ def parse_screenshot_file(folder_name: str, player_list, wordlist_path):
 
     log(f"Processing screenshot folder: \"{folder_name}\".")
 
+    with profile_run(folder_name) as profiler:
+        result = _parse_screenshot_folder(folder_name, folder_path, player_list, wordlist_path)
+    _report_profile(profiler, folder_path)
+    return result
+
+
+def _parse_screenshot_folder(folder_name: str, folder_path: str, player_list, wordlist_path):
+    from .ocr_engine import get_ocr_engine
+    engine = get_ocr_engine()
+
     stats = defaultdict(lambda: {"attendance": 0, "versions": set()})
     has_valid_image = False
+    failed_regions_only = settings.debug_images.failed_regions_only
 
-    for file in os.listdir(folder_path):
-        if not file.lower().endswith(EXTENSIONS.image):
-            continue
+    stored_images = {} if settings.force_regenerate_daily_summary else load_image_results(folder_path)
+    image_results = {}
+    meta = {}
 
+    image_files = [file for file in os.listdir(folder_path) if file.lower().endswith(EXTENSIONS.image + EXTENSIONS.video)]
+    OCR_RUN_IMAGES.observe(len(image_files))
+    for image_index, file in enumerate(image_files):
+        check_cancelled()
+        report_progress(image_index, len(image_files), "images", folder_name)
         full_path = os.path.join(folder_path, file)
-        log(f"Processing image: \"{file}\".")
 
         try:
-            image = Image.open(full_path)
-
-            # Step 1: Enlarge the image first
-            enlarged_image = _enlarge_image(image)
-            if SCREENSHOT_DEBUG_MODE:
-                _save_debug_pictures(enlarged_image, file, "s0_enlarged", folder_name)
-
-            # Step 2: Detect name regions
-            name_region_images = _extract_name_regions(enlarged_image)
-            if SCREENSHOT_DEBUG_MODE:
-                _save_debug_pictures(name_region_images, file, "s1_extracted", folder_name)
+            with stage("checksum"):
+                checksum = get_file_checksum(os.path.abspath(full_path))
+            meta[file] = checksum
+
+            stored = stored_images.get(file)
+            if stored and stored.get("checksum") == checksum:
+                # Unchanged image: match its stored texts against the current player list
+                log("Reusing OCR results of image: \"%s\".", LogLevel.DEBUG, file, max_per_sec=DEBUG_LOG_MAX_PER_SEC)
+                count("reused_images")
+                image_results[file] = stored
+                region_matches = match_region_texts(engine, stored["regions"], player_list)
+            elif file.lower().endswith(EXTENSIONS.video):
+                # Imported here so OpenCV is only needed when recordings are used
+                from .process_video import ocr_video
+                log(f"Processing video: \"{file}\".")
+                count("videos")
+                region_texts = []
+                region_matches = ocr_video(engine, full_path, player_list, wordlist_path, region_texts)
+                image_results[file] = {"checksum": checksum, "regions": region_texts}
+            else:
+                log(f"Processing image: \"{file}\".")
+                count("images")
+                debug_writer = get_debug_image_writer() if should_save_debug_image(image_index) else None
+                image = engine.open_image(full_path)
+                region_texts = []
+                region_matches = ocr_screenshot(engine, image, player_list, wordlist_path, file, folder_name,
+                                                debug_writer, failed_regions_only, region_texts)
+                image_results[file] = {"checksum": checksum, "regions": region_texts}
+
+            if file.lower().endswith(EXTENSIONS.video):
+                from .process_video import collapse_video_matches
+                region_matches = collapse_video_matches(region_matches)
 
             image_matched_players = set()
+            for matches in region_matches:
+                for name, versions in matches.items():
+                    stats[name]["attendance"] += 1
+                    stats[name]["versions"] |= versions
+                    has_valid_image = True
+                    image_matched_players.add(name)
 
-            # Step 3: For each name region, preprocess into multiple versions and OCR
-            for idx, region in enumerate(name_region_images):
-                version_images = _preprocess_all_versions(region)
-                if SCREENSHOT_DEBUG_MODE:
-                    _save_debug_pictures(version_images.values(), file, f"s2_preprocessed_{idx}", folder_name)
-
-                region_matched_players = set()
-
-                for version_label, version_image in version_images.items():
-                    recognized_names = _perform_ocr_on_versions([version_image], wordlist_path)
-                    #log(f"[Region {idx}][{version_label}] OCR recognized: {recognized_names}", LogLevel.DEBUG)
-
-                    matched_results = _match_player_names(recognized_names, player_list, version_label)
-                    #log(f"[Region {idx}][{version_label}] Matched results: {matched_results}", LogLevel.DEBUG)
-
-                    for name, version in matched_results:
-                        if name not in region_matched_players:
-                            stats[name]["attendance"] += 1
-                            region_matched_players.add(name)
-                        stats[name]["versions"].add(version)
-                        has_valid_image = True
-                        image_matched_players.add(name)
-
-                if region_matched_players:
-                    for name in region_matched_players:
-                        log(f"[Region {idx}] Matched player name: \"{name}\", total matched players: {len(image_matched_players)}.", LogLevel.DEBUG)
-                else:
-                    log(f"[Region {idx}] No matched player.", LogLevel.DEBUG)
-
-            log(f"Matched players from image \"{file}\": {sorted(image_matched_players)}", LogLevel.DEBUG)
+            log(lambda: f"Matched players from image \"{file}\": {sorted(image_matched_players)}", LogLevel.DEBUG,
+                max_per_sec=DEBUG_LOG_MAX_PER_SEC)
 
         except Exception as e:
             log(f"OCR parsing failed for \"{file}\": {str(e)}.", LogLevel.ERROR)
 
+    if image_results != stored_images:
+        save_image_results(folder_path, image_results)
+
+    if is_debug_image_enabled():
+        debug_writer = get_debug_image_writer()
+        log(lambda: f"Debug images: {debug_writer.saved_count} saved, {debug_writer.dropped_count} dropped (queue full).",
+            LogLevel.DEBUG)
+
     if has_valid_image and stats:
         formatted = [
             {
@@ -551,7 +349,7 @@ def parse_screenshot_file(folder_name: str, player_list, wordlist_path):
             for name, data in stats.items()
         ]
 
-        log(f"Final formatted summary: {formatted}", LogLevel.DEBUG)
+        log(lambda: f"Final formatted summary: {formatted}", LogLevel.DEBUG)
 
         if not formatted:
             log(f"No valid data found in folder \"{folder_name}\". Skipping.", LogLevel.WARN)
@@ -559,12 +357,6 @@ def parse_screenshot_file(folder_name: str, player_list, wordlist_path):
 
         log(f"Completed folder \"{folder_name}\" with {len(formatted)} player entries.")
 
-        meta = {
-            f: get_file_checksum(os.path.abspath(os.path.join(folder_path, f)))
-            for f in os.listdir(folder_path)
-            if f.lower().endswith(EXTENSIONS.image)
-        }
-
         attendance_list = [
             {"name": entry["name"], "attendance": entry["attendance"], "versions": entry["ocr"]}
             for entry in formatted
@@ -573,7 +365,3 @@ def parse_screenshot_file(folder_name: str, player_list, wordlist_path):
         return attendance_list, meta
     else:
         return None, None
-
-
-# ----- Initialization ----- #
-_clear_debug_folder()
\ No newline at end of file
@@ -0,0 +1,176 @@
+# ----- ----- ----- -----
+# process_video.py
+# For Albion Online "Griffin Empire" Guild only
+# Do not distribute or modify
+# Author: DragonTaki (https://github.com/DragonTaki)
+# Create Date: 2026/10/19
+# Update Date: 2026/10/19
+# Version: v1.0
+# ----- ----- ----- -----
+
+from collections import OrderedDict
+
+import cv2
+import numpy as np
+from PIL import Image
+
+from botcore.config.settings_manager import get_settings
+settings = get_settings()
+from botcore.logging.app_logger import LogLevel, log
+from botcore.utils.job_scheduler import check_cancelled
+from botcore.utils.metrics import counter
+from botcore.utils.stage_timer import count, stage
+from .process_screenshot import OCR_REGIONS, read_name_region
+
+# ----- Constants ----- #
+THUMBNAIL_SIZE = (64, 36)       # Frame differencing works on this downscaled grayscale copy
+DHASH_SIZE = 8                  # 8x8 difference hash, 64 bits per name row
+DEFAULT_VIDEO_FPS = 30.0        # Used when the container does not report its frame rate
+
+VIDEO_FRAMES = counter("video_frames_total", "Video frames by outcome.", ("result",))
+VIDEO_ROWS = counter("video_rows_total", "Name rows seen in videos, new (OCR'd) or already seen.", ("result",))
+
+
+# ----- Helper Functions ----- #
+def _frame_thumbnail(frame) -> np.ndarray:
+    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    return cv2.resize(gray, THUMBNAIL_SIZE, interpolation=cv2.INTER_AREA)
+
+
+def region_dhash(region: Image.Image) -> int:
+    """
+    Difference hash of a name region: robust to compression noise and small shifts,
+    so the same roster row in consecutive frames hashes (nearly) the same.
+    """
+    small = np.asarray(region.convert("L").resize((DHASH_SIZE + 1, DHASH_SIZE), Image.BILINEAR), dtype=np.int16)
+    bits = (small[:, 1:] > small[:, :-1]).flatten()
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+
+class RowTracker:
+    """
+    Bounded LRU of recently seen name-row hashes. A row counts as seen if a stored hash
+    is within `max_distance` bits; memory stays the same however long the video is.
+    """
+
+    def __init__(self, max_rows: int, max_distance: int):
+        self.max_rows = max(int(max_rows), 1)
+        self.max_distance = int(max_distance)
+        self._hashes: "OrderedDict[int, None]" = OrderedDict()
+
+    def seen(self, row_hash: int) -> bool:
+        """
+        Returns:
+            bool: True if the row was seen before; otherwise it is remembered and False is returned.
+        """
+        for known in self._hashes:
+            if (known ^ row_hash).bit_count() <= self.max_distance:
+                self._hashes.move_to_end(known)
+                return True
+        self._hashes[row_hash] = None
+        if len(self._hashes) > self.max_rows:
+            self._hashes.popitem(last=False)
+        return False
+
+
+# ----- Main Functions ----- #
+def ocr_video(engine, video_path: str, player_list, wordlist_path, region_texts: list | None = None) -> list[dict[str, set[str]]]:
+    """
+    Read the player names of a screen recording of the roster, frame by frame.
+
+    Frames are read one at a time: only every n-th frame (to `settings.video.sample_fps`) is
+    examined, frames that barely differ from the last processed one are skipped, and name rows
+    already seen in earlier frames are not read again. Only new rows go through preprocessing,
+    OCR and matching, exactly like screenshot regions.
+
+    Args:
+        engine (OcrEngine): The shared OCR engine.
+        video_path (str): Path to the recording.
+        player_list: Names to match the OCR results against.
+        wordlist_path (str): Tesseract word list of the player names.
+        region_texts (list, optional): Receives the OCR texts of each new row, {version: [texts]}.
+
+    Returns:
+        list[dict[str, set[str]]]: One entry per new name row, like `ocr_screenshot`.
+    """
+    config = settings.video
+    capture = cv2.VideoCapture(video_path)
+    if not capture.isOpened():
+        raise ValueError(f"Cannot open video \"{video_path}\".")
+
+    fps = capture.get(cv2.CAP_PROP_FPS) or DEFAULT_VIDEO_FPS
+    frame_step = max(int(round(fps / max(float(config.sample_fps), 0.1))), 1)
+    tracker = RowTracker(config.row_cache_size, config.row_hash_distance)
+    last_thumbnail = None
+    region_matches = []
+    frame_index = -1
+
+    try:
+        while True:
+            # grab() still decodes every frame (FFmpeg backend); skipping only saves retrieve()'s
+            # color conversion and the per-frame work below, so skipped frames are not free
+            with stage("video_decode"):
+                if not capture.grab():
+                    break
+                frame_index += 1
+                if frame_index % frame_step:
+                    continue
+                ok, frame = capture.retrieve()
+            if not ok:
+                break
+            check_cancelled()
+
+            with stage("frame_diff"):
+                thumbnail = _frame_thumbnail(frame)
+                unchanged = last_thumbnail is not None and \
+                    float(cv2.absdiff(thumbnail, last_thumbnail).mean()) < float(config.min_frame_diff)
+            if unchanged:
+                VIDEO_FRAMES.inc(result="unchanged")
+                count("video_frames_skipped")
+                continue
+            last_thumbnail = thumbnail
+            VIDEO_FRAMES.inc(result="processed")
+            count("video_frames")
+
+            image = Image.fromarray(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+            del frame  # Keep at most one decoded frame alive
+            enlarged_image = engine.enlarge_image(image)
+            with stage("extract_regions"):
+                name_region_images = engine.extract_name_regions(enlarged_image)
+            count("regions", len(name_region_images))
+            OCR_REGIONS.inc(len(name_region_images))
+
+            for region in name_region_images:
+                with stage("row_hash"):
+                    is_seen = tracker.seen(region_dhash(region))
+                if is_seen:
+                    VIDEO_ROWS.inc(result="seen")
+                    continue
+                VIDEO_ROWS.inc(result="new")
+
+                region_matched_players, texts_by_version, _ = read_name_region(engine, region, player_list, wordlist_path)
+                if region_matched_players:
+                    count("matched_regions")
+                region_matches.append(region_matched_players)
+                if region_texts is not None:
+                    region_texts.append(texts_by_version)
+    finally:
+        capture.release()
+
+    log(f"Video \"{video_path}\": {frame_index + 1} frames, {len(region_matches)} new name rows read.", LogLevel.DEBUG)
+    return region_matches
+
+
+def collapse_video_matches(region_matches: list[dict[str, set[str]]]) -> list[dict[str, set[str]]]:
+    """
+    A recording is one pass over the roster, so each player counts once per video even if
+    a row was read again (e.g. after scrolling back).
+
+    Returns:
+        list[dict[str, set[str]]]: One entry per matched player.
+    """
+    versions_by_player: dict[str, set[str]] = {}
+    for matches in region_matches:
+        for name, versions in matches.items():
+            versions_by_player.setdefault(name, set()).update(versions)
+    return [{name: versions} for name, versions in versions_by_player.items()]
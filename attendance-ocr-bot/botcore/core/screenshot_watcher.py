@@ -0,0 +1,217 @@
+# ----- ----- ----- -----
+# screenshot_watcher.py
+# For Albion Online "Griffin Empire" Guild only
+# Do not distribute or modify
+# Author: DragonTaki (https://github.com/DragonTaki)
+# Create Date: 2026/10/19
+# Update Date: 2026/10/19
+# Version: v1.0
+# ----- ----- ----- -----
+
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Optional
+
+from botcore.config.constant import DATETIME_FORMATS, DAYS_LOOKBACK, EXTENSIONS
+from botcore.config.settings_manager import get_settings
+settings = get_settings()
+from botcore.logging.app_logger import LogLevel, log
+from botcore.utils.job_scheduler import JOB_SCREENSHOT, Job, JobScheduler, JobState, get_job_scheduler
+from .daily_summary import DAILY_SUMMARY
+from .fetch_daily_attendance import fetch_daily_attendance
+
+# (size, mtime) of an image; a change means the file is new or was replaced
+FileSignature = tuple[int, float]
+
+
+# ----- Helper Functions ----- #
+def _is_recent_day(folder_name: str, today: datetime) -> bool:
+    try:
+        folder_date = datetime.strptime(folder_name, DATETIME_FORMATS.folder)
+    except ValueError:
+        return False
+    return (today - folder_date).days <= DAYS_LOOKBACK
+
+
+def scan_attendance_images(attendance_folder: str) -> dict[str, FileSignature]:
+    """
+    List the screenshots and recordings of the day folders still inside the lookback window.
+
+    Returns:
+        dict[str, FileSignature]: "<day>/<image>" -> (size, mtime).
+    """
+    today = datetime.today()
+    images = {}
+    try:
+        day_folders = os.listdir(attendance_folder)
+    except OSError:
+        return images
+
+    for folder_name in day_folders:
+        folder_path = os.path.join(attendance_folder, folder_name)
+        if not _is_recent_day(folder_name, today) or not os.path.isdir(folder_path):
+            continue
+        try:
+            with os.scandir(folder_path) as entries:
+                for entry in entries:
+                    if entry.is_file() and entry.name.lower().endswith(EXTENSIONS.image + EXTENSIONS.video):
+                        stat = entry.stat()
+                        images[f"{folder_name}/{entry.name}"] = (stat.st_size, stat.st_mtime)
+        except OSError:
+            continue  # Folder removed while scanning
+    return images
+
+
+def _summary_is_stale(attendance_folder: str, folder_name: str, newest_image_mtime: float) -> bool:
+    summary_path = os.path.join(attendance_folder, folder_name, DAILY_SUMMARY.SCREENSHOT.SUMMARY)
+    try:
+        return os.path.getmtime(summary_path) < newest_image_mtime
+    except OSError:
+        return True
+
+
+# ----- Screenshot Watcher ----- #
+class ScreenshotWatcher:
+    """
+    Poll the attendance folder and update the screenshot attendance of days whose images changed.
+
+    An image is picked up once its size and mtime have not changed for `settle_sec`, so files
+    still being copied are not read half-written. Updates run as the scheduler's screenshot job:
+    only the changed days are rebuilt, unchanged images reuse their stored OCR texts, and the
+    interval cache is saved, so the next report reads it directly. Days stay pending until a job
+    of this watcher rebuilding them finishes successfully; failed or cancelled updates are retried.
+    """
+
+    def __init__(self, scheduler: Optional[JobScheduler] = None):
+        self.scheduler = scheduler or get_job_scheduler()
+        self.attendance_folder = settings.folder_paths.attendance
+        self._known: dict[str, FileSignature] = {}
+        self._unsettled: dict[str, tuple[FileSignature, float]] = {}  # path -> (signature, first seen)
+        self._pending_days: set[str] = set()
+        self._submitted: Optional[tuple[Job, Callable[[], None], set[str]]] = None  # (job, task, days)
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self.run, name="screenshot-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+    def run(self) -> None:
+        """
+        Watch until `stop()` is called.
+        """
+        self._take_baseline()
+        log(f"Watching \"{self.attendance_folder}\" for new screenshots.")
+        while not self._stop_event.wait(max(float(settings.watch.poll_interval_sec), 0.2)):
+            try:
+                self.poll()
+            except Exception as e:
+                log(f"Screenshot watch failed: {e}", LogLevel.WARN, max_per_sec=0.01)
+
+    def _take_baseline(self) -> None:
+        """
+        Remember the current images; days whose summary is older than their newest image are queued.
+        """
+        self._known = scan_attendance_images(self.attendance_folder)
+        newest_by_day: dict[str, float] = {}
+        for path, (_, mtime) in self._known.items():
+            day = path.split("/", 1)[0]
+            newest_by_day[day] = max(newest_by_day.get(day, 0.0), mtime)
+        for day, newest in newest_by_day.items():
+            if _summary_is_stale(self.attendance_folder, day, newest):
+                self._pending_days.add(day)
+
+    def poll(self) -> None:
+        now = time.monotonic()
+        current = scan_attendance_images(self.attendance_folder)
+        settle_sec = float(settings.watch.settle_sec)
+
+        for path, signature in current.items():
+            if self._known.get(path) == signature:
+                self._unsettled.pop(path, None)
+                continue
+            seen = self._unsettled.get(path)
+            if seen is None or seen[0] != signature:
+                self._unsettled[path] = (signature, now)  # New or still being written
+            elif now - seen[1] >= settle_sec:
+                del self._unsettled[path]
+                self._known[path] = signature
+                self._pending_days.add(path.split("/", 1)[0])
+
+        for path in [path for path in self._known if path not in current]:
+            del self._known[path]
+            self._pending_days.add(path.split("/", 1)[0])  # Deleted images change the day too
+        for path in [path for path in self._unsettled if path not in current]:
+            del self._unsettled[path]
+
+        self._check_submitted()
+        if self._pending_days and self._submitted is None and not self._is_screenshot_job_active():
+            self._submit_update(set(self._pending_days))
+
+    def _is_screenshot_job_active(self) -> bool:
+        return any(job.name == JOB_SCREENSHOT for job in self.scheduler.active_jobs())
+
+    def _check_submitted(self) -> None:
+        """
+        Put the days of a finished update back to pending if it failed, was cancelled or was not
+        ours (the scheduler returned a screenshot job someone else had queued).
+        """
+        if self._submitted is None:
+            return
+        job, task, days = self._submitted
+        if not job.state.is_finished:
+            return
+        self._submitted = None
+        if job.func is task and job.state == JobState.DONE:
+            return
+        if job.func is task:
+            log(f"Attendance update of {', '.join(sorted(days))} did not finish, retrying.", LogLevel.WARN)
+        self._pending_days |= days
+
+    def _submit_update(self, days: set[str]) -> None:
+        day_list = sorted(days)
+
+        def task():
+            log(f"Screenshots changed in {', '.join(day_list)}, updating attendance...")
+            fetch_daily_attendance(DAILY_SUMMARY.SCREENSHOT, folder_names=day_list)
+
+        job = self.scheduler.submit(JOB_SCREENSHOT, task, f"Watch: {', '.join(day_list)}")
+        self._submitted = (job, task, days)
+        self._pending_days -= days  # Changes from now on need another update
+
+
+# ----- Main Functions ----- #
+_watcher: Optional[ScreenshotWatcher] = None
+_watcher_lock = threading.Lock()
+
+def start_screenshot_watcher(force: bool = False) -> Optional[ScreenshotWatcher]:
+    """
+    Start watching the attendance folder in the background.
+
+    Args:
+        force (bool): Start even if `settings.watch.enabled` is off.
+
+    Returns:
+        ScreenshotWatcher | None: The running watcher, or None if watching is disabled.
+    """
+    global _watcher
+    if not (force or settings.watch.enabled):
+        return None
+    with _watcher_lock:
+        if _watcher is None:
+            _watcher = ScreenshotWatcher()
+            _watcher.start()
+    return _watcher
+
+
+def stop_screenshot_watcher() -> None:
+    global _watcher
+    with _watcher_lock:
+        if _watcher is not None:
+            _watcher.stop()
+            _watcher = None
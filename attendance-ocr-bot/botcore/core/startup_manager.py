@@ -0,0 +1,171 @@
+# ----- ----- ----- -----
+# startup_manager.py
+# For Albion Online "Griffin Empire" Guild only
+# Do not distribute or modify
+# Author: DragonTaki (https://github.com/DragonTaki)
+# Create Date: 2026/10/19
+# Update Date: 2026/10/19
+# Version: v1.0
+# ----- ----- ----- -----
+
+import importlib
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Optional
+
+from botcore.config.static_settings import IF_TRIAL_VERSION, EXPIRE_DATE
+from botcore.logging.log_file_manager import log_ini
+
+
+# ----- Constants ----- #
+PHASE_IMPORTS = "imports"
+PHASE_AUTH = "auth"
+PHASE_TRIAL = "trial check"
+PHASE_WINDOW = "window"
+
+# Modules imported in the background while the window shows up (GUI, HTTP stack)
+WARMUP_MODULES = ("gui.main_interface",)
+
+NETWORK_TIME_URL = "https://www.google.com"
+
+
+# ----- Helper Functions ----- #
+def get_network_datetime() -> Optional[datetime]:
+    """
+    Get the current UTC time from the `Date` header of a well-known server.
+
+    Returns:
+        datetime | None: The network time, or None if unavailable.
+    """
+    from botcore.utils.network_utils import safe_web_request
+
+    response = safe_web_request(NETWORK_TIME_URL, method="HEAD", context="network time", use_logger=False, retries=1)
+    if response is None:
+        print("[ERROR] Failed to get network time: no response")
+        return None
+    try:
+        date_str = response.headers["Date"]  # Format: 'Wed, 23 Apr 2025 07:12:17 GMT'
+        return datetime.strptime(date_str, "%a, %d %b %Y %H:%M:%S GMT")
+    except Exception as e:
+        print(f"[ERROR] Failed to get network time: {e}")
+        return None
+
+
+def is_trial_expired() -> bool:
+    """
+    Check whether the trial version has expired, using network time.
+
+    Returns:
+        bool: True if expired or if it cannot be verified.
+    """
+    if not IF_TRIAL_VERSION:
+        return False
+    try:
+        if EXPIRE_DATE == "YYYY-MM-DD":  # Check for invalid default
+            return True
+        expire_date = datetime.strptime(EXPIRE_DATE, "%Y-%m-%d")
+        now = get_network_datetime()
+        if not now:
+            return True  # Fallback: block if can't verify time
+        return now > expire_date
+    except Exception:
+        return True  # Fallback: block if invalid
+
+
+# ----- Startup Orchestrator ----- #
+class StartupOrchestrator:
+    """
+    Run authentication, the trial check and heavy imports concurrently in background threads,
+    so the main window can be built while they are in progress.
+
+    Tk must stay on the main thread, so the caller polls `is_done` (e.g. with `root.after`)
+    and reads the results once the phases it needs have finished.
+    """
+
+    def __init__(self, warmup_modules: tuple[str, ...] = WARMUP_MODULES):
+        """
+        Args:
+            warmup_modules (tuple[str, ...]): Modules to import in the background.
+        """
+        self.warmup_modules = warmup_modules
+        self.started_at = time.perf_counter()
+        self.timings: dict[str, float] = {}
+        self.errors: dict[str, Exception] = {}
+
+        self.auth_result = "undefined"
+        self.trial_expired = False
+
+        self._lock = threading.Lock()
+        self._threads: dict[str, threading.Thread] = {}
+
+    def _run_phase(self, name: str, phase_fn: Callable[[], None]) -> None:
+        start = time.perf_counter()
+        try:
+            phase_fn()
+        except Exception as e:
+            print(f"[ERROR] Startup phase \"{name}\" failed: {e}")
+            with self._lock:
+                self.errors[name] = e
+        finally:
+            self.record(name, start)
+
+    def _warm_imports(self) -> None:
+        for module_name in self.warmup_modules:
+            importlib.import_module(module_name)
+
+    def _check_auth(self) -> None:
+        from botcore.core.auth_manager import auth_manager
+        self.auth_result = auth_manager()
+
+    def _check_trial(self) -> None:
+        self.trial_expired = is_trial_expired()
+
+    def start(self) -> None:
+        """
+        Start all phases in background threads.
+        """
+        phases = {
+            PHASE_IMPORTS: self._warm_imports,
+            PHASE_AUTH: self._check_auth,
+        }
+        if IF_TRIAL_VERSION:
+            phases[PHASE_TRIAL] = self._check_trial
+
+        for name, phase_fn in phases.items():
+            thread = threading.Thread(target=self._run_phase, args=(name, phase_fn), name=f"startup-{name}", daemon=True)
+            self._threads[name] = thread
+            thread.start()
+
+    def is_done(self, *names: str) -> bool:
+        """
+        Check whether the given phases (all phases if none given) have finished.
+
+        Args:
+            *names (str): Phase names.
+
+        Returns:
+            bool: True if none of them is still running.
+        """
+        threads = [self._threads[name] for name in names if name in self._threads] if names else self._threads.values()
+        return not any(thread.is_alive() for thread in threads)
+
+    def record(self, name: str, start: float) -> None:
+        """
+        Record the duration of a phase, including ones run by the caller (e.g. building the window).
+
+        Args:
+            name (str): Phase name.
+            start (float): `time.perf_counter()` value when the phase started.
+        """
+        with self._lock:
+            self.timings[name] = time.perf_counter() - start
+
+    def log_timings(self) -> None:
+        """
+        Write the duration of each phase and the total startup time to the runtime log.
+        """
+        with self._lock:
+            phases = ", ".join(f"{name} {seconds:.2f}s" for name, seconds in self.timings.items())
+        total = time.perf_counter() - self.started_at
+        log_ini(f"Startup finished in {total:.2f}s ({phases}).")
@@ -4,15 +4,17 @@
 # Do not distribute or modify
 # Author: DragonTaki (https://github.com/DragonTaki)
 # Create Date: 2025/04/18
-# Update Date: 2025/05/07
-# Version: v1.5
+# Update Date: 2026/10/19
+# Version: v1.6
 # ----- ----- ----- -----
 
-import json
+import sys
+import threading
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Callable
+from typing import Callable, Optional, Union
 
 from botcore.config.constant import DATETIME_FORMATS
 from botcore.config.settings_manager import get_settings
@@ -21,8 +23,8 @@ settings = get_settings()
 # Logger default color if not specified
 DEFAULT_LOG_COLOR = "white"
 
-# External GUI logger callback
-external_logger: Callable[[str], None] | None = None
+# External GUI logger callback, receives one line as a list of text segments
+external_logger: Callable[[list[dict]], None] | None = None
 
 
 # ----- Log Level Enum ----- #
@@ -87,49 +89,139 @@ class LogRecord:
         """
         return f"{self.timestamp} [{self.level.label}] {self.message}"
 
-    def to_json(self) -> str:
+    def to_segments(self) -> list[dict]:
         """
-        Convert the log record to a JSON format for GUI display.
+        Convert the log record to structured text segments for GUI display.
 
         Returns:
-            str: A JSON string representing the log record.
+            list[dict]: One segment with text, color and tag.
         """
-        return json.dumps({
+        return [{
             "text" : self.to_text(),
             "color": self.level.color or DEFAULT_LOG_COLOR,
             "tag"  : f"tag_{self.level.label}"
-        })
+        }]
+
+
+# ----- Call-site Throttling ----- #
+@dataclass
+class _SiteState:
+    seen: int = 0            # Calls reaching the throttle
+    suppressed: int = 0      # Calls dropped since the last emitted one
+    window_start: float = 0.0
+    window_count: int = 0
+
+
+_site_states: dict = {}
+_site_lock = threading.Lock()
+
+
+def _should_emit(site_key, every_n: int, max_per_sec: Optional[float]) -> tuple[bool, int]:
+    """
+    Apply sampling and rate limiting for one call site.
+
+    Args:
+        site_key: Identifier of the call site.
+        every_n (int): Emit only every n-th call.
+        max_per_sec (float, optional): Maximum emitted calls per second.
+
+    Returns:
+        tuple[bool, int]: Whether to emit, and how many calls were suppressed before this one.
+    """
+    now = time.monotonic()
+    with _site_lock:
+        state = _site_states.setdefault(site_key, _SiteState())
+        state.seen += 1
+
+        allowed = (state.seen - 1) % every_n == 0
+        if allowed and max_per_sec is not None:
+            if now - state.window_start >= 1.0:
+                state.window_start, state.window_count = now, 0
+            allowed = state.window_count < max_per_sec
+
+        if not allowed:
+            state.suppressed += 1
+            return False, 0
+
+        state.window_count += 1
+        suppressed, state.suppressed = state.suppressed, 0
+        return True, suppressed
 
 
 # ----- Main Functions ----- #
-def set_external_logger(callback_fn: Callable[[str], None]) -> None:
+def set_external_logger(callback_fn: Callable[[list[dict]], None]) -> None:
     """
     Assign a callback function for logging to an external GUI.
 
     Args:
-        callback_fn (Callable[[str], None]): A function that accepts a string (log message in JSON format) to display in the GUI.
+        callback_fn (Callable[[list[dict]], None]): A function that accepts one log line as a list of text segments
+            ("text", and optional "color", "tag", "bold", "italic"). It may be called from any thread.
     """
     global external_logger
     external_logger = callback_fn
 
 
-def log(message: str, level: LogLevel = LogLevel.INFO) -> None:
+def is_log_enabled(level: LogLevel) -> bool:
+    """
+    Check whether a message of this level would be emitted, to skip expensive work otherwise.
+
+    Args:
+        level (LogLevel): The severity level.
+
+    Returns:
+        bool: False for DEBUG messages while debug mode is off.
+    """
+    return level != LogLevel.DEBUG or settings.enable_debug_mode
+
+
+def log(
+    message: Union[str, Callable[[], str]],
+    level: LogLevel = LogLevel.INFO,
+    *args,
+    every_n: int = 1,
+    max_per_sec: Optional[float] = None,
+    site: Optional[str] = None
+) -> None:
     """
     Log a message to the console and optionally to an external GUI if the callback is set.
 
+    Formatting is deferred: a callable message, or %-style `args`, are only evaluated if the
+    message is actually emitted. Hot loops can also sample (`every_n`) or rate limit
+    (`max_per_sec`) per call site; the number of suppressed calls is appended to the next emitted one.
+
     Args:
-        message (str): The message to log.
+        message (str | Callable[[], str]): The message to log, a %-format string, or a callable returning it.
         level (LogLevel): The severity level of the log (default is INFO).
+        *args: Values for %-style formatting of `message`.
+        every_n (int): Emit only every n-th call of this call site.
+        max_per_sec (float, optional): Maximum messages per second from this call site.
+        site (str, optional): Call site key. Defaults to the caller's file and line.
     """
-    if level == LogLevel.DEBUG and not settings.enable_debug_mode:
+    if not is_log_enabled(level):
         return
 
+    suppressed = 0
+    if every_n > 1 or max_per_sec is not None:
+        if site is None:
+            caller = sys._getframe(1)
+            site = (caller.f_code.co_filename, caller.f_lineno)
+        emit, suppressed = _should_emit(site, max(every_n, 1), max_per_sec)
+        if not emit:
+            return
+
+    if callable(message):
+        message = message()
+    elif args:
+        message = message % args
+    if suppressed:
+        message = f"{message} ({suppressed} similar messages suppressed)"
+
     record = LogRecord(message=message, level=level)
     print(record.to_text())
 
     if external_logger:
         try:
-            external_logger(record.to_json())
+            external_logger(record.to_segments())
         except Exception as e:
             print(f"[LOGGER ERROR] Failed to send to external logger: {e}")
 
@@ -153,28 +245,28 @@ def log_welcome_message() -> None:
     welcome = "Welcome to use Griffin Empire Attendance Bot!"
     author  = "Author: DragonTaki"
 
-    greeting_json = json.dumps([{
+    greeting_segments = [{
             "text": greeting,
             "color": "lightgreen",
             "bold": True,
             "tag": "greeting_tag"
-        }])
-    welcome_json = json.dumps([{
+        }]
+    welcome_segments = [{
             "text": char,
             "color": pastel_rainbow_colors[i % len(pastel_rainbow_colors)],
             "bold": True,
-            "tag": f"rainbow_{i}"
-        } for i, char in enumerate(welcome)])
-    author_json = json.dumps([{
+            "tag": f"rainbow_{i % len(pastel_rainbow_colors)}"
+        } for i, char in enumerate(welcome)]
+    author_segments = [{
             "text": author,
             "color": "cyan",
             "italic": True,
             "tag": "author_tag"
-        }])
+        }]
 
     try:
-        external_logger(greeting_json)
-        external_logger(welcome_json)
-        external_logger(author_json)
+        external_logger(greeting_segments)
+        external_logger(welcome_segments)
+        external_logger(author_segments)
     except Exception as e:
         print(f"[WELCOME ERROR] Failed to send welcome message: {e}")
@@ -4,15 +4,22 @@
 # Do not distribute or modify
 # Author: DragonTaki (https://github.com/DragonTaki)
 # Create Date: 2025/04/23
-# Update Date: 2025/04/26
-# Version: v1.4
+# Update Date: 2026/10/19
+# Version: v1.5
 # ----- ----- ----- -----
 
+import gzip
 import os
 import platform
-import msvcrt
+import queue
+import shutil
+import threading
+import time
 from datetime import datetime
 
+if platform.system() == "Windows":
+    import msvcrt  # Windows only; keeps the headless CLI importable on Linux
+
 from botcore.config.constant import EXTENSIONS, DATETIME_FORMATS, TEXTFILE_ENCODING
 from botcore.config.settings_manager import get_settings
 settings = get_settings()
@@ -55,12 +62,159 @@ def _get_log_file_path(log_type: str) -> str:
 # Persistent log paths
 RUNTIME_LOG_PATH = _get_log_file_path("runtime")  # One persistent runtime log file
 
-# Runtime log file handle (shared during runtime)
-try:
-    _log_file = open(RUNTIME_LOG_PATH, "a", encoding=TEXTFILE_ENCODING)
-except Exception as e:
-    print(f"[Logger] Failed to initialize runtime log: {e}")
-    _log_file = None
+# Background writer
+LOG_FLUSH_INTERVAL_SEC = 1.0        # Flush at least this often while lines are pending
+LOG_FLUSH_MAX_BUFFERED = 64 * 1024  # Flush early once this many characters are pending
+LOG_ROTATE_MAX_BYTES = 5 * 1024 * 1024
+LOG_ROTATE_BACKUPS = 5              # Compressed parts kept per runtime log
+LOG_SHUTDOWN_TIMEOUT_SEC = 5.0
+
+
+# ----- Runtime Log Writer ----- #
+class RuntimeLogWriter:
+    """
+    Queue-based writer of the runtime log.
+
+    Producers only enqueue lines. One background thread writes them in batches to a persistent
+    file handle, flushes periodically or when enough is buffered, and rotates the file by size,
+    compressing full parts with gzip.
+    """
+
+    _STOP = object()
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): Runtime log file path.
+        """
+        self.path = path
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._file = None
+        self._part = 0
+        self._thread = threading.Thread(target=self._run, name="runtime-log-writer", daemon=True)
+        self._closed = False
+
+    def start(self) -> None:
+        """
+        Open the log file and start the writer thread.
+        """
+        try:
+            self._file = open(self.path, "a", encoding=TEXTFILE_ENCODING)
+        except Exception as e:
+            print(f"[Logger] Failed to initialize runtime log: {e}")
+        self._thread.start()
+
+    def write(self, line: str) -> None:
+        """
+        Enqueue one line. Never blocks on disk I/O.
+
+        Args:
+            line (str): Line without trailing newline.
+        """
+        if not self._closed:
+            self._queue.put(line)
+
+    def close(self, timeout: float = LOG_SHUTDOWN_TIMEOUT_SEC) -> None:
+        """
+        Write all pending lines, then close the file.
+
+        Args:
+            timeout (float): Maximum seconds to wait for the writer thread.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(self._STOP)
+        if self._thread.is_alive():
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        pending: list[str] = []
+        pending_size = 0
+        last_flush = time.monotonic()
+        running = True
+
+        while running:
+            timeout = max(LOG_FLUSH_INTERVAL_SEC - (time.monotonic() - last_flush), 0) if pending else None
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            # Drain everything already queued into one batch
+            while item is not None:
+                if item is self._STOP:
+                    running = False
+                    break
+                pending.append(item)
+                pending_size += len(item) + 1
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    item = None
+
+            if pending and (not running or pending_size >= LOG_FLUSH_MAX_BUFFERED
+                            or time.monotonic() - last_flush >= LOG_FLUSH_INTERVAL_SEC):
+                self._write_batch(pending)
+                pending, pending_size = [], 0
+                last_flush = time.monotonic()
+
+        if self._file:
+            try:
+                self._file.close()
+            except Exception as e:
+                print(f"[Logger] Failed to close log file: {e}")
+            self._file = None
+
+    def _write_batch(self, lines: list[str]) -> None:
+        if not self._file:
+            return
+        try:
+            self._file.write("".join(line + "\n" for line in lines))
+            self._file.flush()
+            if self._file.tell() >= LOG_ROTATE_MAX_BYTES:
+                self._rotate()
+        except Exception as e:
+            print(f"[Logger] Failed to write log: {e}")
+
+    def _rotate(self) -> None:
+        """
+        Compress the current file into the next numbered part and start a new, empty file.
+
+        The file is only truncated once its lines are archived: if compression fails it is
+        renamed to an uncompressed part, and if that fails too, writing continues in it.
+        """
+        self._file.close()
+        self._part += 1
+        base, ext = os.path.splitext(self.path)
+        part_path = f"{base}_part{self._part}{ext}"
+        try:
+            with open(self.path, "rb") as src, gzip.open(part_path + ".gz", "wb") as dst:
+                shutil.copyfileobj(src, dst)
+        except Exception as e:
+            print(f"[Logger] Failed to compress rotated log: {e}")
+            if os.path.exists(part_path + ".gz"):
+                os.remove(part_path + ".gz")
+            try:
+                os.replace(self.path, part_path)
+            except OSError as e:
+                print(f"[Logger] Failed to rotate log, continuing in the same file: {e}")
+                self._part -= 1
+                self._file = open(self.path, "a", encoding=TEXTFILE_ENCODING)
+                return
+
+        # Drop the oldest parts beyond the retention limit
+        expired_part = self._part - LOG_ROTATE_BACKUPS
+        if expired_part > 0:
+            for expired_path in (f"{base}_part{expired_part}{ext}.gz", f"{base}_part{expired_part}{ext}"):
+                if os.path.exists(expired_path):
+                    os.remove(expired_path)
+        self._file = open(self.path, "w", encoding=TEXTFILE_ENCODING)
+
+
+# Runtime log writer (shared during runtime)
+_log_writer = RuntimeLogWriter(RUNTIME_LOG_PATH)
+_log_writer.start()
 
 
 def _initialize_runtime_log() -> None:
@@ -75,17 +229,13 @@ def _initialize_runtime_log() -> None:
 # ----- Main Functions ----- #
 def shutdown_runtime_log() -> None:
     """
-    Shuts down the runtime logger, closing the log file.
+    Shuts down the runtime logger, writing all pending lines and closing the log file.
     Unlocks the file on Windows if necessary.
     """
     append_runtime_log("Logger shutting down.")
+    _log_writer.close()  # Flushes all pending lines
     if platform.system() == "Windows":
         unlock_log_file_windows()
-    if _log_file:
-        try:
-            _log_file.close()
-        except Exception as e:
-            print(f"[Logger] Failed to close log file: {e}")
 
 
 def log_ini(message: str) -> None:
@@ -104,15 +254,12 @@ def log_ini(message: str) -> None:
 def append_runtime_log(message: str) -> None:
     """
     Appends a message to the runtime log file.
+    The line is queued and written by the background writer.
 
     Args:
         message (str): The message to be appended to the log.
     """
-    try:
-        with open(RUNTIME_LOG_PATH, "a", encoding=TEXTFILE_ENCODING) as log_file:
-            log_file.write(message.strip() + "\n")
-    except Exception as e:
-        print(f"[Logger] Failed to write log: {e}")
+    _log_writer.write(message.strip())
 
 
 def save_log(log_lines: list[str]) -> str:
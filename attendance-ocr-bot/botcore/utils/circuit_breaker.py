@@ -0,0 +1,103 @@
+# ----- ----- ----- -----
+# circuit_breaker.py
+# For Albion Online "Griffin Empire" Guild only
+# Do not distribute or modify
+# Author: DragonTaki (https://github.com/DragonTaki)
+# Create Date: 2026/10/19
+# Update Date: 2026/10/19
+# Version: v1.0
+# ----- ----- ----- -----
+
+import threading
+import time
+from enum import Enum
+
+
+# ----- Circuit State Enum ----- #
+class CircuitState(Enum):
+    CLOSED    = "closed"     # Requests flow normally
+    OPEN      = "open"       # Requests fail fast until the cooldown ends
+    HALF_OPEN = "half_open"  # A single probe request decides whether to close again
+
+
+# ----- Circuit Breaker ----- #
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker for a single host.
+
+    After `failure_threshold` consecutive failures the circuit opens and requests are rejected
+    without touching the network. Once `cooldown_sec` has passed, one probe request is let
+    through (half-open): success closes the circuit, failure opens it for another cooldown.
+    """
+
+    def __init__(self, failure_threshold: int, cooldown_sec: float):
+        """
+        Args:
+            failure_threshold (int): Consecutive failures needed to open the circuit.
+            cooldown_sec (float): Seconds to stay open before allowing a probe.
+        """
+        self.failure_threshold = max(int(failure_threshold), 1)
+        self.cooldown_sec = cooldown_sec
+        self.state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        """
+        Check whether a request may be sent now.
+
+        Returns:
+            bool: False if the circuit is open (fail fast), True otherwise.
+        """
+        with self._lock:
+            if self.state == CircuitState.CLOSED:
+                return True
+
+            if self.state == CircuitState.OPEN:
+                if time.monotonic() - self._opened_at < self.cooldown_sec:
+                    return False
+                self.state = CircuitState.HALF_OPEN
+                self._probe_in_flight = False
+
+            # Half-open: only one probe at a time
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        """
+        Record a healthy response and close the circuit.
+        """
+        with self._lock:
+            self._failures = 0
+            self._probe_in_flight = False
+            self.state = CircuitState.CLOSED
+
+    def release_probe(self) -> None:
+        """
+        Give up the half-open probe without a verdict, e.g. when the request never reached the host,
+        so the next request probes instead of the circuit staying half-open forever.
+        """
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_failure(self) -> bool:
+        """
+        Record a failed request (5xx, 429 or connection error).
+
+        Returns:
+            bool: True if this failure opened the circuit.
+        """
+        with self._lock:
+            self._failures += 1
+            self._probe_in_flight = False
+
+            if self.state == CircuitState.HALF_OPEN or self._failures >= self.failure_threshold:
+                was_open = self.state == CircuitState.OPEN
+                self.state = CircuitState.OPEN
+                self._opened_at = time.monotonic()
+                return not was_open
+            return False
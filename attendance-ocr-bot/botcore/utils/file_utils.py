@@ -4,8 +4,8 @@
 # Do not distribute or modify
 # Author: DragonTaki (https://github.com/DragonTaki)
 # Create Date: 2025/04/18
-# Update Date: 2025/05/01
-# Version: v1.5
+# Update Date: 2026/10/19
+# Version: v1.6
 # ----- ----- ----- -----
 
 import hashlib
@@ -23,6 +23,7 @@ from botcore.logging.app_logger import log, LogLevel
 
 # ----- Constants ----- #
 DEFAULT_HASH_LENGTH = 16  # Length for generated file hash
+CHECKSUM_CHUNK_SIZE = 1024 * 1024  # Bytes read at a time when hashing a file
 
 
 # ---- File and Folder Related Functions ---- #
@@ -144,8 +145,12 @@ def get_file_checksum(filepath: str) -> str:
     Returns:
         str: The MD5 checksum of the file.
     """
+    md5 = hashlib.md5()
     with open(filepath, "rb") as f:
-        return hashlib.md5(f.read()).hexdigest()
+        # Read in chunks so large files (e.g. recordings) are not loaded into memory at once
+        for chunk in iter(lambda: f.read(CHECKSUM_CHUNK_SIZE), b""):
+            md5.update(chunk)
+    return md5.hexdigest()
 
 
 def check_file_checksum(filepath: str, expected_checksum: str) -> bool:
@@ -0,0 +1,317 @@
+# ----- ----- ----- -----
+# http_cache.py
+# For Albion Online "Griffin Empire" Guild only
+# Do not distribute or modify
+# Author: DragonTaki (https://github.com/DragonTaki)
+# Create Date: 2026/10/19
+# Update Date: 2026/10/19
+# Version: v1.0
+# ----- ----- ----- -----
+
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Iterable, Iterator, Optional
+
+from botcore.config.constant import TEXTFILE_ENCODING
+from botcore.config.settings_manager import get_settings
+settings = get_settings()
+from botcore.logging.app_logger import log, LogLevel
+from .file_utils import ensure_folder_exists
+from .json_stream import iter_file_chunks
+
+
+# ----- Constants ----- #
+HTTP_CACHE_SUBFOLDER = "http"  # Under settings.folder_paths.cache, apart from CacheType files
+META_EXTENSION = ".meta"
+BODY_EXTENSION = ".body"
+KEY_HASH_LENGTH = 24
+
+# Seconds a stored body is served without asking the server, matched by URL prefix.
+# After that the entry is revalidated with a conditional request.
+ENDPOINT_TTL_SEC = {
+    "https://gameinfo-sgp.albiononline.com/api/gameinfo/guilds/": 15 * 60,
+    "https://api-east.albionbattles.com/": 10 * 60,
+}
+DEFAULT_TTL_SEC = 0  # Always revalidate
+
+
+# ----- Dataclass for a Cache Entry ----- #
+@dataclass
+class CachedResponse:
+    """
+    Metadata of one stored response. The body lives next to it in a separate file.
+    """
+    url: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+    ttl_sec: float
+
+    def is_fresh(self) -> bool:
+        """
+        Returns:
+            bool: True if the entry can be used without contacting the server.
+        """
+        return time.time() - self.fetched_at < self.ttl_sec
+
+    def conditional_headers(self) -> dict:
+        """
+        Build the validators for a conditional GET.
+
+        Returns:
+            dict: `If-None-Match` / `If-Modified-Since` headers, if known.
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+# ----- Helper Functions ----- #
+def ttl_for_url(url: str) -> float:
+    """
+    Find the configured TTL of an endpoint.
+
+    Args:
+        url (str): The requested URL.
+
+    Returns:
+        float: TTL in seconds.
+    """
+    for prefix, ttl in ENDPOINT_TTL_SEC.items():
+        if url.startswith(prefix):
+            return ttl
+    return DEFAULT_TTL_SEC
+
+
+# ----- HTTP Response Cache ----- #
+class HttpResponseCache:
+    """
+    Persistent cache of raw HTTP response bodies with their ETag / Last-Modified validators.
+    """
+
+    def __init__(self, cache_dir: str):
+        """
+        Args:
+            cache_dir (str): Folder where entries are stored.
+        """
+        self.cache_dir = cache_dir
+        self._lock = threading.Lock()
+
+    def _paths(self, url: str) -> tuple[str, str]:
+        key = hashlib.sha256(url.encode(TEXTFILE_ENCODING)).hexdigest()[:KEY_HASH_LENGTH]
+        base = os.path.join(self.cache_dir, key)
+        return base + META_EXTENSION, base + BODY_EXTENSION
+
+    def _write_meta(self, meta_path: str, entry: CachedResponse) -> None:
+        tmp_path = f"{meta_path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding=TEXTFILE_ENCODING) as f:
+            json.dump(asdict(entry), f)
+        os.replace(tmp_path, meta_path)
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """
+        Load the stored entry of a URL.
+
+        Args:
+            url (str): The requested URL.
+
+        Returns:
+            CachedResponse | None: The entry, or None if missing or unreadable.
+        """
+        meta_path, body_path = self._paths(url)
+        if not os.path.exists(meta_path) or not os.path.exists(body_path):
+            return None
+
+        try:
+            with open(meta_path, "r", encoding=TEXTFILE_ENCODING) as f:
+                entry = CachedResponse(**json.load(f))
+        except Exception as e:
+            log(f"Ignoring broken HTTP cache entry for {url}: {e}", LogLevel.DEBUG)
+            return None
+
+        return entry if entry.url == url else None
+
+    def body_path(self, entry: CachedResponse) -> str:
+        """
+        Args:
+            entry (CachedResponse): A stored entry.
+
+        Returns:
+            str: Path of the stored body file.
+        """
+        return self._paths(entry.url)[1]
+
+    def read_body(self, entry: CachedResponse) -> bytes:
+        """
+        Args:
+            entry (CachedResponse): A stored entry.
+
+        Returns:
+            bytes: The stored response body.
+        """
+        with open(self.body_path(entry), "rb") as f:
+            return f.read()
+
+    def iter_body(self, entry: CachedResponse) -> Iterator[bytes]:
+        """
+        Read the stored body in chunks, for streaming decoders.
+
+        Args:
+            entry (CachedResponse): A stored entry.
+
+        Yields:
+            bytes: Body chunks.
+        """
+        yield from iter_file_chunks(self.body_path(entry))
+
+    def store(self, url: str, response_headers: dict, body: bytes, ttl_sec: float) -> CachedResponse:
+        """
+        Store a fresh (200) response.
+
+        Args:
+            url (str): The requested URL.
+            response_headers (dict): Response headers, used for ETag / Last-Modified.
+            body (bytes): The decoded response body.
+            ttl_sec (float): Seconds the body may be served without revalidation.
+
+        Returns:
+            CachedResponse: The stored entry.
+        """
+        meta_path, body_path = self._paths(url)
+        entry = CachedResponse(
+            url=url,
+            etag=response_headers.get("ETag"),
+            last_modified=response_headers.get("Last-Modified"),
+            fetched_at=time.time(),
+            ttl_sec=ttl_sec,
+        )
+
+        with self._lock:
+            ensure_folder_exists(self.cache_dir)
+            tmp_path = f"{body_path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(body)
+            os.replace(tmp_path, body_path)
+            self._write_meta(meta_path, entry)
+        return entry
+
+    def iter_store(self, url: str, response_headers: dict, chunks: Iterable[bytes], ttl_sec: float) -> Iterator[bytes]:
+        """
+        Pass body chunks through while writing them to the cache.
+
+        The entry is committed only once the whole body has been read, so a broken or
+        abandoned stream never replaces a good stored body.
+
+        Args:
+            url (str): The requested URL.
+            response_headers (dict): Response headers, used for ETag / Last-Modified.
+            chunks (Iterable[bytes]): Body chunks from the response.
+            ttl_sec (float): Seconds the body may be served without revalidation.
+
+        Yields:
+            bytes: The same body chunks.
+        """
+        meta_path, body_path = self._paths(url)
+        ensure_folder_exists(self.cache_dir)
+        tmp_path = f"{body_path}.{threading.get_ident()}.tmp"
+        completed = False
+
+        try:
+            with open(tmp_path, "wb") as f:
+                for chunk in chunks:
+                    f.write(chunk)
+                    yield chunk
+            completed = True
+        finally:
+            if completed:
+                entry = CachedResponse(
+                    url=url,
+                    etag=response_headers.get("ETag"),
+                    last_modified=response_headers.get("Last-Modified"),
+                    fetched_at=time.time(),
+                    ttl_sec=ttl_sec,
+                )
+                with self._lock:
+                    os.replace(tmp_path, body_path)
+                    self._write_meta(meta_path, entry)
+            elif os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def refresh(self, entry: CachedResponse, response_headers: dict, ttl_sec: float) -> CachedResponse:
+        """
+        Mark an entry as revalidated after a 304 Not Modified response.
+
+        Args:
+            entry (CachedResponse): The stored entry.
+            response_headers (dict): Headers of the 304 response (may carry new validators).
+            ttl_sec (float): New TTL of the entry.
+
+        Returns:
+            CachedResponse: The updated entry.
+        """
+        entry.etag = response_headers.get("ETag") or entry.etag
+        entry.last_modified = response_headers.get("Last-Modified") or entry.last_modified
+        entry.fetched_at = time.time()
+        entry.ttl_sec = ttl_sec
+
+        with self._lock:
+            self._write_meta(self._paths(entry.url)[0], entry)
+        return entry
+
+    def clear(self) -> int:
+        """
+        Remove all stored responses.
+
+        Returns:
+            int: Number of deleted files.
+        """
+        if not os.path.isdir(self.cache_dir):
+            return 0
+
+        deleted_count = 0
+        with self._lock:
+            for filename in os.listdir(self.cache_dir):
+                if not filename.endswith((META_EXTENSION, BODY_EXTENSION)):
+                    continue
+                try:
+                    os.remove(os.path.join(self.cache_dir, filename))
+                    deleted_count += 1
+                except OSError as e:
+                    log(f"Failed to remove HTTP cache file \"{filename}\": {e}", LogLevel.ERROR)
+        return deleted_count
+
+
+# ----- Main Functions ----- #
+_cache_instance: Optional[HttpResponseCache] = None
+_cache_lock = threading.Lock()
+
+def get_response_cache() -> HttpResponseCache:
+    """
+    Get the shared HTTP response cache stored under `settings.folder_paths.cache`.
+
+    Returns:
+        HttpResponseCache: The shared cache instance.
+    """
+    global _cache_instance
+    if _cache_instance is None:
+        with _cache_lock:
+            if _cache_instance is None:
+                _cache_instance = HttpResponseCache(os.path.join(settings.folder_paths.cache, HTTP_CACHE_SUBFOLDER))
+    return _cache_instance
+
+
+def clear_response_cache() -> int:
+    """
+    Remove all stored HTTP responses.
+
+    Returns:
+        int: Number of deleted files.
+    """
+    return get_response_cache().clear()
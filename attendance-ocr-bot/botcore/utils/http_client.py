@@ -0,0 +1,556 @@
+# ----- ----- ----- -----
+# http_client.py
+# For Albion Online "Griffin Empire" Guild only
+# Do not distribute or modify
+# Author: DragonTaki (https://github.com/DragonTaki)
+# Create Date: 2026/10/19
+# Update Date: 2026/10/19
+# Version: v1.1
+# ----- ----- ----- -----
+
+import json
+import random
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Iterator, Optional, Sequence, Union
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from botcore.config.settings_manager import get_settings
+settings = get_settings()
+from botcore.logging.app_logger import log, LogLevel
+from .circuit_breaker import CircuitBreaker
+from .http_cache import HttpResponseCache, get_response_cache, ttl_for_url
+from .json_stream import STREAM_CHUNK_SIZE, JsonStreamError, iter_json_array, iter_projected
+from .metrics import counter, histogram
+from .rate_limiter import HostRateLimiter
+
+
+# ----- Constants ----- #
+# Fallback values, the effective ones come from `settings.network`
+# Timeouts (seconds)
+CONNECT_TIMEOUT_SEC = 5.0
+READ_TIMEOUT_SEC = 30.0
+
+# Connection pool
+POOL_CONNECTIONS = 8  # Number of distinct hosts kept in the pool
+POOL_MAXSIZE = 8      # Keep-alive connections kept per host
+MAX_CONCURRENT_PER_HOST = 4  # In-flight requests allowed per host
+
+# Retry policy
+MAX_RETRIES = 3
+BACKOFF_BASE_SEC = 1.0
+BACKOFF_MAX_SEC = 30.0
+RETRY_AFTER_MAX_SEC = 120.0
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Rate limiting and circuit breaking
+DEFAULT_RATE_LIMIT_KEY = "default"
+DEFAULT_RATE_PER_SEC = 2.0
+DEFAULT_BURST = 4
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_COOLDOWN_SEC = 60.0
+
+DEFAULT_HEADERS = {
+    "Accept-Encoding": "gzip, deflate",
+    "Connection": "keep-alive",
+    "User-Agent": "GriffinEmpire-AttendanceBot",
+}
+
+# Metrics
+HTTP_REQUESTS = counter("http_requests_total", "HTTP request attempts by host and outcome.", ("host", "outcome"))
+HTTP_RETRIES = counter("http_retries_total", "HTTP attempts retried after a failure.", ("host",))
+HTTP_LATENCY = histogram("http_request_duration_seconds", "HTTP response latency (until headers).", ("host",))
+HTTP_RESPONSE_CACHE = counter("http_response_cache_total", "Response cache lookups by result.", ("result",))
+
+
+# ----- Helper Functions ----- #
+def _report(message: str, level: LogLevel, use_logger: bool) -> None:
+    """
+    Send a message to the app logger, or print it when the logger is not usable yet (pre-login).
+
+    Args:
+        message (str): The message to report.
+        level (LogLevel): Log level used when the logger is enabled.
+        use_logger (bool): If False, fallback to print.
+    """
+    if use_logger:
+        log(message, level)
+    else:
+        print(message)
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a `Retry-After` header value, which is either delay seconds or an HTTP date.
+
+    Args:
+        value (str | None): Raw header value.
+
+    Returns:
+        float | None: Seconds to wait, or None if missing or invalid.
+    """
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def compute_backoff(attempt: int, base_sec: float, max_sec: float, retry_after: Optional[float] = None) -> float:
+    """
+    Compute the delay before the next attempt using exponential backoff with full jitter.
+    A server provided `Retry-After` is always honoured as the lower bound.
+
+    Args:
+        attempt (int): The attempt that just failed (starting at 1).
+        base_sec (float): Base delay for the first retry.
+        max_sec (float): Upper bound of the exponential part.
+        retry_after (float, optional): Delay requested by the server.
+
+    Returns:
+        float: Seconds to sleep before the next attempt.
+    """
+    ceiling = min(max_sec, base_sec * (2 ** (attempt - 1)))
+    delay = random.uniform(0, ceiling)
+    if retry_after is not None:
+        delay = max(delay, min(retry_after, RETRY_AFTER_MAX_SEC))
+    return delay
+
+
+def _rate_limit_for_host(host: str) -> tuple[float, int]:
+    """
+    Look up the token bucket limits of a host in `settings.network.rate_limit`.
+
+    Args:
+        host (str): Host name, e.g. "api-east.albionbattles.com".
+
+    Returns:
+        tuple[float, int]: (rate_per_sec, burst)
+    """
+    rate_limits = getattr(settings.network, "rate_limit", None)
+    limit = getattr(rate_limits, host, None) or getattr(rate_limits, DEFAULT_RATE_LIMIT_KEY, None)
+    if limit is None:
+        return DEFAULT_RATE_PER_SEC, DEFAULT_BURST
+    return (
+        float(getattr(limit, "rate_per_sec", DEFAULT_RATE_PER_SEC)),
+        int(getattr(limit, "burst", DEFAULT_BURST)),
+    )
+
+
+# ----- Throttle Metrics ----- #
+class ThrottleMetrics:
+    """
+    Per-host counters of throttling events, shared by all threads.
+    """
+
+    FIELDS = ("rate_limited", "rate_limited_wait_sec", "http_429", "http_5xx", "circuit_opened", "circuit_rejected")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: dict[str, dict[str, float]] = defaultdict(lambda: dict.fromkeys(self.FIELDS, 0))
+
+    def add(self, host: str, field: str, amount: float = 1) -> None:
+        with self._lock:
+            self._counters[host][field] += amount
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        """
+        Returns:
+            dict[str, dict[str, float]]: A copy of the counters keyed by host.
+        """
+        with self._lock:
+            return {host: dict(counters) for host, counters in self._counters.items()}
+
+
+# ----- HTTP Client ----- #
+class HttpClient:
+    """
+    Shared HTTP client with per-host connection pooling, keep-alive, timeouts,
+    retry with exponential backoff, and per-host rate limiting and circuit breaking.
+    """
+
+    def __init__(
+        self,
+        connect_timeout: float = CONNECT_TIMEOUT_SEC,
+        read_timeout: float = READ_TIMEOUT_SEC,
+        max_retries: int = MAX_RETRIES,
+        backoff_base: float = BACKOFF_BASE_SEC,
+        backoff_max: float = BACKOFF_MAX_SEC,
+        max_concurrent_per_host: int = MAX_CONCURRENT_PER_HOST,
+        breaker_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        breaker_cooldown_sec: float = BREAKER_COOLDOWN_SEC,
+        response_cache: Optional[HttpResponseCache] = None,
+    ):
+        """
+        Initialize the client and its pooled session.
+
+        Args:
+            connect_timeout (float): Seconds to wait for a connection to be established.
+            read_timeout (float): Seconds to wait between bytes from the server.
+            max_retries (int): Default number of attempts per request.
+            backoff_base (float): Default base delay for exponential backoff.
+            backoff_max (float): Maximum delay of the exponential part.
+            max_concurrent_per_host (int): In-flight requests allowed per host across all threads.
+            breaker_threshold (int): Consecutive 5xx/429/connection failures that open a host's circuit.
+            breaker_cooldown_sec (float): Seconds a circuit stays open before a probe is allowed.
+            response_cache (HttpResponseCache, optional): Cache for conditional GETs. Defaults to the shared one.
+        """
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_concurrent_per_host = max_concurrent_per_host
+
+        self._host_slots: dict[str, threading.BoundedSemaphore] = {}
+        self._host_slots_lock = threading.Lock()
+
+        self.metrics = ThrottleMetrics()
+        self._rate_limiter = HostRateLimiter(_rate_limit_for_host)
+        self._breaker_threshold = breaker_threshold
+        self._breaker_cooldown_sec = breaker_cooldown_sec
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._breakers_lock = threading.Lock()
+        self._response_cache = response_cache
+
+        self._session = requests.Session()
+        self._session.headers.update(DEFAULT_HEADERS)
+
+        # Retries are handled by `request` so every attempt is logged
+        adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, max_retries=0)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+    @contextmanager
+    def _host_slot(self, url: str) -> Iterator[None]:
+        """
+        Hold one of the per-host concurrency slots while a request is in flight.
+
+        Args:
+            url (str): The URL being requested; its host selects the slot pool.
+        """
+        host = urlsplit(url).netloc.lower()
+        with self._host_slots_lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = threading.BoundedSemaphore(self.max_concurrent_per_host)
+                self._host_slots[host] = slot
+
+        with slot:
+            yield
+
+    def _breaker_for(self, host: str) -> CircuitBreaker:
+        with self._breakers_lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = CircuitBreaker(self._breaker_threshold, self._breaker_cooldown_sec)
+                self._breakers[host] = breaker
+            return breaker
+
+    def _record_failure(self, host: str, breaker: CircuitBreaker, use_logger: bool) -> None:
+        if breaker.record_failure():
+            self.metrics.add(host, "circuit_opened")
+            _report(f"Too many failures from {host}, pausing requests for {self._breaker_cooldown_sec:.0f}s.", LogLevel.WARN, use_logger)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[dict] = None,
+        context: str = "",
+        use_logger: bool = True,
+        retries: Optional[int] = None,
+        backoff_base: Optional[float] = None,
+        timeout: Optional[tuple[float, float]] = None,
+        stream: bool = False,
+    ) -> Optional[requests.Response]:
+        """
+        Send a request, retrying on connection errors and retryable status codes.
+
+        Args:
+            method (str): HTTP method, e.g. "GET".
+            url (str): The URL to request.
+            headers (dict, optional): Extra headers for this request.
+            context (str): Human-readable context for log messages.
+            use_logger (bool): If False, fallback to print instead of GUI logger (for pre-login).
+            retries (int, optional): Number of attempts. Defaults to the client setting.
+            backoff_base (float, optional): Base backoff delay. Defaults to the client setting.
+            timeout (tuple[float, float], optional): (connect, read) timeout override.
+            stream (bool): Whether to defer downloading the response body.
+
+        Returns:
+            requests.Response | None: The successful (2xx) response, or None on failure.
+        """
+        retries = retries or self.max_retries
+        backoff_base = self.backoff_base if backoff_base is None else backoff_base
+        label = context or url
+        host = urlsplit(url).netloc.lower()
+        breaker = self._breaker_for(host)
+
+        for attempt in range(1, retries + 1):
+            if not breaker.allow_request():
+                self.metrics.add(host, "circuit_rejected")
+                HTTP_REQUESTS.inc(host=host, outcome="circuit_rejected")
+                _report(f"Skipped request to {label}: {host} is temporarily unavailable.", LogLevel.WARN, use_logger)
+                return None
+
+            retry_after = None
+            try:
+                waited = self._rate_limiter.acquire(host)
+                if waited > 0:
+                    self.metrics.add(host, "rate_limited")
+                    self.metrics.add(host, "rate_limited_wait_sec", waited)
+
+                with self._host_slot(url):
+                    request_start = time.perf_counter()
+                    response = self._session.request(
+                        method, url, headers=headers or {}, timeout=timeout or self.timeout, stream=stream
+                    )
+                    HTTP_LATENCY.observe(time.perf_counter() - request_start, host=host)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                HTTP_REQUESTS.inc(host=host, outcome="connection_error")
+                self._record_failure(host, breaker, use_logger)
+                _report(f"Exception during request to {label}: {e} (Attempt {attempt}/{retries}).", LogLevel.ERROR, use_logger)
+            except requests.RequestException as e:
+                # The request itself is invalid (bad URL, too many redirects, ...): no verdict on the host
+                breaker.release_probe()
+                HTTP_REQUESTS.inc(host=host, outcome="request_error")
+                _report(f"Request to {label} failed: {e}.", LogLevel.ERROR, use_logger)
+                return None
+            except BaseException:
+                breaker.release_probe()  # Cancelled or interrupted: let the next request probe
+                raise
+            else:
+                if response.ok:
+                    HTTP_REQUESTS.inc(host=host, outcome="ok")
+                    breaker.record_success()
+                    return response
+
+                HTTP_REQUESTS.inc(host=host, outcome=f"http_{response.status_code}")
+
+                _report(f"HTTP {response.status_code} error while fetching {label} (Attempt {attempt}/{retries}).", LogLevel.ERROR, use_logger)
+                retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+                response.close()
+                if response.status_code not in RETRY_STATUS_CODES:
+                    breaker.record_success()  # Host is alive, the request itself is wrong
+                    return None
+
+                self.metrics.add(host, "http_429" if response.status_code == 429 else "http_5xx")
+                self._record_failure(host, breaker, use_logger)
+
+            if attempt < retries:
+                HTTP_RETRIES.inc(host=host)
+                time.sleep(compute_backoff(attempt, backoff_base, self.backoff_max, retry_after))
+
+        return None
+
+    @property
+    def response_cache(self) -> HttpResponseCache:
+        if self._response_cache is None:
+            self._response_cache = get_response_cache()
+        return self._response_cache
+
+    def _fetch_body_cached(self, url: str, ttl_sec: Optional[float], **kwargs) -> Optional[bytes]:
+        """
+        Get a response body through the response cache.
+
+        A fresh entry is served without a request. Otherwise a conditional GET is sent and the stored
+        body is reused on 304 Not Modified. If the server cannot be reached, a stale body is served.
+
+        Args:
+            url (str): The URL to request.
+            ttl_sec (float, optional): TTL of the stored body. Defaults to the endpoint TTL.
+            **kwargs: Forwarded to `request`.
+
+        Returns:
+            bytes | None: The response body, or None on failure.
+        """
+        cache = self.response_cache
+        ttl_sec = ttl_for_url(url) if ttl_sec is None else ttl_sec
+        entry = cache.get(url)
+
+        if entry and entry.is_fresh():
+            HTTP_RESPONSE_CACHE.inc(result="fresh")
+            return cache.read_body(entry)
+
+        headers = dict(kwargs.pop("headers", None) or {})
+        if entry:
+            headers.update(entry.conditional_headers())
+
+        response = self.request("GET", url, headers=headers, **kwargs)
+        if response is None:
+            if entry:
+                HTTP_RESPONSE_CACHE.inc(result="stale")
+                _report(f"Using stale cached response for {kwargs.get('context') or url}.", LogLevel.WARN, kwargs.get("use_logger", True))
+                return cache.read_body(entry)
+            return None
+
+        if response.status_code == 304 and entry:
+            HTTP_RESPONSE_CACHE.inc(result="not_modified")
+            cache.refresh(entry, response.headers, ttl_sec)
+            return cache.read_body(entry)
+
+        HTTP_RESPONSE_CACHE.inc(result="miss")
+        body = response.content
+        cache.store(url, response.headers, body, ttl_sec)
+        return body
+
+    def get_json(self, url: str, use_cache: bool = False, ttl_sec: Optional[float] = None, **kwargs) -> Union[dict, list, None]:
+        """
+        Send a GET request and decode the JSON body.
+
+        Args:
+            url (str): The URL to request.
+            use_cache (bool): Whether to go through the conditional-GET response cache.
+            ttl_sec (float, optional): TTL of the cached body. Defaults to the endpoint TTL.
+            **kwargs: Forwarded to `request`.
+
+        Returns:
+            dict | list | None: The parsed JSON data or None on failure.
+        """
+        try:
+            if use_cache:
+                body = self._fetch_body_cached(url, ttl_sec, **kwargs)
+                return None if body is None else json.loads(body)
+
+            response = self.request("GET", url, **kwargs)
+            return None if response is None else response.json()
+        except ValueError as e:
+            _report(f"Invalid JSON received from {kwargs.get('context') or url}: {e}.", LogLevel.ERROR, kwargs.get("use_logger", True))
+            return None
+
+    def _open_body_stream(self, url: str, use_cache: bool, ttl_sec: Optional[float], **kwargs) -> Optional[Iterable[bytes]]:
+        """
+        Send the request and return the body as a lazy chunk iterator, going through the
+        response cache if asked.
+
+        Args:
+            url (str): The URL to request.
+            use_cache (bool): Whether to go through the conditional-GET response cache.
+            ttl_sec (float, optional): TTL of the cached body. Defaults to the endpoint TTL.
+            **kwargs: Forwarded to `request`.
+
+        Returns:
+            Iterable[bytes] | None: Body chunks, or None if the request failed.
+        """
+        cache = self.response_cache if use_cache else None
+        entry = cache.get(url) if cache else None
+        if entry and entry.is_fresh():
+            return cache.iter_body(entry)
+
+        headers = dict(kwargs.pop("headers", None) or {})
+        if entry:
+            headers.update(entry.conditional_headers())
+
+        response = self.request("GET", url, headers=headers, stream=True, **kwargs)
+        if response is None:
+            if entry:
+                _report(f"Using stale cached response for {kwargs.get('context') or url}.", LogLevel.WARN, kwargs.get("use_logger", True))
+                return cache.iter_body(entry)
+            return None
+
+        if response.status_code == 304 and entry:
+            response.close()
+            cache.refresh(entry, response.headers, ttl_sec=ttl_for_url(url) if ttl_sec is None else ttl_sec)
+            return cache.iter_body(entry)
+
+        def iter_response() -> Iterator[bytes]:
+            try:
+                yield from response.iter_content(chunk_size=STREAM_CHUNK_SIZE)
+            except requests.RequestException as e:
+                raise JsonStreamError(f"Stream from {kwargs.get('context') or url} broke: {e}") from e
+            finally:
+                response.close()
+
+        if cache:
+            return cache.iter_store(url, response.headers, iter_response(), ttl_for_url(url) if ttl_sec is None else ttl_sec)
+        return iter_response()
+
+    def stream_json_array(
+        self,
+        url: str,
+        fields: Optional[Sequence[str]] = None,
+        use_cache: bool = False,
+        ttl_sec: Optional[float] = None,
+        **kwargs
+    ) -> Optional[Iterator[dict]]:
+        """
+        Send a GET request for a JSON array and decode it incrementally.
+
+        The request (with retries) happens immediately; decoding happens while the caller iterates,
+        keeping only the projected fields of each record.
+
+        Args:
+            url (str): The URL to request.
+            fields (Sequence[str], optional): Record fields to keep. None keeps whole records.
+            use_cache (bool): Whether to go through the conditional-GET response cache.
+            ttl_sec (float, optional): TTL of the cached body. Defaults to the endpoint TTL.
+            **kwargs: Forwarded to `request`.
+
+        Returns:
+            Iterator[dict] | None: Projected records, or None if the request failed.
+            Iterating raises `JsonStreamError` (a ValueError) if the body is malformed or the stream breaks.
+        """
+        chunks = self._open_body_stream(url, use_cache, ttl_sec, **kwargs)
+        if chunks is None:
+            return None
+        return iter_projected(iter_json_array(chunks), fields)
+
+    def close(self) -> None:
+        """
+        Close all pooled connections.
+        """
+        self._session.close()
+
+
+# ----- Main Functions ----- #
+_client_instance: Optional[HttpClient] = None
+_client_lock = threading.Lock()
+
+def get_http_client() -> HttpClient:
+    """
+    Make sure a single shared client (and connection pool) is used by the whole app.
+
+    Returns:
+        HttpClient: The shared client instance.
+    """
+    global _client_instance
+    if _client_instance is None:
+        with _client_lock:
+            if _client_instance is None:
+                network = settings.network
+                breaker = getattr(network, "circuit_breaker", None)
+                _client_instance = HttpClient(
+                    connect_timeout=float(getattr(network, "connect_timeout_sec", CONNECT_TIMEOUT_SEC)),
+                    read_timeout=float(getattr(network, "read_timeout_sec", READ_TIMEOUT_SEC)),
+                    max_retries=int(getattr(network, "max_retries", MAX_RETRIES)),
+                    breaker_threshold=int(getattr(breaker, "failure_threshold", BREAKER_FAILURE_THRESHOLD)),
+                    breaker_cooldown_sec=float(getattr(breaker, "cooldown_sec", BREAKER_COOLDOWN_SEC)),
+                )
+    return _client_instance
+
+
+def get_throttle_metrics() -> dict[str, dict[str, float]]:
+    """
+    Get the throttling counters (rate limit waits, 429/5xx responses, circuit events) per host.
+
+    Returns:
+        dict[str, dict[str, float]]: Counters keyed by host.
+    """
+    return get_http_client().metrics.snapshot()
@@ -0,0 +1,383 @@
+# ----- ----- ----- -----
+# job_scheduler.py
+# For Albion Online "Griffin Empire" Guild only
+# Do not distribute or modify
+# Author: DragonTaki (https://github.com/DragonTaki)
+# Create Date: 2026/10/19
+# Update Date: 2026/10/19
+# Version: v1.0
+# ----- ----- ----- -----
+
+import contextvars
+import functools
+import itertools
+import threading
+import time
+from enum import Enum
+from typing import Callable, Optional
+
+from botcore.logging.app_logger import LogLevel, log
+
+# ----- Constants ----- #
+DEFAULT_MAX_CONCURRENT_JOBS = 3
+PROGRESS_EVENT_INTERVAL_SEC = 0.1  # Progress events per job are throttled to this rate
+
+# Job names of the bot tasks
+JOB_MEMBERS = "members"
+JOB_KILLBOARD = "killboard"
+JOB_TEXTFILE = "textfile"
+JOB_SCREENSHOT = "screenshot"
+JOB_REPORT = "report"
+JOB_CLEAR_CACHE = "clear_cache"
+JOB_CLEAR_ATTENDANCE_CACHE = "clear_attendance_cache"
+JOB_CLEAR_DAILY_SUMMARY = "clear_daily_summary"
+
+# A job waits for unfinished jobs it depends on that were submitted before it
+JOB_DEPENDENCIES = {
+    JOB_SCREENSHOT: (JOB_MEMBERS,),
+    JOB_REPORT: (JOB_MEMBERS, JOB_KILLBOARD, JOB_TEXTFILE, JOB_SCREENSHOT),
+}
+# Exclusive jobs run alone: they wait for every earlier job, and later jobs wait for them
+EXCLUSIVE_JOBS = {JOB_CLEAR_CACHE, JOB_CLEAR_ATTENDANCE_CACHE, JOB_CLEAR_DAILY_SUMMARY}
+
+
+class JobState(Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    @property
+    def is_finished(self) -> bool:
+        return self in (JobState.DONE, JobState.FAILED, JobState.CANCELLED)
+
+
+class JobCancelledError(BaseException):
+    """
+    Raised inside a job when it was cancelled.
+
+    Derives from BaseException (like asyncio.CancelledError) so the `except Exception`
+    blocks in tasks do not swallow it and the scheduler can mark the job cancelled.
+    """
+
+
+# ----- Cancellation Token ----- #
+class CancellationToken:
+    """
+    Cooperative cancellation flag, checked by long-running loops between work items.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            raise JobCancelledError()
+
+
+# ----- Job ----- #
+class Job:
+    """
+    One scheduled task with its state, progress and cancellation token.
+    """
+
+    _ids = itertools.count(1)
+
+    def __init__(self, name: str, func: Callable[[], object], label: str, depends_on: tuple[str, ...], exclusive: bool):
+        self.id = next(self._ids)
+        self.name = name
+        self.label = label
+        self.func = func
+        self.depends_on = depends_on
+        self.exclusive = exclusive
+        self.token = CancellationToken()
+        self.state = JobState.PENDING
+        self.result: object = None
+        self.error: Optional[BaseException] = None
+        self.submitted_at = time.monotonic()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+        # Progress
+        self.done = 0
+        self.total: Optional[int] = None
+        self.unit = ""
+        self.detail = ""
+        self._progress_started_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._finished = threading.Event()
+        self._last_event_at = 0.0
+        self._notify: Callable[["Job"], None] = lambda job: None
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the job is done, failed or cancelled.
+
+        Returns:
+            bool: True if the job finished within `timeout`.
+        """
+        return self._finished.wait(timeout)
+
+    def set_progress(self, done: int, total: Optional[int] = None, unit: str = "", detail: str = "") -> None:
+        """
+        Set absolute progress. Changing total, unit or detail restarts the throughput measurement.
+        """
+        with self._lock:
+            if (total, unit, detail) != (self.total, self.unit, self.detail) or self._progress_started_at is None:
+                self._progress_started_at = time.monotonic()
+            self.done, self.total, self.unit, self.detail = done, total, unit, detail
+        self._emit_progress()
+
+    def advance(self, n: int = 1) -> None:
+        """
+        Add `n` finished items to the current progress.
+        """
+        with self._lock:
+            if self._progress_started_at is None:
+                self._progress_started_at = time.monotonic()
+            self.done += n
+        self._emit_progress()
+
+    @property
+    def throughput(self) -> Optional[float]:
+        """
+        Items per second since the current progress started.
+        """
+        with self._lock:
+            if self._progress_started_at is None or self.done <= 0:
+                return None
+            elapsed = time.monotonic() - self._progress_started_at
+            return self.done / elapsed if elapsed > 0 else None
+
+    @property
+    def eta_sec(self) -> Optional[float]:
+        rate = self.throughput
+        if not rate or self.total is None:
+            return None
+        return max(self.total - self.done, 0) / rate
+
+    @property
+    def elapsed_sec(self) -> float:
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+    def _emit_progress(self) -> None:
+        now = time.monotonic()
+        if now - self._last_event_at >= PROGRESS_EVENT_INTERVAL_SEC or (self.total is not None and self.done >= self.total):
+            self._last_event_at = now
+            self._notify(self)
+
+
+# ----- Job Context ----- #
+_current_job: contextvars.ContextVar[Optional[Job]] = contextvars.ContextVar("current_job", default=None)
+
+
+def get_current_job() -> Optional[Job]:
+    return _current_job.get()
+
+
+def check_cancelled() -> None:
+    """
+    Raise JobCancelledError if the job running this code was cancelled. No-op outside jobs.
+    """
+    job = _current_job.get()
+    if job is not None:
+        job.token.raise_if_cancelled()
+
+
+def report_progress(done: int, total: Optional[int] = None, unit: str = "", detail: str = "") -> None:
+    """
+    Report progress of the job running this code. No-op outside jobs.
+    """
+    job = _current_job.get()
+    if job is not None:
+        job.set_progress(done, total, unit, detail)
+
+
+def advance_progress(n: int = 1) -> None:
+    job = _current_job.get()
+    if job is not None:
+        job.advance(n)
+
+
+def bind_job_context(func: Callable) -> Callable:
+    """
+    Bind the current job to a function that will run on another thread (e.g., a thread pool),
+    so `check_cancelled()` and progress calls inside it still reach the job.
+    """
+    job = _current_job.get()
+    if job is None:
+        return func
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        token = _current_job.set(job)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _current_job.reset(token)
+    return wrapper
+
+
+# ----- Job Scheduler ----- #
+class JobScheduler:
+    """
+    Runs jobs on worker threads, concurrently where their dependencies allow.
+
+    - A job waits for unfinished jobs (submitted earlier) whose names it depends on.
+    - Only one job per name runs at a time; submitting a name that is already queued or running
+      returns the existing job instead of starting a duplicate.
+    - Listeners receive every state change and throttled progress updates, on the worker thread.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_CONCURRENT_JOBS,
+                 dependencies: Optional[dict[str, tuple[str, ...]]] = None,
+                 exclusive: Optional[set[str]] = None):
+        self.max_workers = max_workers
+        self.dependencies = dependencies or {}
+        self.exclusive = exclusive or set()
+        self._jobs: list[Job] = []
+        self._listeners: list[Callable[[Job], None]] = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, listener: Callable[[Job], None]) -> None:
+        """
+        Register a listener called with the job on every state change and progress update.
+        """
+        self._listeners.append(listener)
+
+    def submit(self, name: str, func: Callable[[], object], label: Optional[str] = None) -> Job:
+        """
+        Queue a job.
+
+        Args:
+            name (str): Job name, used for dependencies and duplicate detection.
+            func (Callable): Task to run.
+            label (str, optional): Display name. Defaults to the job name.
+
+        Returns:
+            Job: The queued job, or the unfinished job with the same name.
+        """
+        with self._lock:
+            for job in self._jobs:
+                if job.name == name and not job.state.is_finished:
+                    return job
+
+            job = Job(name, func, label or name, self.dependencies.get(name, ()), name in self.exclusive)
+            job._notify = self._notify
+            self._jobs.append(job)
+        self._notify(job)
+        self._dispatch()
+        return job
+
+    def cancel(self, job_id: int) -> None:
+        """
+        Request cancellation. A pending job is cancelled immediately; a running job stops at its next check.
+        """
+        with self._lock:
+            job = next((j for j in self._jobs if j.id == job_id), None)
+            if job is None or job.state.is_finished:
+                return
+            job.token.cancel()
+            if job.state == JobState.PENDING:
+                job.state = JobState.CANCELLED
+                job.finished_at = time.monotonic()
+                job._finished.set()
+        self._notify(job)
+        self._dispatch()
+
+    def cancel_all(self) -> None:
+        for job in self.active_jobs():
+            self.cancel(job.id)
+
+    def active_jobs(self) -> list[Job]:
+        with self._lock:
+            return [job for job in self._jobs if not job.state.is_finished]
+
+    def _is_blocked(self, job: Job, earlier: list[Job]) -> bool:
+        for other in earlier:
+            if other.state.is_finished:
+                continue
+            if job.exclusive or other.exclusive or other.name in job.depends_on:
+                return True
+        return False
+
+    def _dispatch(self) -> None:
+        """
+        Start every pending job whose dependencies are finished, up to `max_workers` running jobs.
+        """
+        to_start = []
+        with self._lock:
+            # Forget finished jobs nothing can depend on anymore
+            self._jobs = [job for job in self._jobs if not job.state.is_finished]
+            running = sum(1 for job in self._jobs if job.state == JobState.RUNNING)
+            for index, job in enumerate(self._jobs):
+                if running >= self.max_workers:
+                    break
+                if job.state != JobState.PENDING or self._is_blocked(job, self._jobs[:index]):
+                    continue
+                job.state = JobState.RUNNING
+                job.started_at = time.monotonic()
+                running += 1
+                to_start.append(job)
+
+        for job in to_start:
+            self._notify(job)
+            threading.Thread(target=self._run, args=(job,), name=f"job-{job.name}", daemon=True).start()
+
+    def _run(self, job: Job) -> None:
+        token = _current_job.set(job)
+        state = JobState.DONE
+        try:
+            job.token.raise_if_cancelled()
+            job.result = job.func()
+        except JobCancelledError:
+            state = JobState.CANCELLED
+            log(f"\"{job.label}\" cancelled.", LogLevel.WARN)
+        except Exception as e:
+            state = JobState.FAILED
+            job.error = e
+            log(f"\"{job.label}\" failed: {e}", LogLevel.ERROR)
+        finally:
+            _current_job.reset(token)
+            with self._lock:
+                job.state = state
+                job.finished_at = time.monotonic()
+            job._finished.set()
+            self._notify(job)
+            self._dispatch()
+
+    def _notify(self, job: Job) -> None:
+        for listener in list(self._listeners):
+            try:
+                listener(job)
+            except Exception as e:
+                log(f"Job listener failed: {e}", LogLevel.DEBUG)
+
+
+# ----- Main Functions ----- #
+_scheduler_instance: Optional[JobScheduler] = None
+_scheduler_lock = threading.Lock()
+
+def get_job_scheduler() -> JobScheduler:
+    """
+    Get the shared scheduler for the bot tasks.
+
+    Returns:
+        JobScheduler: The shared scheduler instance.
+    """
+    global _scheduler_instance
+    if _scheduler_instance is None:
+        with _scheduler_lock:
+            if _scheduler_instance is None:
+                _scheduler_instance = JobScheduler(dependencies=JOB_DEPENDENCIES, exclusive=EXCLUSIVE_JOBS)
+    return _scheduler_instance
@@ -0,0 +1,159 @@
+# ----- ----- ----- -----
+# json_stream.py
+# For Albion Online "Griffin Empire" Guild only
+# Do not distribute or modify
+# Author: DragonTaki (https://github.com/DragonTaki)
+# Create Date: 2026/10/19
+# Update Date: 2026/10/19
+# Version: v1.0
+# ----- ----- ----- -----
+
+import codecs
+import json
+import re
+from typing import Any, Iterable, Iterator, Optional, Sequence
+
+
+# ----- Constants ----- #
+STREAM_CHUNK_SIZE = 64 * 1024
+_WHITESPACE = re.compile(r"\s*")
+_CONTAINER_STARTS = "{[\""  # Values whose truncation is always detected by the decoder
+_DELIMITERS = ",] \t\r\n"
+
+
+# ----- Exceptions ----- #
+class JsonStreamError(ValueError):
+    """
+    Raised when a streamed JSON body is malformed or the stream breaks mid-way.
+    """
+
+
+# ----- Main Functions ----- #
+def iter_json_array(chunks: Iterable[bytes], encoding: str = "utf-8") -> Iterator[Any]:
+    """
+    Incrementally decode a top-level JSON array, yielding one element at a time.
+
+    Only the undecoded tail of the body and the element being decoded are kept in memory,
+    so peak memory is bounded by the chunk size plus the largest single element.
+
+    Args:
+        chunks (Iterable[bytes]): Raw body chunks.
+        encoding (str): Text encoding of the body.
+
+    Yields:
+        Any: Each decoded array element.
+
+    Raises:
+        JsonStreamError: If the body is not a well-formed JSON array.
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder(encoding)()
+    buffer = ""
+    pos = 0
+    started = False   # Opening bracket consumed
+    expect_value = True
+    after_comma = False  # A value must follow, so "]" would be a trailing comma
+    finished = False
+
+    def parse_available(final: bool) -> Iterator[Any]:
+        nonlocal pos, started, expect_value, after_comma, finished
+        while True:
+            pos = _WHITESPACE.match(buffer, pos).end()
+            if pos >= len(buffer):
+                return
+            if finished:
+                raise JsonStreamError(f"Unexpected data after the JSON array at offset {pos}, got {buffer[pos]!r}.")
+
+            if not started:
+                if buffer[pos] != "[":
+                    raise JsonStreamError(f"Expected a JSON array, got {buffer[pos]!r}.")
+                started = True
+                pos += 1
+                continue
+
+            char = buffer[pos]
+            if not expect_value:
+                if char == ",":
+                    expect_value = after_comma = True
+                    pos += 1
+                    continue
+                if char == "]":
+                    finished = True
+                    pos += 1
+                    continue
+                raise JsonStreamError(f"Expected ',' or ']' at offset {pos}, got {char!r}.")
+
+            if char == "]":
+                if after_comma:
+                    raise JsonStreamError(f"Expected a value after ',' at offset {pos}, got ']'.")
+                finished = True
+                pos += 1
+                continue
+
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError as e:
+                if final:
+                    raise JsonStreamError(str(e)) from e
+                return  # Need more data
+
+            # A number or literal not yet followed by a delimiter may continue in the next chunk
+            if not final and char not in _CONTAINER_STARTS and (end == len(buffer) or buffer[end] not in _DELIMITERS):
+                return
+
+            pos = end
+            expect_value = after_comma = False
+            yield value
+
+    for chunk in chunks:
+        if not chunk:
+            continue
+        buffer = buffer[pos:] + text_decoder.decode(chunk)
+        pos = 0
+        yield from parse_available(final=False)
+
+    buffer = buffer[pos:] + text_decoder.decode(b"", final=True)
+    pos = 0
+    yield from parse_available(final=True)
+
+    if not finished:
+        raise JsonStreamError("Unexpected end of JSON array.")
+
+
+def iter_projected(records: Iterable[Any], fields: Optional[Sequence[str]] = None) -> Iterator[dict]:
+    """
+    Keep only the requested fields of each record, skipping non-object elements.
+
+    Args:
+        records (Iterable[Any]): Decoded array elements.
+        fields (Sequence[str], optional): Field names to keep. None keeps whole records.
+
+    Yields:
+        dict: Projected records.
+    """
+    for record in records:
+        if not isinstance(record, dict):
+            continue
+        if fields is None:
+            yield record
+        else:
+            yield {field: record.get(field) for field in fields}
+
+
+def iter_file_chunks(path: str, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Read a file in fixed-size chunks.
+
+    Args:
+        path (str): File path.
+        chunk_size (int): Bytes per chunk.
+
+    Yields:
+        bytes: File content chunks.
+    """
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
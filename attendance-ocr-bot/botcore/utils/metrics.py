@@ -0,0 +1,313 @@
+# ----- ----- ----- -----
+# metrics.py
+# For Albion Online "Griffin Empire" Guild only
+# Do not distribute or modify
+# Author: DragonTaki (https://github.com/DragonTaki)
+# Create Date: 2026/10/19
+# Update Date: 2026/10/19
+# Version: v1.0
+# ----- ----- ----- -----
+
+import bisect
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+from botcore.config.constant import TEXTFILE_ENCODING
+from botcore.config.settings_manager import get_settings
+settings = get_settings()
+from botcore.logging.app_logger import LogLevel, log
+from botcore.utils.file_utils import ensure_folder_exists
+
+# ----- Constants ----- #
+METRICS_PREFIX = "attendance_bot_"
+METRICS_TEXTFILE_NAME = "attendance_bot.prom"
+METRICS_HTTP_HOST = "127.0.0.1"  # Local only
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+DEFAULT_COUNT_BUCKETS = (1, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+
+# ----- Helper Functions ----- #
+def _escape_label_value(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace("\"", "\\\"")
+
+
+def _format_labels(labelnames: tuple[str, ...], labelvalues: tuple, extra: Optional[tuple[str, str]] = None) -> str:
+    pairs = [f"{name}=\"{_escape_label_value(value)}\"" for name, value in zip(labelnames, labelvalues)]
+    if extra:
+        pairs.append(f"{extra[0]}=\"{extra[1]}\"")
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+# ----- Metric Types ----- #
+class _Metric:
+    """
+    Base of labelled metrics. Children are keyed by label values; all updates take one lock.
+    """
+
+    TYPE = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        self.name = METRICS_PREFIX + name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict) -> tuple:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"Metric {self.name} expects labels {self.labelnames}, got {tuple(labels)}.")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def render(self) -> list[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.TYPE}"]
+
+
+class Counter(_Metric):
+    """
+    Monotonic counter, e.g., requests or cache hits.
+    """
+
+    TYPE = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple, float] = {}
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def get(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def render(self) -> list[str]:
+        lines = super().render()
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+class Histogram(_Metric):
+    """
+    Cumulative-bucket histogram, e.g., request latency or images per run.
+    """
+
+    TYPE = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = (), buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series: dict[tuple, list] = {}  # key -> [bucket counts..., sum, count]
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0] * (len(self.buckets) + 2)
+            if index < len(self.buckets):
+                series[index] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def render(self) -> list[str]:
+        lines = super().render()
+        with self._lock:
+            for key, series in sorted(self._series.items()):
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets, series):
+                    cumulative += bucket_count
+                    labels = _format_labels(self.labelnames, key, ("le", _format_value(bound)))
+                    lines.append(f"{self.name}_bucket{labels} {cumulative}")
+                labels = _format_labels(self.labelnames, key, ("le", "+Inf"))
+                lines.append(f"{self.name}_bucket{labels} {series[-1]}")
+                lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(series[-2])}")
+                lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {series[-1]}")
+        return lines
+
+
+# ----- Registry ----- #
+class MetricsRegistry:
+    """
+    Process-wide set of metrics. `counter()` / `histogram()` return the existing metric for a name,
+    so modules can declare their metrics at import time without coordinating.
+    """
+
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls, name: str, *args, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, *args, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"Metric {name} is already registered as {metric.TYPE}.")
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def histogram(self, name: str, documentation: str, labelnames: tuple[str, ...] = (), buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS) -> Histogram:
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets)
+
+    def render(self) -> str:
+        """
+        Returns:
+            str: All metrics in the Prometheus text exposition format.
+        """
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path: str) -> None:
+        """
+        Atomically write the metrics for the node_exporter textfile collector.
+
+        Args:
+            path (str): Output `.prom` file.
+        """
+        folder = os.path.dirname(os.path.abspath(path))
+        ensure_folder_exists(folder)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding=TEXTFILE_ENCODING) as f:
+            f.write(self.render())
+        os.replace(temp_path, path)
+
+
+_registry = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    return _registry
+
+
+def counter(name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Counter:
+    return _registry.counter(name, documentation, labelnames)
+
+
+def histogram(name: str, documentation: str, labelnames: tuple[str, ...] = (), buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS) -> Histogram:
+    return _registry.histogram(name, documentation, labelnames, buckets)
+
+
+# ----- Export ----- #
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = _registry.render().encode(TEXTFILE_ENCODING)
+        self.send_response(200)
+        self.send_header("Content-Type", PROMETHEUS_CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # Keep scrapes out of the app log
+
+
+class MetricsExporter:
+    """
+    Writes the textfile periodically and optionally serves `/metrics` on localhost.
+    """
+
+    def __init__(self, textfile_path: str, interval_sec: float, http_port: int = 0):
+        self.textfile_path = textfile_path
+        self.interval_sec = interval_sec
+        self.http_port = http_port
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="metrics-exporter", daemon=True)
+        self._thread.start()
+        if self.http_port:
+            try:
+                self._server = ThreadingHTTPServer((METRICS_HTTP_HOST, self.http_port), _MetricsHandler)
+                self._server.daemon_threads = True
+                threading.Thread(target=self._server.serve_forever, name="metrics-http", daemon=True).start()
+                log(f"Metrics served at http://{METRICS_HTTP_HOST}:{self.http_port}/metrics.", LogLevel.DEBUG)
+            except OSError as e:
+                log(f"Failed to start metrics endpoint on port {self.http_port}: {e}.", LogLevel.WARN)
+                self._server = None
+
+    def write(self) -> None:
+        try:
+            _registry.write_textfile(self.textfile_path)
+        except OSError as e:
+            log(f"Failed to write metrics file: {e}.", LogLevel.WARN, max_per_sec=0.01)
+
+    def stop(self) -> None:
+        """
+        Stop the exporter, writing the textfile one last time.
+        """
+        self._stop_event.set()
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        self.write()
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval_sec):
+            self.write()
+
+
+_exporter: Optional[MetricsExporter] = None
+_exporter_lock = threading.Lock()
+
+
+def get_metrics_textfile_path() -> str:
+    """
+    Returns:
+        str: `settings.metrics.textfile`, or the default file in the log folder.
+    """
+    return settings.metrics.textfile or os.path.join(settings.folder_paths.log, METRICS_TEXTFILE_NAME)
+
+
+def start_metrics_exporter() -> Optional[MetricsExporter]:
+    """
+    Start the textfile writer (and the `/metrics` endpoint if `settings.metrics.http_port` is set).
+
+    Returns:
+        MetricsExporter | None: The running exporter, or None if metrics export is disabled.
+    """
+    global _exporter
+    if not settings.metrics.enabled:
+        return None
+    with _exporter_lock:
+        if _exporter is None:
+            _exporter = MetricsExporter(
+                get_metrics_textfile_path(),
+                float(settings.metrics.write_interval_sec),
+                int(settings.metrics.http_port or 0),
+            )
+            _exporter.start()
+    return _exporter
+
+
+def stop_metrics_exporter() -> None:
+    global _exporter
+    with _exporter_lock:
+        if _exporter is not None:
+            _exporter.stop()
+            _exporter = None
@@ -4,24 +4,66 @@
 # Do not distribute or modify
 # Author: DragonTaki (https://github.com/DragonTaki)
 # Create Date: 2025/05/01
-# Update Date: 2025/05/01
-# Version: v1.0
+# Update Date: 2026/10/19
+# Version: v1.1
 # ----- ----- ----- -----
 
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, Optional, Sequence, TypeVar, Union
+
 import requests
-import time
-from typing import Optional, Union
 
 from botcore.logging.app_logger import log, LogLevel
+from .http_client import get_http_client, get_throttle_metrics
+from .job_scheduler import advance_progress, bind_job_context, check_cancelled, report_progress
+
+# ----- Constants ----- #
+MAX_FETCH_WORKERS = 6  # Upper bound of concurrent fetches (per-host limit is applied by the client)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
 
 # ----- Network Related Functions ----- #
+def safe_web_request(
+    url: str,
+    method: str = "GET",
+    headers: Optional[dict] = None,
+    context: str = "",
+    use_logger: bool = True,
+    retries: Optional[int] = None,
+    delay_sec: Optional[float] = None
+) -> Optional[requests.Response]:
+    """
+    Send a request through the shared HTTP client and return the raw response.
+
+    Args:
+        url (str): The URL to request.
+        method (str): HTTP method (default is GET).
+        headers (dict, optional): Headers to include in the request.
+        context (str): Human-readable context for log messages.
+        use_logger (bool): If False, fallback to print instead of GUI logger (for pre-login).
+        retries (int, optional): Number of attempts. Defaults to `settings.network.max_retries`.
+        delay_sec (float, optional): Base delay (in seconds) for exponential backoff between retries.
+
+    Returns:
+        requests.Response | None: The successful response or None on failure.
+    """
+    return get_http_client().request(
+        method, url, headers=headers, context=context, use_logger=use_logger,
+        retries=retries, backoff_base=delay_sec
+    )
+
+
 def safe_web_fetch(
     url: str,
     headers: Optional[dict] = None,
     context: str = "",
     use_logger: bool = True,
-    retries: int = 3,
-    delay_sec: float = 1.0
+    retries: Optional[int] = None,
+    delay_sec: Optional[float] = None,
+    use_cache: bool = False,
+    ttl_sec: Optional[float] = None
 ) -> Union[dict, list, None]:
     """
     Send a GET request with retry mechanism and optional logging.
@@ -31,31 +73,104 @@ def safe_web_fetch(
         headers (dict, optional): Headers to include in the request.
         context (str): Human-readable context for log messages.
         use_logger (bool): If False, fallback to print instead of GUI logger (for pre-login).
-        retries (int): Number of times to retry on failure.
-        delay_sec (float): Delay (in seconds) between retries.
+        retries (int, optional): Number of attempts. Defaults to `settings.network.max_retries`.
+        delay_sec (float, optional): Base delay (in seconds) for exponential backoff between retries.
+        use_cache (bool): Whether to use the conditional-GET response cache (ETag / Last-Modified).
+        ttl_sec (float, optional): Seconds a cached body is reused without revalidation. Defaults to the endpoint TTL.
 
     Returns:
         dict | list | None: The parsed JSON data or None on failure.
     """
-    for attempt in range(1, retries + 1):
-        try:
-            response = requests.get(url, headers=headers or {})
-            if response.status_code == 200:
-                return response.json()
-            else:
-                msg = f"HTTP {response.status_code} error while fetching {context or url} (Attempt {attempt}/{retries})."
-                if use_logger:
-                    log(msg, LogLevel.ERROR)
-                else:
-                    print(msg)
-        except Exception as e:
-            msg = f"Exception during request to {context or url}: {e} (Attempt {attempt}/{retries})."
-            if use_logger:
-                log(msg, LogLevel.ERROR)
-            else:
-                print(msg)
-
-        if attempt < retries:
-            time.sleep(delay_sec)
-
-    return None
+    return get_http_client().get_json(
+        url, use_cache=use_cache, ttl_sec=ttl_sec, headers=headers, context=context,
+        use_logger=use_logger, retries=retries, backoff_base=delay_sec
+    )
+
+
+def safe_web_stream(
+    url: str,
+    fields: Optional[Sequence[str]] = None,
+    headers: Optional[dict] = None,
+    context: str = "",
+    use_logger: bool = True,
+    retries: Optional[int] = None,
+    delay_sec: Optional[float] = None,
+    use_cache: bool = False,
+    ttl_sec: Optional[float] = None
+) -> Optional[Iterator[dict]]:
+    """
+    Send a GET request for a JSON array and stream its records, keeping only the given fields.
+
+    Unlike `safe_web_fetch`, the body is never fully loaded, so peak memory stays bounded
+    for large rosters and killboard windows.
+
+    Args:
+        url (str): The API endpoint to request.
+        fields (Sequence[str], optional): Record fields to keep, e.g. ("Name",). None keeps whole records.
+        headers (dict, optional): Headers to include in the request.
+        context (str): Human-readable context for log messages.
+        use_logger (bool): If False, fallback to print instead of GUI logger (for pre-login).
+        retries (int, optional): Number of attempts. Defaults to `settings.network.max_retries`.
+        delay_sec (float, optional): Base delay (in seconds) for exponential backoff between retries.
+        use_cache (bool): Whether to use the conditional-GET response cache (ETag / Last-Modified).
+        ttl_sec (float, optional): Seconds a cached body is reused without revalidation. Defaults to the endpoint TTL.
+
+    Returns:
+        Iterator[dict] | None: Projected records, or None if the request failed.
+        Iterating raises ValueError if the body is malformed or the stream breaks.
+    """
+    return get_http_client().stream_json_array(
+        url, fields=fields, use_cache=use_cache, ttl_sec=ttl_sec, headers=headers, context=context,
+        use_logger=use_logger, retries=retries, backoff_base=delay_sec
+    )
+
+
+def fetch_concurrently(
+    fetch_fn: Callable[[T], R],
+    items: Sequence[T],
+    max_workers: int = MAX_FETCH_WORKERS
+) -> list[R]:
+    """
+    Run a fetch function for every item on a bounded thread pool.
+
+    Results are returned in the same order as `items`, so callers can merge them
+    deterministically regardless of which request finished first.
+    Inside a scheduled job, each item checks for cancellation and counts toward the job progress.
+
+    Args:
+        fetch_fn (Callable[[T], R]): Function performing a single fetch.
+        items (Sequence[T]): Inputs for each fetch.
+        max_workers (int): Maximum number of concurrent fetches. 1 runs serially.
+
+    Returns:
+        list[R]: Results in input order.
+    """
+    report_progress(0, len(items), "requests")
+
+    def fetch_one(item: T) -> R:
+        check_cancelled()
+        result = fetch_fn(item)
+        advance_progress()
+        return result
+
+    if max_workers <= 1 or len(items) <= 1:
+        return [fetch_one(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items)), thread_name_prefix="fetch") as executor:
+        return list(executor.map(bind_job_context(fetch_one), items))
+
+
+def log_throttle_metrics() -> None:
+    """
+    Log the per-host throttling counters collected so far, if any throttling happened.
+    """
+    for host, counters in get_throttle_metrics().items():
+        if not any(counters.values()):
+            continue
+        log(
+            f"Throttling on {host}: "
+            f"{counters['rate_limited']:.0f} rate-limited ({counters['rate_limited_wait_sec']:.1f}s waited), "
+            f"{counters['http_429']:.0f}x 429, {counters['http_5xx']:.0f}x 5xx, "
+            f"circuit opened {counters['circuit_opened']:.0f}x, {counters['circuit_rejected']:.0f} requests rejected.",
+            LogLevel.WARN if counters["circuit_opened"] or counters["http_429"] else LogLevel.DEBUG
+        )
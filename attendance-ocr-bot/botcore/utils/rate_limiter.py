@@ -0,0 +1,96 @@
+# ----- ----- ----- -----
+# rate_limiter.py
+# For Albion Online "Griffin Empire" Guild only
+# Do not distribute or modify
+# Author: DragonTaki (https://github.com/DragonTaki)
+# Create Date: 2026/10/19
+# Update Date: 2026/10/19
+# Version: v1.0
+# ----- ----- ----- -----
+
+import threading
+import time
+from typing import Callable
+
+
+# ----- Token Bucket ----- #
+class TokenBucket:
+    """
+    Thread-safe token bucket. Each request takes one token; tokens refill at a fixed rate
+    up to `burst`, so short bursts are allowed but the long-term rate is capped.
+    """
+
+    def __init__(self, rate_per_sec: float, burst: int):
+        """
+        Initialize a full bucket.
+
+        Args:
+            rate_per_sec (float): Tokens added per second. 0 or less disables limiting.
+            burst (int): Maximum number of tokens the bucket can hold.
+        """
+        self.rate_per_sec = rate_per_sec
+        self.capacity = max(float(burst), 1.0)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated_at
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate_per_sec)
+        self._updated_at = now
+
+    def acquire(self) -> float:
+        """
+        Take one token, blocking until one is available.
+
+        Returns:
+            float: Seconds spent waiting (0 if a token was immediately available).
+        """
+        if self.rate_per_sec <= 0:
+            return 0.0
+
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return waited
+                wait_sec = (1.0 - self._tokens) / self.rate_per_sec
+
+            time.sleep(wait_sec)
+            waited += wait_sec
+
+
+# ----- Per-host Registry ----- #
+class HostRateLimiter:
+    """
+    Lazily creates one token bucket per host, using a lookup function for the host's limits.
+    """
+
+    def __init__(self, limits_for_host: Callable[[str], tuple[float, int]]):
+        """
+        Args:
+            limits_for_host (Callable[[str], tuple[float, int]]): Returns (rate_per_sec, burst) for a host.
+        """
+        self._limits_for_host = limits_for_host
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, host: str) -> float:
+        """
+        Take one token from the host's bucket.
+
+        Args:
+            host (str): Host name of the request.
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                rate_per_sec, burst = self._limits_for_host(host)
+                bucket = TokenBucket(rate_per_sec, burst)
+                self._buckets[host] = bucket
+        return bucket.acquire()
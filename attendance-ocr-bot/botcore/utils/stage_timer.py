@@ -0,0 +1,226 @@
+# ----- ----- ----- -----
+# stage_timer.py
+# For Albion Online "Griffin Empire" Guild only
+# Do not distribute or modify
+# Author: DragonTaki (https://github.com/DragonTaki)
+# Create Date: 2026/10/19
+# Update Date: 2026/10/19
+# Version: v1.0
+# ----- ----- ----- -----
+
+import contextvars
+import json
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Iterator, Optional
+
+from botcore.config.constant import TEXTFILE_ENCODING
+
+
+# ----- Stage Profiler ----- #
+class StageProfiler:
+    """
+    Per-run collector of stage timings and counters.
+
+    Stages are timed with `with profiler.stage("name"):` (or the module-level `stage()` while the
+    profiler is active); counters are bumped with `count()`. Thread-safe, so worker threads of one
+    run can share a profiler.
+    """
+
+    def __init__(self, name: str):
+        """
+        Args:
+            name (str): Run name, e.g., the screenshot folder.
+        """
+        self.name = name
+        self.started_at = time.time()
+        self._start = time.perf_counter()
+        self._elapsed: Optional[float] = None
+        self._durations: dict[str, list[float]] = {}
+        self._counters: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Time the enclosed block under a stage name.
+
+        Args:
+            name (str): Stage name, e.g., "tesseract" or "match_template/x1.2".
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_duration(name, time.perf_counter() - start)
+
+    def add_duration(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self._durations.setdefault(name, []).append(seconds)
+
+    def count(self, name: str, n: int = 1) -> None:
+        """
+        Increase a counter, e.g., "images" or "regions".
+        """
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + n
+
+    def stop(self) -> None:
+        """
+        Freeze the wall time of the run.
+        """
+        if self._elapsed is None:
+            self._elapsed = time.perf_counter() - self._start
+
+    @property
+    def elapsed(self) -> float:
+        return self._elapsed if self._elapsed is not None else time.perf_counter() - self._start
+
+    def summary(self) -> dict:
+        """
+        Returns:
+            dict: Machine-readable profile with wall time, counters, rates and per-stage statistics (ms).
+        """
+        with self._lock:
+            durations = {name: list(values) for name, values in self._durations.items()}
+            counters = dict(self._counters)
+
+        elapsed = self.elapsed
+        stages = {}
+        for name, values in sorted(durations.items()):
+            total = sum(values)
+            stages[name] = {
+                "calls": len(values),
+                "total_ms": round(total * 1000, 3),
+                "mean_ms": round(total / len(values) * 1000, 3),
+                "p95_ms": round(_percentile(values, 95) * 1000, 3),
+            }
+
+        return {
+            "name": self.name,
+            "started_at": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.started_at)),
+            "elapsed_sec": round(elapsed, 3),
+            "counters": counters,
+            "rates_per_sec": {
+                name: round(value / elapsed, 3) if elapsed > 0 else 0.0
+                for name, value in counters.items()
+            },
+            "stages": stages,
+        }
+
+    def format_table(self) -> list[str]:
+        """
+        Returns:
+            list[str]: Breakdown table lines, slowest stage first.
+        """
+        profile = self.summary()
+        width = max([len("stage")] + [len(name) for name in profile["stages"]])
+        lines = [f"{'stage':<{width}}  {'calls':>7}  {'total ms':>10}  {'mean ms':>9}  {'p95 ms':>9}"]
+        for name, data in sorted(profile["stages"].items(), key=lambda item: item[1]["total_ms"], reverse=True):
+            lines.append(
+                f"{name:<{width}}  {data['calls']:>7}  {data['total_ms']:>10.1f}  {data['mean_ms']:>9.2f}  {data['p95_ms']:>9.2f}"
+            )
+        return lines
+
+    def append_json_line(self, path: str, max_entries: Optional[int] = None) -> None:
+        """
+        Append the profile as one JSON line, so the file keeps a history of runs.
+
+        Args:
+            path (str): Output file path (JSON Lines).
+            max_entries (int, optional): Oldest runs beyond this are dropped.
+        """
+        with open(path, "a", encoding=TEXTFILE_ENCODING) as f:
+            f.write(json.dumps(self.summary()) + "\n")
+
+        if max_entries:
+            with open(path, "r", encoding=TEXTFILE_ENCODING) as f:
+                lines = f.readlines()
+            if len(lines) > max_entries:
+                tmp_path = path + ".tmp"
+                with open(tmp_path, "w", encoding=TEXTFILE_ENCODING) as f:
+                    f.writelines(lines[-max_entries:])
+                os.replace(tmp_path, path)
+
+
+# ----- Helper Functions ----- #
+def load_profile_history(path: str) -> list[dict]:
+    """
+    Read the runs saved by `StageProfiler.append_json_line`, oldest first. Broken lines are skipped.
+
+    Returns:
+        list[dict]: Profile summaries, or an empty list if the file does not exist.
+    """
+    if not os.path.exists(path):
+        return []
+    history = []
+    with open(path, "r", encoding=TEXTFILE_ENCODING) as f:
+        for line in f:
+            try:
+                history.append(json.loads(line))
+            except ValueError:
+                continue
+    return history
+
+
+def _percentile(values: list[float], percent: float) -> float:
+    """
+    Nearest-rank percentile.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(percent / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+# ----- Main Functions ----- #
+_active_profiler: contextvars.ContextVar[Optional[StageProfiler]] = contextvars.ContextVar("active_profiler", default=None)
+
+
+@contextmanager
+def profile_run(name: str) -> Iterator[StageProfiler]:
+    """
+    Activate a new profiler for the enclosed block, so `stage()` and `count()` calls
+    in any function below it record into this run.
+
+    Args:
+        name (str): Run name.
+
+    Yields:
+        StageProfiler: The active profiler.
+    """
+    profiler = StageProfiler(name)
+    token = _active_profiler.set(profiler)
+    try:
+        yield profiler
+    finally:
+        profiler.stop()
+        _active_profiler.reset(token)
+
+
+def get_active_profiler() -> Optional[StageProfiler]:
+    return _active_profiler.get()
+
+
+def stage(name: str):
+    """
+    Time a block into the active profiler; a no-op context when no run is being profiled.
+
+    Args:
+        name (str): Stage name.
+    """
+    profiler = _active_profiler.get()
+    return profiler.stage(name) if profiler is not None else nullcontext()
+
+
+def count(name: str, n: int = 1) -> None:
+    """
+    Increase a counter of the active profiler, if any.
+    """
+    profiler = _active_profiler.get()
+    if profiler is not None:
+        profiler.count(name, n)
@@ -0,0 +1,195 @@
+# ----- ----- ----- -----
+# task_profiler.py
+# For Albion Online "Griffin Empire" Guild only
+# Do not distribute or modify
+# Author: DragonTaki (https://github.com/DragonTaki)
+# Create Date: 2026/10/19
+# Update Date: 2026/10/19
+# Version: v1.0
+# ----- ----- ----- -----
+
+import cProfile
+import functools
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Optional
+
+from botcore.config.constant import DATETIME_FORMATS, TEXTFILE_ENCODING
+from botcore.config.settings_manager import get_settings
+settings = get_settings()
+from botcore.logging.app_logger import LogLevel, log
+from botcore.utils.file_utils import ensure_folder_exists, get_relative_path_to_target
+
+# ----- Constants ----- #
+PROFILE_ENV_VAR = "ATTENDANCE_BOT_PROFILE"  # "1" enables profiling regardless of settings.json
+PROFILE_FILE_PREFIX = "profile_"
+TRACEMALLOC_FRAMES = 5
+
+# cProfile only sees the thread that enabled it, while tracemalloc and its peak are process-wide;
+# profiled tasks therefore run one at a time, so they do not reset each other's peak
+_profile_lock = threading.Lock()
+
+
+# ----- Helper Functions ----- #
+def _get_peak_rss_bytes() -> Optional[int]:
+    """
+    Peak resident set size of this process, or None if the platform does not report it.
+    """
+    if sys.platform == "win32":
+        try:
+            import ctypes
+            from ctypes import wintypes
+
+            class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+                _fields_ = [
+                    ("cb", wintypes.DWORD),
+                    ("PageFaultCount", wintypes.DWORD),
+                    ("PeakWorkingSetSize", ctypes.c_size_t),
+                    ("WorkingSetSize", ctypes.c_size_t),
+                    ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                    ("PagefileUsage", ctypes.c_size_t),
+                    ("PeakPagefileUsage", ctypes.c_size_t),
+                ]
+
+            counters = PROCESS_MEMORY_COUNTERS()
+            counters.cb = ctypes.sizeof(counters)
+            handle = ctypes.windll.kernel32.GetCurrentProcess()
+            if ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+                return counters.PeakWorkingSetSize
+        except Exception:
+            return None
+        return None
+
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024  # bytes on macOS, KiB on Linux
+    except Exception:
+        return None
+
+
+def _format_mb(value: Optional[int]) -> str:
+    return f"{value / (1024 * 1024):.1f} MB" if value is not None else "n/a"
+
+
+def _write_report(base_path: str, task_name: str, elapsed: float, profiler: cProfile.Profile,
+                  snapshot: tracemalloc.Snapshot, traced_peak: int) -> str:
+    """
+    Write the readable report: timings, memory peaks, top functions and top allocations.
+
+    Returns:
+        str: Path of the report file.
+    """
+    config = settings.profiling
+    stats_text = io.StringIO()
+    pstats.Stats(profiler, stream=stats_text).sort_stats(pstats.SortKey.CUMULATIVE).print_stats(config.top_functions)
+
+    snapshot = snapshot.filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    ))
+    top_allocations = snapshot.statistics("lineno")[:config.top_allocations]
+
+    report_path = f"{base_path}.txt"
+    with open(report_path, "w", encoding=TEXTFILE_ENCODING) as f:
+        f.write(f"Task: {task_name}\n")
+        f.write(f"Wall time: {elapsed:.3f}s\n")
+        f.write(f"Traced Python memory peak: {_format_mb(traced_peak)}\n")
+        f.write(f"Process peak RSS: {_format_mb(_get_peak_rss_bytes())}\n")
+        f.write("Note: functions are profiled on the task's own thread only; time spent in worker threads "
+                "(concurrent fetches, debug image writer) shows up as waiting. Memory covers all threads.\n\n")
+        f.write(f"----- Top {config.top_allocations} allocations (live at task end) -----\n")
+        for stat in top_allocations:
+            f.write(f"{stat}\n")
+        f.write(f"\n----- Top {config.top_functions} functions (cumulative) -----\n")
+        f.write(stats_text.getvalue())
+    return report_path
+
+
+# ----- Main Functions ----- #
+def is_profiling_enabled() -> bool:
+    """
+    Returns:
+        bool: True if task profiling is on, from the environment variable or settings.
+    """
+    env_value = os.environ.get(PROFILE_ENV_VAR, "").strip().lower()
+    if env_value:
+        return env_value in ("1", "true", "yes", "on")
+    return bool(settings.profiling.enabled)
+
+
+def run_profiled(task_name: str, func: Callable, *args, **kwargs):
+    """
+    Run a function under cProfile and tracemalloc, then write a `.prof` dump and a text report
+    (top allocations, top functions, traced and RSS peaks) into the log folder.
+
+    Profiled tasks run one at a time; a second one waits until the first has finished.
+    Only the calling thread is profiled, worker threads it starts are not.
+
+    Args:
+        task_name (str): Name used in file names and the log.
+        func (Callable): The task to run.
+
+    Returns:
+        The return value of `func`.
+    """
+    with _profile_lock:
+        profiler = cProfile.Profile()
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        tracemalloc.reset_peak()
+        start = time.perf_counter()
+        profiler.enable()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profiler.disable()
+            elapsed = time.perf_counter() - start
+            snapshot = tracemalloc.take_snapshot()
+            _, traced_peak = tracemalloc.get_traced_memory()
+            if started_tracing:
+                tracemalloc.stop()
+
+            try:
+                ensure_folder_exists(settings.folder_paths.log)
+                timestamp = datetime.now().strftime(DATETIME_FORMATS.log)
+                base_path = os.path.join(settings.folder_paths.log, f"{PROFILE_FILE_PREFIX}{task_name}_{timestamp}")
+                profiler.dump_stats(f"{base_path}.prof")
+                report_path = _write_report(base_path, task_name, elapsed, profiler, snapshot, traced_peak)
+                log(f"Profile of \"{task_name}\" ({elapsed:.2f}s, peak RSS {_format_mb(_get_peak_rss_bytes())}) "
+                    f"saved to \"{get_relative_path_to_target(report_path)}\" and \".prof\".")
+            except Exception as e:
+                log(f"Failed to save profile of \"{task_name}\": {e}.", LogLevel.WARN)
+
+
+def profiled(func: Callable, task_name: Optional[str] = None) -> Callable:
+    """
+    Wrap a task for profiling if profiling is enabled right now; otherwise return it unchanged,
+    so disabled profiling adds no overhead at all.
+
+    Args:
+        func (Callable): Task function.
+        task_name (str, optional): Name for the output files. Defaults to the function name.
+
+    Returns:
+        Callable: The wrapped or original function.
+    """
+    if not is_profiling_enabled():
+        return func
+
+    name = task_name or getattr(func, "__name__", "task")
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return run_profiled(name, func, *args, **kwargs)
+    return wrapper
@@ -0,0 +1,277 @@
+# ----- ----- ----- -----
+# cli.py
+# For Albion Online "Griffin Empire" Guild only
+# Do not distribute or modify
+# Author: DragonTaki (https://github.com/DragonTaki)
+# Create Date: 2026/10/19
+# Update Date: 2026/10/19
+# Version: v1.0
+# ----- ----- ----- -----
+
+"""
+Headless entry point for scheduled runs (no Tk, no display needed).
+
+Examples:
+    python cli.py fetch-members --workers 4
+    python cli.py summarise-screenshots --json
+    python cli.py report --sources killboard,screenshot --json > report.json
+    python cli.py clear-cache --target summary
+    python cli.py serve --port 8765 --workers 2
+    python cli.py watch
+"""
+
+import argparse
+import atexit
+import contextlib
+import json
+import sys
+import time
+from typing import Callable, Optional
+
+# Load settings first and ensure it's initialized
+import botcore.config.settings
+
+from botcore.config.settings_manager import get_settings
+settings = get_settings()
+from botcore.config.static_settings import IF_TRIAL_VERSION
+from botcore.logging.log_file_manager import shutdown_runtime_log
+
+# ----- Constants ----- #
+EXIT_OK = 0
+EXIT_FAILED = 1        # Task ran but produced no usable data, or raised
+EXIT_USAGE = 2         # Bad arguments (argparse default)
+EXIT_UNAUTHORIZED = 3  # auth.json missing/invalid, authorization failed or trial expired
+EXIT_INTERRUPTED = 130
+
+REPORT_SOURCES = ("killboard", "textfile", "screenshot")
+CLEAR_TARGETS = ("all", "attendance", "summary")
+
+
+# ----- Helper Functions ----- #
+def _interval_counts(summary: dict) -> dict:
+    """
+    Players counted per interval, e.g., {"7": 40, "14": 52, "28": 61}.
+    """
+    return {str(interval): len(players) for interval, players in (summary or {}).items()}
+
+
+def _parse_sources(value: Optional[str]) -> dict[str, bool]:
+    if value is None:
+        return {source: bool(getattr(settings.used_data, source)) for source in REPORT_SOURCES}
+    requested = {part.strip() for part in value.split(",") if part.strip()}
+    unknown = requested - set(REPORT_SOURCES)
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown source(s): {', '.join(sorted(unknown))}")
+    return {source: source in requested for source in REPORT_SOURCES}
+
+
+def _authorize() -> bool:
+    from botcore.core.auth_manager import auth_manager
+    from botcore.core.startup_manager import is_trial_expired
+
+    if IF_TRIAL_VERSION and is_trial_expired():
+        print("❌ Trial expired. Please contact the developer.", file=sys.stderr)
+        return False
+    result = auth_manager()
+    if result != "success":
+        reason = "auth.json is missing or invalid" if result == "undefined" else "user is not authorized"
+        print(f"❌ Authorization failed: {reason}.", file=sys.stderr)
+        return False
+    return True
+
+
+# ----- Commands ----- #
+# Each command returns (ok, result); result is what `--json` prints
+def cmd_fetch_members(args: argparse.Namespace) -> tuple[bool, dict]:
+    from botcore.core.fetch_guild_members import fetch_guild_members
+
+    members = fetch_guild_members(max_workers=args.workers) if args.workers else fetch_guild_members()
+    return bool(members), {"members": len(members or {})}
+
+
+def cmd_fetch_killboard(args: argparse.Namespace) -> tuple[bool, dict]:
+    from botcore.core.fetch_killboard_attendance import fetch_killboard_attendance
+
+    summary = fetch_killboard_attendance(max_workers=args.workers) if args.workers else fetch_killboard_attendance()
+    return bool(summary), {"players_per_interval": _interval_counts(summary)}
+
+
+def _summarise(summary_name: str) -> tuple[bool, dict]:
+    from botcore.core.daily_summary import DAILY_SUMMARY
+    from botcore.core.fetch_daily_attendance import fetch_daily_attendance
+
+    summary = fetch_daily_attendance(getattr(DAILY_SUMMARY, summary_name))
+    return bool(summary), {"players_per_interval": _interval_counts(summary)}
+
+
+def cmd_summarise_textfile(args: argparse.Namespace) -> tuple[bool, dict]:
+    return _summarise("TEXTFILE")
+
+
+def cmd_summarise_screenshots(args: argparse.Namespace) -> tuple[bool, dict]:
+    return _summarise("SCREENSHOT")
+
+
+def cmd_report(args: argparse.Namespace) -> tuple[bool, dict]:
+    from botcore.core.generate_report import generate_report
+
+    sources = _parse_sources(args.sources)
+    rows = generate_report(sources["killboard"], sources["textfile"], sources["screenshot"], not args.no_csv)
+    return bool(rows), {"sources": [name for name, used in sources.items() if used], "rows": rows}
+
+
+def cmd_clear_cache(args: argparse.Namespace) -> tuple[bool, dict]:
+    from botcore.core.cache import clear_all_cache_files
+    from botcore.core.daily_summary import clear_all_daily_summary_files
+    from botcore.utils.http_cache import clear_response_cache
+
+    deleted = 0
+    if args.target in ("all", "attendance"):
+        deleted += clear_all_cache_files()
+    if args.target in ("all", "summary"):
+        deleted += clear_all_daily_summary_files()
+    if args.target == "all":
+        deleted += clear_response_cache()
+    return True, {"target": args.target, "deleted_files": deleted}
+
+
+def cmd_serve(args: argparse.Namespace) -> tuple[bool, dict]:
+    from botcore.core.attendance_service import serve
+    from botcore.core.cache_prefetcher import start_cache_prefetcher, stop_cache_prefetcher
+    from botcore.core.screenshot_watcher import start_screenshot_watcher, stop_screenshot_watcher
+
+    start_cache_prefetcher()  # A long-running service keeps the caches warm like the GUI
+    start_screenshot_watcher()
+    try:
+        serve(args.host, args.port, args.workers)
+    except KeyboardInterrupt:
+        pass  # Ctrl+C is the normal way to stop the service
+    finally:
+        stop_screenshot_watcher()
+        stop_cache_prefetcher()
+    return True, {}
+
+
+def cmd_watch(args: argparse.Namespace) -> tuple[bool, dict]:
+    from botcore.core.cache_prefetcher import start_cache_prefetcher, stop_cache_prefetcher
+    from botcore.core.screenshot_watcher import start_screenshot_watcher, stop_screenshot_watcher
+
+    start_cache_prefetcher()
+    start_screenshot_watcher(force=True)
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass  # Ctrl+C is the normal way to stop watching
+    finally:
+        stop_screenshot_watcher()
+        stop_cache_prefetcher()
+    return True, {}
+
+
+# ----- Argument Parser ----- #
+def build_parser() -> argparse.ArgumentParser:
+    def output_options(default) -> argparse.ArgumentParser:
+        options = argparse.ArgumentParser(add_help=False)
+        options.add_argument("--json", action="store_true", default=default,
+                             help="Print one JSON object on stdout; logs go to stderr.")
+        options.add_argument("--profile", action="store_true", default=default,
+                             help="Profile the command (same report as settings.profiling.enabled).")
+        return options
+
+    parser = argparse.ArgumentParser(
+        prog="cli.py",
+        description="Headless attendance bot runner. Exit codes: 0 ok, 1 failed, 2 usage, 3 unauthorized, 130 interrupted.",
+        parents=[output_options(False)],
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True, metavar="command")
+    # Also accepted after the command; SUPPRESS keeps a flag given before it
+    command_options = output_options(argparse.SUPPRESS)
+
+    def add(name: str, func: Callable, help_text: str, workers: bool = False) -> argparse.ArgumentParser:
+        sub = subparsers.add_parser(name, help=help_text, description=help_text, parents=[command_options])
+        sub.set_defaults(func=func)
+        if workers:
+            sub.add_argument("--workers", type=int, default=None, metavar="N",
+                             help="Concurrent HTTP requests (1 = serial). Defaults to the built-in limit.")
+        return sub
+
+    add("fetch-members", cmd_fetch_members, "Fetch the guild member list into the cache.", workers=True)
+    add("fetch-killboard", cmd_fetch_killboard, "Fetch killboard attendance into the cache.", workers=True)
+    add("summarise-textfile", cmd_summarise_textfile, "Summarise textfile attendance into the cache.")
+    add("summarise-screenshots", cmd_summarise_screenshots, "Summarise screenshot attendance via OCR into the cache.")
+    report = add("report", cmd_report, "Generate the attendance report from the cache (fetching what is missing).")
+    report.add_argument("--sources", default=None, metavar="LIST",
+                        help=f"Comma-separated subset of {','.join(REPORT_SOURCES)}. Defaults to settings.used_data.")
+    report.add_argument("--no-csv", action="store_true", help="Do not write the CSV report file.")
+    clear = add("clear-cache", cmd_clear_cache, "Delete cache files.")
+    clear.add_argument("--target", choices=CLEAR_TARGETS, default="all",
+                       help="all: attendance, daily summary and HTTP caches; attendance; summary.")
+    add("watch", cmd_watch, "Watch the attendance folder and OCR new screenshots as they arrive, until Ctrl+C.")
+    serve = add("serve", cmd_serve, "Run the local HTTP service (uploads, summaries, reports) until Ctrl+C.")
+    serve.add_argument("--host", default=None, help="Bind address. Defaults to settings.service.host.")
+    serve.add_argument("--port", type=int, default=None, help="Port. Defaults to settings.service.port.")
+    serve.add_argument("--workers", type=int, default=None, metavar="N",
+                       help="Warm worker threads. Defaults to settings.service.workers.")
+    return parser
+
+
+# ----- Main Function ----- #
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if getattr(args, "workers", None) is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.command == "report":
+        try:
+            _parse_sources(args.sources)
+        except argparse.ArgumentTypeError as e:
+            parser.error(f"--sources: {e}")
+
+    atexit.register(shutdown_runtime_log)
+
+    # With --json, stdout carries only the result; everything printed by the bot goes to stderr
+    output_stream = sys.stdout
+    redirect = contextlib.redirect_stdout(sys.stderr) if args.json else contextlib.nullcontext()
+
+    ok, result, error = False, {}, None
+    exit_code = EXIT_FAILED
+    start = time.perf_counter()
+    try:
+        with redirect:
+            if not _authorize():
+                error, exit_code = "unauthorized", EXIT_UNAUTHORIZED
+            else:
+                from botcore.utils.metrics import start_metrics_exporter, stop_metrics_exporter
+                from botcore.utils.task_profiler import profiled, run_profiled
+
+                if start_metrics_exporter():
+                    atexit.register(stop_metrics_exporter)
+
+                task = lambda: args.func(args)
+                task_name = args.command.replace("-", "_")
+                if args.profile:
+                    ok, result = run_profiled(task_name, task)
+                else:
+                    ok, result = profiled(task, task_name)()
+                exit_code = EXIT_OK if ok else EXIT_FAILED
+    except KeyboardInterrupt:
+        error, exit_code = "interrupted", EXIT_INTERRUPTED
+        print("Interrupted.", file=sys.stderr)
+    except Exception as e:
+        error = str(e)
+        print(f"❌ {args.command} failed: {e}", file=sys.stderr)
+
+    elapsed = time.perf_counter() - start
+    if args.json:
+        payload = {"command": args.command, "ok": ok, "exit_code": exit_code, "elapsed_sec": round(elapsed, 3), "result": result}
+        if error:
+            payload["error"] = error
+        json.dump(payload, output_stream, ensure_ascii=False, indent=2)
+        output_stream.write("\n")
+    else:
+        print(f"{args.command}: {'done' if ok else error or 'failed'} in {elapsed:.1f}s.")
+    return exit_code
+
+if __name__ == "__main__":
+    sys.exit(main())
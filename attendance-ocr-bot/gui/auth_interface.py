@@ -4,21 +4,26 @@
 # Do not distribute or modify
 # Author: DragonTaki (https://github.com/DragonTaki)
 # Create Date: 2025/04/27
-# Update Date: 2025/04/27
-# Version: v1.0
+# Update Date: 2026/10/19
+# Version: v1.1
 # ----- ----- ----- -----
 
 import tkinter as tk
 from tkinter import messagebox
 
 
-def show_auth_file_warning() -> None:
+def show_auth_file_warning(parent: tk.Misc | None = None) -> None:
     """
     Show a popup window warning the user to fill in 'auth.json' file correctly.
+
+    Args:
+        parent (tk.Misc, optional): Existing window to attach to. A temporary hidden root is used if omitted.
     """
-    root = tk.Tk()
-    root.withdraw()
+    root = parent if parent is not None else tk.Tk()
+    if parent is None:
+        root.withdraw()
     messagebox.showwarning(
+        parent=root,
         title="Authentication Setup Required",
         message=(
             "⚠️ Authentication file 'auth.json' is missing or invalid.\n\n"
@@ -26,20 +31,27 @@ def show_auth_file_warning() -> None:
             "fill in your username, key, and token, then restart the application."
         )
     )
-    root.destroy()
+    if parent is None:
+        root.destroy()
 
 
-def show_auth_failed_warning() -> None:
+def show_auth_failed_warning(parent: tk.Misc | None = None) -> None:
     """
     Show a popup window indicating that authentication failed.
+
+    Args:
+        parent (tk.Misc, optional): Existing window to attach to. A temporary hidden root is used if omitted.
     """
-    root = tk.Tk()
-    root.withdraw()
+    root = parent if parent is not None else tk.Tk()
+    if parent is None:
+        root.withdraw()
     messagebox.showerror(
+        parent=root,
         title="Authentication Failed",
         message=(
             "❌ Authentication failed.\n\n"
             "Please check your username, key, and token in 'auth.json'."
         )
     )
-    root.destroy()
+    if parent is None:
+        root.destroy()
@@ -0,0 +1,169 @@
+# ----- ----- ----- -----
+# job_panel.py
+# For Albion Online "Griffin Empire" Guild only
+# Do not distribute or modify
+# Author: DragonTaki (https://github.com/DragonTaki)
+# Create Date: 2026/10/19
+# Update Date: 2026/10/19
+# Version: v1.0
+# ----- ----- ----- -----
+
+import queue
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable, Optional
+
+from botcore.utils.job_scheduler import Job, JobScheduler, JobState
+
+# ----- Constants ----- #
+JOB_PANEL_FPS = 10
+JOB_ROW_HEIGHT = 28
+JOB_ROW_LINGER_MS = 4000  # Finished rows stay visible this long
+JOB_PANEL_BACKGROUND = "#08192D"
+JOB_PANEL_FOREGROUND = "#FCFAF2"
+JOB_PANEL_FONT = ("Helvetica", 9)
+STATE_COLORS = {
+    JobState.DONE: "#7BC47F",
+    JobState.FAILED: "#E06C75",
+    JobState.CANCELLED: "#E5C07B",
+}
+
+
+# ----- Helper Functions ----- #
+def _format_duration(seconds: float) -> str:
+    seconds = int(round(seconds))
+    return f"{seconds // 60}m{seconds % 60:02d}s" if seconds >= 60 else f"{seconds}s"
+
+
+def format_job_status(job: Job) -> str:
+    """
+    One-line status, e.g., "12/40 images (2025-01-01) · 3.1/s · ETA 9s".
+    """
+    if job.state == JobState.PENDING:
+        return "Waiting..."
+    if job.state.is_finished:
+        return f"{job.state.value.capitalize()} in {_format_duration(job.elapsed_sec)}"
+
+    parts = []
+    if job.total is not None:
+        progress = f"{job.done}/{job.total} {job.unit}".strip()
+        parts.append(f"{progress} ({job.detail})" if job.detail else progress)
+    throughput = job.throughput
+    if throughput:
+        parts.append(f"{throughput:.1f}/s")
+    eta = job.eta_sec
+    if eta is not None:
+        parts.append(f"ETA {_format_duration(eta)}")
+    return " · ".join(parts) or f"Running {_format_duration(job.elapsed_sec)}"
+
+
+# ----- Job Row ----- #
+class _JobRow:
+    def __init__(self, parent: tk.Misc, job: Job, on_cancel: Callable[[int], None]):
+        self.frame = tk.Frame(parent, bg=JOB_PANEL_BACKGROUND, height=JOB_ROW_HEIGHT)
+        self.label = tk.Label(self.frame, text=job.label, anchor="w", font=JOB_PANEL_FONT,
+                              bg=JOB_PANEL_BACKGROUND, fg=JOB_PANEL_FOREGROUND)
+        self.progress = ttk.Progressbar(self.frame, mode="indeterminate", maximum=1)
+        self.status = tk.Label(self.frame, anchor="w", font=JOB_PANEL_FONT,
+                               bg=JOB_PANEL_BACKGROUND, fg=JOB_PANEL_FOREGROUND)
+        self.cancel_button = tk.Button(self.frame, text="Cancel", font=JOB_PANEL_FONT,
+                                       command=lambda: on_cancel(job.id))
+
+        self.label.place(relx=0.0, rely=0.1, relwidth=0.28, relheight=0.8)
+        self.progress.place(relx=0.29, rely=0.25, relwidth=0.25, relheight=0.5)
+        self.status.place(relx=0.55, rely=0.1, relwidth=0.33, relheight=0.8)
+        self.cancel_button.place(relx=0.89, rely=0.1, relwidth=0.11, relheight=0.8)
+        self._indeterminate_running = False
+
+    def update(self, job: Job) -> None:
+        if job.state.is_finished:
+            self._stop_indeterminate()
+            self.progress.config(mode="determinate", maximum=1, value=1 if job.state == JobState.DONE else 0)
+            self.status.config(text=format_job_status(job), fg=STATE_COLORS[job.state])
+            self.cancel_button.config(state=tk.DISABLED)
+            return
+
+        if job.total:
+            self._stop_indeterminate()
+            self.progress.config(mode="determinate", maximum=job.total, value=min(job.done, job.total))
+        elif job.state == JobState.RUNNING and not self._indeterminate_running:
+            self.progress.config(mode="indeterminate")
+            self.progress.start(15)
+            self._indeterminate_running = True
+        self.status.config(text=format_job_status(job))
+
+    def _stop_indeterminate(self) -> None:
+        if self._indeterminate_running:
+            self.progress.stop()
+            self._indeterminate_running = False
+
+    def destroy(self) -> None:
+        self._stop_indeterminate()
+        self.frame.destroy()
+
+
+# ----- Job Panel ----- #
+class JobPanel(tk.Frame):
+    """
+    Per-job progress rows with a cancel button each.
+
+    Scheduler events arrive on worker threads; they are queued and applied on the Tk main
+    thread at most `JOB_PANEL_FPS` times per second.
+    """
+
+    def __init__(self, parent: tk.Misc, scheduler: JobScheduler, on_resize: Optional[Callable[[], None]] = None):
+        super().__init__(parent, bg=JOB_PANEL_BACKGROUND)
+        self.scheduler = scheduler
+        self.on_resize = on_resize
+        self._rows: dict[int, _JobRow] = {}
+        self._events: queue.SimpleQueue = queue.SimpleQueue()
+        self._interval_ms = max(int(1000 / JOB_PANEL_FPS), 1)
+        scheduler.subscribe(self._events.put)
+        self.after(self._interval_ms, self._drain)
+
+    @property
+    def required_height(self) -> int:
+        return len(self._rows) * JOB_ROW_HEIGHT
+
+    def _drain(self) -> None:
+        try:
+            latest: dict[int, Job] = {}
+            while True:
+                try:
+                    job = self._events.get_nowait()
+                except queue.Empty:
+                    break
+                latest[job.id] = job
+
+            row_count = len(self._rows)
+            for job in latest.values():
+                row = self._rows.get(job.id)
+                if row is None:
+                    if job.state.is_finished:
+                        continue  # Cancelled before it was ever shown
+                    row = self._rows[job.id] = _JobRow(self, job, self.scheduler.cancel)
+                row.update(job)
+                if job.state.is_finished:
+                    self.after(JOB_ROW_LINGER_MS, lambda job_id=job.id: self._remove_row(job_id))
+
+            # Refresh rates and ETAs of running jobs even without new events
+            for job in self.scheduler.active_jobs():
+                if job.id in self._rows and job.id not in latest:
+                    self._rows[job.id].update(job)
+
+            if len(self._rows) != row_count:
+                self._layout()
+        finally:
+            self.after(self._interval_ms, self._drain)
+
+    def _remove_row(self, job_id: int) -> None:
+        row = self._rows.pop(job_id, None)
+        if row is not None:
+            row.destroy()
+            self._layout()
+
+    def _layout(self) -> None:
+        for index, row in enumerate(self._rows.values()):
+            row.frame.place(x=0, y=index * JOB_ROW_HEIGHT, relwidth=1.0, height=JOB_ROW_HEIGHT)
+        if self.on_resize:
+            self.on_resize()
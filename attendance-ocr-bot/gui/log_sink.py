@@ -0,0 +1,121 @@
+# ----- ----- ----- -----
+# log_sink.py
+# For Albion Online "Griffin Empire" Guild only
+# Do not distribute or modify
+# Author: DragonTaki (https://github.com/DragonTaki)
+# Create Date: 2026/10/19
+# Update Date: 2026/10/19
+# Version: v1.0
+# ----- ----- ----- -----
+
+import queue
+import tkinter as tk
+
+from botcore.logging.log_file_manager import append_runtime_log
+
+# ----- Constants ----- #
+LOG_SINK_FPS = 20               # Widget refreshes per second while records are pending
+LOG_SINK_MAX_BATCH = 500        # Records inserted per refresh, the rest wait for the next frame
+LOG_SINK_MAX_LINES = 5000       # Scrollback kept in the widget
+LOG_FONT = ("Courier", 10)
+DEFAULT_SEGMENT_COLOR = "white"
+
+
+class TkLogSink:
+    """
+    Thread-safe GUI log sink.
+
+    Any thread may call `put` with a structured record (a list of text segments).
+    Records are queued and inserted into the Text widget in batches on the Tk main thread
+    via `root.after`, at most `LOG_SINK_FPS` times per second. Each tag is configured once,
+    and the oldest lines are trimmed beyond `LOG_SINK_MAX_LINES`. The runtime log file is
+    written in `put`, so lines reach it even if the main loop is blocked or never drains them.
+    """
+
+    def __init__(self, root: tk.Misc, text_widget: tk.Text, max_lines: int = LOG_SINK_MAX_LINES, fps: int = LOG_SINK_FPS):
+        """
+        Args:
+            root (tk.Misc): Widget used for `after` scheduling.
+            text_widget (tk.Text): Log display, kept in DISABLED state.
+            max_lines (int): Scrollback limit.
+            fps (int): Maximum refresh rate.
+        """
+        self.root = root
+        self.text_widget = text_widget
+        self.max_lines = max_lines
+        self.interval_ms = max(int(1000 / fps), 1)
+
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._configured_tags: set[str] = set()
+        self._after_id = None
+
+    def start(self) -> None:
+        """
+        Start draining the queue on the Tk main thread.
+        """
+        if self._after_id is None:
+            self._after_id = self.root.after(self.interval_ms, self._drain)
+
+    def stop(self) -> None:
+        """
+        Stop draining. Pending records are inserted once more before stopping.
+        """
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        self._insert_pending()
+
+    def put(self, segments: list[dict]) -> None:
+        """
+        Queue one log line for the widget and write it to the runtime log. Safe to call from any thread.
+
+        Args:
+            segments (list[dict]): Text segments with "text" and optional "tag", "color", "bold", "italic".
+        """
+        append_runtime_log("".join(segment.get("text", "") for segment in segments))  # Non-blocking queue
+        self._queue.put(segments)
+
+    def _drain(self) -> None:
+        try:
+            self._insert_pending()
+        finally:
+            self._after_id = self.root.after(self.interval_ms, self._drain)
+
+    def _configure_tag(self, segment: dict) -> None:
+        tag = segment.get("tag")
+        if not tag or tag in self._configured_tags:
+            return
+
+        style = ("bold" if segment.get("bold") else "") + (" italic" if segment.get("italic") else "")
+        self.text_widget.tag_config(
+            tag,
+            foreground=segment.get("color") or DEFAULT_SEGMENT_COLOR,
+            font=(*LOG_FONT, style.strip()),
+        )
+        self._configured_tags.add(tag)
+
+    def _insert_pending(self) -> None:
+        records = []
+        while len(records) < LOG_SINK_MAX_BATCH:
+            try:
+                records.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        if not records:
+            return
+
+        widget = self.text_widget
+        widget.config(state=tk.NORMAL)
+        for segments in records:
+            for segment in segments:
+                self._configure_tag(segment)
+                widget.insert(tk.END, segment.get("text", ""), segment.get("tag"))
+            widget.insert(tk.END, "\n")
+
+        # Ring-buffer trim: drop the oldest lines beyond the scrollback limit
+        line_count = int(widget.index("end-1c").split(".")[0])
+        if line_count > self.max_lines:
+            widget.delete("1.0", f"{line_count - self.max_lines + 1}.0")
+
+        widget.yview(tk.END)
+        widget.config(state=tk.DISABLED)
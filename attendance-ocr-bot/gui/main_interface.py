@@ -4,12 +4,10 @@
 # Do not distribute or modify
 # Author: DragonTaki (https://github.com/DragonTaki)
 # Create Date: 2025/04/18
-# Update Date: 2025/05/01
-# Version: v2.1
+# Update Date: 2026/10/19
+# Version: v2.2
 # ----- ----- ----- -----
 
-import json
-import threading
 import tkinter as tk
 from tkinter import font
 
@@ -22,7 +20,15 @@ from botcore.core.generate_report import generate_report
 from botcore.core.cache import clear_all_cache_files
 from botcore.core.daily_summary import DAILY_SUMMARY, clear_all_daily_summary_files
 from botcore.logging.app_logger import LogLevel, log, set_external_logger
-from botcore.logging.log_file_manager import append_runtime_log, save_log, save_all_logs, clear_log
+from botcore.logging.log_file_manager import save_log, save_all_logs, clear_log
+from botcore.utils.http_cache import clear_response_cache
+from botcore.utils.job_scheduler import (
+    JOB_CLEAR_ATTENDANCE_CACHE, JOB_CLEAR_CACHE, JOB_CLEAR_DAILY_SUMMARY, JOB_KILLBOARD,
+    JOB_MEMBERS, JOB_REPORT, JOB_SCREENSHOT, JOB_TEXTFILE, get_job_scheduler,
+)
+from botcore.utils.task_profiler import profiled
+from gui.job_panel import JobPanel
+from gui.log_sink import TkLogSink
 
 
 # ----- Constants for UI objects ----- #
@@ -80,10 +86,23 @@ UI = SafeNamespace(
     },
 )
 
+# Scheduler job name of each task, used for dependencies between tasks
+TASK_JOB_NAMES = {
+    "fetch_member_list_task": JOB_MEMBERS,
+    "fetch_killboard_attendance_task": JOB_KILLBOARD,
+    "fetch_textfile_attendance_task": JOB_TEXTFILE,
+    "fetch_screenshot_attendance_task": JOB_SCREENSHOT,
+    "generate_report_from_cache_task": JOB_REPORT,
+    "clear_all_cache_task": JOB_CLEAR_CACHE,
+    "clear_attendance_cache_task": JOB_CLEAR_ATTENDANCE_CACHE,
+    "clear_daily_summary_task": JOB_CLEAR_DAILY_SUMMARY,
+}
+
 class AttendanceBotGUI(tk.Frame):
     def __init__(self, root, show_welcome: bool = False):
         super().__init__(root)
         self.root = root
+        self.scheduler = get_job_scheduler()
 
         self.button_row_configs = [
             ("Step 1: Get database"),
@@ -116,7 +135,9 @@ class AttendanceBotGUI(tk.Frame):
 
         self.bind("<Configure>", self.update_sizes)
         self.create_widgets()
-        set_external_logger(self.log)
+        self.log_sink = TkLogSink(self.root, self.logger)
+        self.log_sink.start()
+        set_external_logger(self.log_sink.put)
         if show_welcome:
             from botcore.logging.app_logger import log_welcome_message
             log_welcome_message()
@@ -133,6 +154,7 @@ class AttendanceBotGUI(tk.Frame):
 
         # Create the logger area and configure right-click menu and keyboard shortcuts
         self.logger, self.logger_scrollbar = self.create_logger_area(self.right_frame)
+        self.job_panel = JobPanel(self.right_frame, self.scheduler, on_resize=self.update_sizes)
         self.create_right_click_menu(self.logger)
         self.configure_shortcuts(self.logger)
 
@@ -168,7 +190,7 @@ class AttendanceBotGUI(tk.Frame):
         row_frame = self.create_frame(self.left_frame)
         row_frame.place(relx=0.0, rely=row_y, relwidth=UI.FULL.RWIDTH, relheight=UI.BUTTON.RHEIGHT)
 
-        btn = self.create_button(row_frame, button_text, lambda: self.run_with_thread(task))
+        btn = self.create_button(row_frame, button_text, lambda: self.run_as_job(task, button_text))
         btn.place(relx=0.005, rely=0.1, relwidth=0.7, relheight=0.8)
 
         switch = self.create_switch(
@@ -192,7 +214,7 @@ class AttendanceBotGUI(tk.Frame):
         btn = self.create_button(
             row_frame,
             button_text,
-            lambda: self.run_with_thread(action)
+            lambda: self.run_as_job(action, button_text)
         )
         btn.place(relx=0.0, rely=0.1, relwidth=1.0, relheight=0.8)
 
@@ -295,16 +317,11 @@ class AttendanceBotGUI(tk.Frame):
         self.switches["textfile"].set(settings.used_data.textfile)
         self.switches["screenshot"].set(settings.used_data.screenshot)
 
-    # Generic runner for async tasks
-    def run_with_thread(self, task_func):
-        def wrapper():
-            try:
-                task_func()  # Run task in background
-            finally:
-                self.set_all_buttons_state(tk.NORMAL)  # Unlock all buttons after completion
-        self.set_all_buttons_state(tk.DISABLED)        # Lock all buttons before starting
-        threading.Thread(target=wrapper, daemon=True).start()
-        
+    # Generic runner for background tasks: independent tasks run concurrently, dependent ones wait
+    def run_as_job(self, task_func, label: str):
+        name = TASK_JOB_NAMES.get(task_func.__name__, task_func.__name__)
+        self.scheduler.submit(name, profiled(task_func), label)  # Unchanged unless profiling is enabled
+
     def set_all_buttons_state(self, state):
         for btn in self.buttons:
             btn.config(state=state)
@@ -315,40 +332,6 @@ class AttendanceBotGUI(tk.Frame):
         finally:
             self.logger_menu.grab_release()
 
-    # Logger functions
-    def log(self, message):
-        self.logger.config(state=tk.NORMAL)
-        full_plain_text = ""
-        try:
-            parsed = json.loads(message)
-            if isinstance(parsed, list):
-                for entry in parsed:
-                    content = entry.get("text", "")
-                    tag = entry.get("tag", None)
-                    styles = {
-                        "foreground": entry.get("color", "white"),
-                        "font": ("Courier", 10, ("bold" if entry.get("bold") else "") + (" italic" if entry.get("italic") else ""))
-                    }
-                    self.logger.insert(tk.END, content, tag)
-                    self.logger.tag_config(tag, **styles)
-                    full_plain_text += content
-            else:
-                content = parsed.get("text", "")
-                tag = parsed.get("tag", None)
-                styles = {
-                    "foreground": parsed.get("color", "white"),
-                    "font": ("Courier", 10, ("bold" if parsed.get("bold") else "") + (" italic" if parsed.get("italic") else ""))
-                }
-                self.logger.insert(tk.END, content + "\n", tag)
-                self.logger.tag_config(tag, **styles)
-                full_plain_text += content
-        except Exception:
-            self.logger.insert(tk.END, message + "\n")
-            full_plain_text = message
-        self.logger.yview(tk.END)
-        self.logger.config(state=tk.DISABLED)
-        append_runtime_log(full_plain_text.strip())
-
     # Logger actions
     def get_selected_log_lines(self):
         selected_text = self.logger.get(self.logger.index(tk.INSERT) + " linestart", self.logger.index(tk.INSERT) + " lineend")
@@ -391,17 +374,26 @@ class AttendanceBotGUI(tk.Frame):
             height=height
         )
 
+        # Job progress rows take the bottom of the right frame, the logger the rest
+        job_panel_height = self.job_panel.required_height
+        logger_height = height - UI.PADDING * 2 - job_panel_height
         self.logger.place(
             x=0,
             y=0,
             width=right_width - UI.SCROLLBAR.WIDTH,
-            height=height - UI.PADDING * 2
+            height=logger_height
         )
         self.logger_scrollbar.place(
             x=right_width - UI.SCROLLBAR.WIDTH,
             y=0,
             width=UI.SCROLLBAR.WIDTH,
-            height=height - UI.PADDING * 2
+            height=logger_height
+        )
+        self.job_panel.place(
+            x=0,
+            y=logger_height,
+            width=right_width,
+            height=job_panel_height
         )
 
     # Task wrappers (no UI logic here)
@@ -457,6 +449,7 @@ class AttendanceBotGUI(tk.Frame):
         try:
             deleted = clear_all_cache_files()
             deleted += clear_all_daily_summary_files()
+            deleted += clear_response_cache()
             log(f"Cache cleared. Deleted {deleted} files.")
         except Exception as e:
             log(f"Failed to clear all cache: {e}", LogLevel.ERROR)
@@ -4,8 +4,8 @@
 # Do not distribute or modify
 # Author: DragonTaki (https://github.com/DragonTaki)
 # Create Date: 2025/04/22
-# Update Date: 2025/04/23
-# Version: v1.1
+# Update Date: 2026/10/19
+# Version: v1.2
 # ----- ----- ----- -----
 
 import tkinter as tk
@@ -13,12 +13,14 @@ import sys
 from tkinter import messagebox
 
 # Show trial expired popup
-def show_trial_expired_warning() -> None:
+def show_trial_expired_warning(parent: tk.Misc | None = None) -> None:
     """Show a blocking popup to inform the user the trial has expired"""
-    root = tk.Tk()
-    root.withdraw() # Hide main window
+    root = parent if parent is not None else tk.Tk()
+    if parent is None:
+        root.withdraw() # Hide main window
 
     messagebox.showerror(
+        parent=root,
         title="Trial Expired",
         message=(
             "❌ Trial expired.\n"
@@ -26,16 +28,18 @@ def show_trial_expired_warning() -> None:
         )
     )
 
-    root.destroy()
+    root.destroy()  # The app cannot be used, close the main window too
     sys.exit(1)
 
 
-def show_trial_notice() -> None:
+def show_trial_notice(parent: tk.Misc | None = None) -> None:
     """Show a non-blocking popup to inform the user this is a trial version"""
-    root = tk.Tk()
-    root.withdraw()  # Hide main window
+    root = parent if parent is not None else tk.Tk()
+    if parent is None:
+        root.withdraw()  # Hide main window
 
     messagebox.showinfo(
+        parent=root,
         title="Trial Version",
         message=(
             "🔔 This is a trial version.\n"
@@ -43,4 +47,5 @@ def show_trial_notice() -> None:
         )
     )
 
-    root.destroy()
+    if parent is None:
+        root.destroy()
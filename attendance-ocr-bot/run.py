@@ -4,76 +4,109 @@
 # Do not distribute or modify
 # Author: DragonTaki (https://github.com/DragonTaki)
 # Create Date: 2025/04/18
-# Update Date: 2025/04/27
-# Version: v1.2
+# Update Date: 2026/10/19
+# Version: v1.3
 # ----- ----- ----- -----
 
 import atexit
-import requests
+import time
 import tkinter as tk
-from datetime import datetime
 
 # Load settings first and ensure it's initialized
 import botcore.config.settings
 
 from gui.auth_interface import show_auth_file_warning, show_auth_failed_warning
-from gui.main_interface import AttendanceBotGUI
 from gui.trial_notice_interface import show_trial_expired_warning, show_trial_notice
-from botcore.config.static_settings import IF_TRIAL_VERSION, EXPIRE_DATE
+from botcore.config.settings_manager import start_settings_watcher
+from botcore.config.static_settings import IF_TRIAL_VERSION
 from botcore.logging.log_file_manager import shutdown_runtime_log
-from botcore.core.auth_manager import auth_manager
-
-def _get_network_datetime() -> datetime | None:
-    try:
-        response = requests.get("https://www.google.com", timeout=5)
-        date_str = response.headers["Date"]  # Format: 'Wed, 23 Apr 2025 07:12:17 GMT'
-        return datetime.strptime(date_str, "%a, %d %b %Y %H:%M:%S GMT")
-    except Exception as e:
-        print(f"[ERROR] Failed to get network time: {e}")
-        return None
-
-# Check expiration before running
-def _is_expired() -> bool:
-    if not IF_TRIAL_VERSION:
-        return False
-    try:
-        if EXPIRE_DATE == "YYYY-MM-DD":  # Check for invalid default
-            return True
-        expire_date = datetime.strptime(EXPIRE_DATE, "%Y-%m-%d")
-        now = _get_network_datetime()
-        if not now:
-            return True  # Fallback: block if can't verify time
-        return now > expire_date
-    except Exception:
-        return True  # Fallback: block if invalid
+from botcore.core.startup_manager import PHASE_IMPORTS, PHASE_WINDOW, StartupOrchestrator
 
-def main() -> None:
-    # Step 1. Run Authentication first
-    auth_result = auth_manager()
-    if auth_result == "undefined":
-        show_auth_file_warning()
-        return
-    elif auth_result == "fail":
-        show_auth_failed_warning()
-        return
-
-    # Step 2. Trial check
-    if IF_TRIAL_VERSION:
-        if _is_expired():
-            print("❌ Trial expired. Please contact the developer.")
-            show_trial_expired_warning()
-            return
-        else:
-            show_trial_notice()
+# Constants
+STARTUP_POLL_INTERVAL_MS = 50
 
-    # Step 3. Start GUI
+def main() -> None:
     atexit.register(shutdown_runtime_log)
 
+    # Step 1. Start authentication, trial check and heavy imports in the background
+    startup = StartupOrchestrator()
+    startup.start()
+
+    # Step 2. Show the window right away
     root = tk.Tk()
     root.title("Attendance Bot for Griffin Empire - created by @DragonTaki")
     root.geometry("1280x720")
-    app = AttendanceBotGUI(root, show_welcome=True)
-    app.pack(fill="both", expand=True)
+    loading_label = tk.Label(root, text="Starting...")
+    loading_label.pack(expand=True)
+    app = None
+
+    def finish_startup() -> None:
+        # Step 4. Apply check results
+        if startup.auth_result == "undefined":
+            show_auth_file_warning(parent=root)
+            root.destroy()
+            return
+        elif startup.auth_result == "fail":
+            show_auth_failed_warning(parent=root)
+            root.destroy()
+            return
+
+        if IF_TRIAL_VERSION:
+            if startup.trial_expired:
+                print("❌ Trial expired. Please contact the developer.")
+                show_trial_expired_warning(parent=root)
+                return
+            else:
+                show_trial_notice(parent=root)
+
+        app.set_all_buttons_state(tk.NORMAL)
+        from botcore.logging.app_logger import log, log_welcome_message
+        log_welcome_message()
+        startup.log_timings()
+
+        # Step 5. Pick up settings.json edits while running
+        def on_settings_reloaded() -> None:
+            app.update_switches()
+            log("Settings reloaded from file.")
+        start_settings_watcher(on_reload=lambda: root.after(0, on_settings_reloaded))
+
+        # Step 6. Export metrics for dashboards
+        from botcore.utils.metrics import start_metrics_exporter, stop_metrics_exporter
+        if start_metrics_exporter():
+            atexit.register(stop_metrics_exporter)
+
+        # Step 7. Keep the member list and killboard caches warm
+        from botcore.core.cache_prefetcher import start_cache_prefetcher, stop_cache_prefetcher
+        if start_cache_prefetcher():
+            atexit.register(stop_cache_prefetcher)
+
+        # Step 8. OCR screenshots as they are dropped into the attendance folder
+        from botcore.core.screenshot_watcher import start_screenshot_watcher, stop_screenshot_watcher
+        if start_screenshot_watcher():
+            atexit.register(stop_screenshot_watcher)
+
+    def poll_startup() -> None:
+        nonlocal app
+        # Step 3. Build the main interface (inputs disabled) as soon as its imports are ready
+        if app is None and startup.is_done(PHASE_IMPORTS):
+            if PHASE_IMPORTS in startup.errors:
+                root.destroy()
+                raise startup.errors[PHASE_IMPORTS]
+
+            window_start = time.perf_counter()
+            from gui.main_interface import AttendanceBotGUI
+            loading_label.destroy()
+            app = AttendanceBotGUI(root)
+            app.pack(fill="both", expand=True)
+            app.set_all_buttons_state(tk.DISABLED)
+            startup.record(PHASE_WINDOW, window_start)
+
+        if app is None or not startup.is_done():
+            root.after(STARTUP_POLL_INTERVAL_MS, poll_startup)
+            return
+        finish_startup()
+
+    root.after(0, poll_startup)
     root.mainloop()
 
 if __name__ == "__main__":
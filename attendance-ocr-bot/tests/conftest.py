@@ -0,0 +1,20 @@
+# ----- ----- ----- -----
+# conftest.py
+# For Albion Online "Griffin Empire" Guild only
+# Do not distribute or modify
+# Author: DragonTaki (https://github.com/DragonTaki)
+# Create Date: 2026/10/19
+# Update Date: 2026/10/19
+# Version: v1.0
+# ----- ----- ----- -----
+
+import os
+import sys
+import tempfile
+
+# `botcore` reads and writes settings.json, log/ and cache/ relative to the working directory,
+# so tests run in a scratch folder instead of the project one
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+os.chdir(tempfile.mkdtemp(prefix="attendance_tests_"))
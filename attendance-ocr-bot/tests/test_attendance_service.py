@@ -0,0 +1,73 @@
+# ----- ----- ----- -----
+# test_attendance_service.py
+# For Albion Online "Griffin Empire" Guild only
+# Do not distribute or modify
+# Author: DragonTaki (https://github.com/DragonTaki)
+# Create Date: 2026/10/19
+# Update Date: 2026/10/19
+# Version: v1.0
+# ----- ----- ----- -----
+
+# Upload validation of the local service, before any job is queued.
+
+import json
+import socket
+import threading
+
+import pytest
+
+from botcore.core.attendance_service import serve
+
+
+@pytest.fixture
+def service_address():
+    ready = threading.Event()
+    servers = []
+
+    def on_ready(server):
+        servers.append(server)
+        ready.set()
+
+    thread = threading.Thread(target=serve, kwargs={"host": "127.0.0.1", "port": 0, "workers": 1, "ready": on_ready},
+                              daemon=True)
+    thread.start()
+    assert ready.wait(10)
+    try:
+        yield servers[0].server_address
+    finally:
+        servers[0].shutdown()
+        thread.join(10)
+
+
+def _post_raw(address, content_length: str, body: bytes = b"") -> tuple[int, dict]:
+    """
+    Send a POST with a hand-written Content-Length, which http.client would not allow.
+    """
+    request = (f"POST /screenshots HTTP/1.1\r\nHost: localhost\r\n"
+               f"Content-Length: {content_length}\r\n\r\n").encode("ascii") + body
+    with socket.create_connection(address, timeout=10) as sock:
+        sock.sendall(request)
+        response = b""
+        while chunk := sock.recv(4096):
+            response += chunk
+    head, _, payload = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(payload)
+
+
+# ----- Tests ----- #
+def test_negative_content_length_is_rejected(service_address):
+    # The connection stays open from the client side; the service must answer without reading to EOF
+    status, payload = _post_raw(service_address, "-1", b"x" * 16)
+    assert status == 400
+    assert "Content-Length" in payload["error"]
+
+
+def test_zero_content_length_is_empty_upload(service_address):
+    status, payload = _post_raw(service_address, "0")
+    assert status == 400
+    assert payload["error"] == "Empty upload."
+
+
+def test_missing_content_length_is_rejected(service_address):
+    status, _ = _post_raw(service_address, "")
+    assert status == 411
@@ -0,0 +1,128 @@
+# ----- ----- ----- -----
+# test_cache_prefetcher.py
+# For Albion Online "Griffin Empire" Guild only
+# Do not distribute or modify
+# Author: DragonTaki (https://github.com/DragonTaki)
+# Create Date: 2026/10/19
+# Update Date: 2026/10/19
+# Version: v1.0
+# ----- ----- ----- -----
+
+# Prefetch due-time math, driven by a fake clock instead of the background thread.
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import botcore.core.cache_prefetcher as cache_prefetcher
+from botcore.config.constant import CacheType
+from botcore.core.cache import CACHE_EXPIRY_HOURS
+from botcore.core.cache_prefetcher import CachePrefetcher, PrefetchTarget
+
+# ----- Constants ----- #
+JITTER_SEC = 120
+LEAD_TIME_MIN = 30
+START = datetime(2026, 10, 19, 12, 0, tzinfo=timezone.utc)
+
+
+class _FakeScheduler:
+    def __init__(self):
+        self.submitted = []
+
+    def submit(self, name, func, label=None):
+        self.submitted.append(name)
+
+
+@pytest.fixture
+def prefetch_config(monkeypatch):
+    config = cache_prefetcher.settings.prefetch
+    monkeypatch.setattr(config, "jitter_sec", JITTER_SEC)
+    monkeypatch.setattr(config, "lead_time_min", LEAD_TIME_MIN)
+    monkeypatch.setattr(config, "daily_times", [])
+    monkeypatch.setattr(config, "refresh_missing", True)
+    monkeypatch.setattr(config, "retry_after_min", 10)
+    return config
+
+
+@pytest.fixture
+def saved_at(monkeypatch):
+    """
+    Cache save time returned by the prefetcher's lookup; None means the cache is missing.
+    """
+    state = {"value": None}
+    monkeypatch.setattr(cache_prefetcher, "get_cache_saved_at", lambda cache_type: state["value"])
+    return state
+
+
+@pytest.fixture
+def prefetcher(prefetch_config, saved_at):
+    target = PrefetchTarget(CacheType.MEMBERLIST, "members", "member list", lambda: None)
+    return CachePrefetcher(scheduler=_FakeScheduler(), targets=(target,)), target
+
+
+def _run_checks(prefetcher, target, now, checks):
+    """
+    Poll like `_run`: sleep until the due time, refresh once it has passed.
+
+    Returns:
+        datetime | None: The time of the first refresh, or None if none happened.
+    """
+    for _ in range(checks):
+        due = prefetcher.next_refresh_at(target, now)
+        if due is None:
+            return None
+        if due <= now:
+            prefetcher._refresh(target)
+            return now
+        now = due
+    return None
+
+
+# ----- Tests ----- #
+def test_missing_cache_is_refreshed_within_jitter(prefetcher):
+    prefetcher, target = prefetcher
+
+    refreshed_at = _run_checks(prefetcher, target, START, checks=200)
+
+    assert refreshed_at is not None
+    assert refreshed_at - START <= timedelta(seconds=JITTER_SEC)
+    assert prefetcher.scheduler.submitted == ["members"]
+
+
+def test_missing_cache_is_retried_after_failed_refresh(prefetcher, prefetch_config):
+    prefetcher, target = prefetcher
+    prefetcher._last_attempt[target.cache_type] = START
+
+    due = prefetcher.next_refresh_at(target, START + timedelta(seconds=1))
+
+    assert due == START + timedelta(minutes=prefetch_config.retry_after_min)
+
+
+def test_missing_cache_not_refreshed_when_disabled(prefetcher, prefetch_config, monkeypatch):
+    prefetcher, target = prefetcher
+    monkeypatch.setattr(prefetch_config, "refresh_missing", False)
+
+    assert prefetcher.next_refresh_at(target, START) is None
+
+
+def test_saved_cache_is_due_lead_time_before_expiry(prefetcher, saved_at):
+    prefetcher, target = prefetcher
+    saved_at["value"] = START
+    base = START + timedelta(hours=CACHE_EXPIRY_HOURS, minutes=-LEAD_TIME_MIN)
+
+    due = prefetcher.next_refresh_at(target, START)
+
+    assert base <= due <= base + timedelta(seconds=JITTER_SEC)
+    # The jitter is drawn once per due time, not on every check
+    assert prefetcher.next_refresh_at(target, START + timedelta(minutes=5)) == due
+
+
+def test_daily_time_before_expiry_wins(prefetcher, prefetch_config, saved_at, monkeypatch):
+    prefetcher, target = prefetcher
+    saved_at["value"] = START
+    daily = (START + timedelta(minutes=10)).astimezone()
+    monkeypatch.setattr(prefetch_config, "daily_times", [f"{daily.hour:02d}:{daily.minute:02d}"])
+
+    due = prefetcher.next_refresh_at(target, START)
+
+    assert START + timedelta(minutes=10) <= due <= START + timedelta(minutes=10, seconds=JITTER_SEC)
@@ -0,0 +1,113 @@
+# ----- ----- ----- -----
+# test_circuit_breaker.py
+# For Albion Online "Griffin Empire" Guild only
+# Do not distribute or modify
+# Author: DragonTaki (https://github.com/DragonTaki)
+# Create Date: 2026/10/19
+# Update Date: 2026/10/19
+# Version: v1.0
+# ----- ----- ----- -----
+
+# Per-host circuit breaker, on its own and inside the HTTP client.
+
+import time
+
+import pytest
+import requests
+
+from botcore.utils.circuit_breaker import CircuitBreaker, CircuitState
+from botcore.utils.http_client import HttpClient
+from botcore.utils.job_scheduler import JobCancelledError
+
+# ----- Constants ----- #
+COOLDOWN_SEC = 0.05
+URL = "http://127.0.0.1:9/guild"
+
+
+def _open_breaker(threshold: int = 2) -> CircuitBreaker:
+    breaker = CircuitBreaker(threshold, COOLDOWN_SEC)
+    for _ in range(threshold):
+        assert breaker.allow_request()
+        breaker.record_failure()
+    return breaker
+
+
+# ----- Breaker ----- #
+def test_opens_after_threshold_and_fails_fast():
+    breaker = CircuitBreaker(3, COOLDOWN_SEC)
+    assert breaker.record_failure() is False
+    assert breaker.record_failure() is False
+    assert breaker.record_failure() is True
+    assert breaker.state == CircuitState.OPEN
+    assert not breaker.allow_request()
+
+
+def test_success_resets_failure_count():
+    breaker = CircuitBreaker(2, COOLDOWN_SEC)
+    breaker.record_failure()
+    breaker.record_success()
+    assert breaker.record_failure() is False
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_half_open_allows_a_single_probe():
+    breaker = _open_breaker()
+    time.sleep(COOLDOWN_SEC * 2)
+
+    assert breaker.allow_request()
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert not breaker.allow_request()  # Probe still in flight
+
+
+def test_probe_success_closes_and_failure_reopens():
+    breaker = _open_breaker()
+    time.sleep(COOLDOWN_SEC * 2)
+    assert breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == CircuitState.CLOSED
+
+    breaker = _open_breaker()
+    time.sleep(COOLDOWN_SEC * 2)
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    assert not breaker.allow_request()
+
+
+def test_released_probe_lets_next_request_probe():
+    breaker = _open_breaker()
+    time.sleep(COOLDOWN_SEC * 2)
+    assert breaker.allow_request()
+
+    breaker.release_probe()
+
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert breaker.allow_request()
+
+
+# ----- HTTP Client ----- #
+@pytest.fixture
+def half_open_client():
+    client = HttpClient(max_retries=1, backoff_base=0, breaker_threshold=1, breaker_cooldown_sec=COOLDOWN_SEC)
+    breaker = client._breaker_for("127.0.0.1:9")
+    breaker.record_failure()
+    time.sleep(COOLDOWN_SEC * 2)
+    yield client, breaker
+    client.close()
+
+
+@pytest.mark.parametrize("error", [requests.exceptions.InvalidURL("bad"), JobCancelledError()])
+def test_client_releases_probe_without_verdict(half_open_client, monkeypatch, error):
+    client, breaker = half_open_client
+
+    def fail(*args, **kwargs):
+        raise error
+    monkeypatch.setattr(client._session, "request", fail)
+
+    try:
+        client.request("GET", URL, use_logger=False)
+    except JobCancelledError:
+        pass
+
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert breaker.allow_request()
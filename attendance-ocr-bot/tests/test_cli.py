@@ -0,0 +1,46 @@
+# ----- ----- ----- -----
+# test_cli.py
+# For Albion Online "Griffin Empire" Guild only
+# Do not distribute or modify
+# Author: DragonTaki (https://github.com/DragonTaki)
+# Create Date: 2026/10/19
+# Update Date: 2026/10/19
+# Version: v1.0
+# ----- ----- ----- -----
+
+# Argument parsing of the headless runner, including the examples in its docstring.
+
+import shlex
+
+import pytest
+
+import cli
+
+
+def _docstring_examples() -> list[list[str]]:
+    examples = []
+    for line in cli.__doc__.splitlines():
+        line = line.strip()
+        if line.startswith("python cli.py "):
+            examples.append(shlex.split(line.split(">")[0])[2:])
+    return examples
+
+
+@pytest.mark.parametrize("argv", _docstring_examples())
+def test_docstring_examples_parse(argv):
+    cli.build_parser().parse_args(argv)
+
+
+@pytest.mark.parametrize("argv", [
+    ["--json", "--profile", "report"],
+    ["report", "--json", "--profile"],
+    ["--json", "report", "--profile"],
+])
+def test_output_flags_before_or_after_command(argv):
+    args = cli.build_parser().parse_args(argv)
+    assert args.json and args.profile
+
+
+def test_output_flags_default_off():
+    args = cli.build_parser().parse_args(["summarise-screenshots"])
+    assert not args.json and not args.profile
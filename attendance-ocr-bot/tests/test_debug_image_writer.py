@@ -0,0 +1,50 @@
+# ----- ----- ----- -----
+# test_debug_image_writer.py
+# For Albion Online "Griffin Empire" Guild only
+# Do not distribute or modify
+# Author: DragonTaki (https://github.com/DragonTaki)
+# Create Date: 2026/10/19
+# Update Date: 2026/10/19
+# Version: v1.0
+# ----- ----- ----- -----
+
+# Size cap bookkeeping of the background debug image writer.
+
+import os
+
+from PIL import Image
+
+from botcore.core.debug_image_writer import DebugImageWriter
+
+
+def _image(seed: int) -> Image.Image:
+    return Image.frombytes("L", (32, 32), bytes((seed * 31 + i * 7) % 256 for i in range(32 * 32)))
+
+
+def test_rewritten_image_is_counted_once(tmp_path):
+    writer = DebugImageWriter(str(tmp_path), max_queue=10, max_folder_bytes=10 ** 9, compress_level=1)
+
+    writer.submit(_image(1), "day.png", "s0")
+    writer.join()
+    writer.submit(_image(2), "day.png", "s0")
+    writer.join()
+
+    path = str(tmp_path / "day_s0_0.png")
+    assert list(writer._files) == [path]
+    assert writer._folder_bytes == os.path.getsize(path)
+
+
+def test_rewritten_image_is_not_evicted_as_oldest(tmp_path):
+    writer = DebugImageWriter(str(tmp_path), max_queue=10, max_folder_bytes=10 ** 9, compress_level=1)
+    writer.submit(_image(1), "a.png", "s0")
+    writer.join()
+    writer.submit(_image(2), "b.png", "s0")
+    writer.join()
+
+    # Rewriting "a" makes it the newest, so a tight cap evicts "b" instead
+    writer.max_folder_bytes = os.path.getsize(tmp_path / "a_s0_0.png") + 1
+    writer.submit(_image(1), "a.png", "s0")
+    writer.join()
+
+    assert (tmp_path / "a_s0_0.png").exists()
+    assert not (tmp_path / "b_s0_0.png").exists()
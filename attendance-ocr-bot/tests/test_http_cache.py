@@ -0,0 +1,154 @@
+# ----- ----- ----- -----
+# test_http_cache.py
+# For Albion Online "Griffin Empire" Guild only
+# Do not distribute or modify
+# Author: DragonTaki (https://github.com/DragonTaki)
+# Create Date: 2026/10/19
+# Update Date: 2026/10/19
+# Version: v1.0
+# ----- ----- ----- -----
+
+# Conditional-GET response cache against a stub server on 127.0.0.1.
+# Run from the attendance-ocr-bot folder: python -m pytest tests
+
+import json
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import botcore.config.settings
+from botcore.utils.http_cache import HttpResponseCache
+from botcore.utils.http_client import HttpClient
+
+# ----- Constants ----- #
+STUB_ETAG = '"v1"'
+STUB_LAST_MODIFIED = formatdate(0, usegmt=True)
+STUB_BODY = [{"name": "PlayerOne"}, {"name": "PlayerTwo"}]
+
+
+# ----- Stub Server ----- #
+class _StubHandler(BaseHTTPRequestHandler):
+    """
+    Serves STUB_BODY with validators, answers 304 to a matching If-None-Match,
+    and 503 while `failing` is set. Every request's headers are recorded.
+    """
+
+    requests: list[dict] = []
+    failing = False
+
+    def do_GET(self):
+        self.requests.append(dict(self.headers))
+        if self.failing:
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.headers.get("If-None-Match") == STUB_ETAG:
+            self.send_response(304)
+            self.send_header("ETag", STUB_ETAG)
+            self.end_headers()
+            return
+
+        body = json.dumps(STUB_BODY).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", STUB_ETAG)
+        self.send_header("Last-Modified", STUB_LAST_MODIFIED)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_url():
+    handler = type("Handler", (_StubHandler,), {"requests": [], "failing": False})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}/guild/members", handler
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return HttpResponseCache(str(tmp_path / "http"))
+
+
+@pytest.fixture
+def client(cache):
+    client = HttpClient(max_retries=1, backoff_base=0, response_cache=cache)
+    yield client
+    client.close()
+
+
+# ----- Tests ----- #
+def test_200_stores_body_and_validators(stub_url, cache, client):
+    url, handler = stub_url
+
+    assert client.get_json(url, use_cache=True, ttl_sec=60) == STUB_BODY
+
+    entry = cache.get(url)
+    assert entry is not None
+    assert entry.etag == STUB_ETAG
+    assert entry.last_modified == STUB_LAST_MODIFIED
+    assert json.loads(cache.read_body(entry)) == STUB_BODY
+    assert "If-None-Match" not in handler.requests[0]
+
+
+def test_fresh_entry_is_served_without_request(stub_url, client):
+    url, handler = stub_url
+
+    client.get_json(url, use_cache=True, ttl_sec=60)
+    assert client.get_json(url, use_cache=True, ttl_sec=60) == STUB_BODY
+    assert len(handler.requests) == 1
+
+
+def test_304_reuses_stored_body(stub_url, cache, client):
+    url, handler = stub_url
+    client.get_json(url, use_cache=True, ttl_sec=0)
+    fetched_at = cache.get(url).fetched_at
+
+    assert client.get_json(url, use_cache=True, ttl_sec=60) == STUB_BODY
+
+    assert handler.requests[-1].get("If-None-Match") == STUB_ETAG
+    entry = cache.get(url)
+    assert entry.fetched_at > fetched_at  # Revalidated, so fresh again
+    assert entry.ttl_sec == 60
+
+
+def test_expired_entry_sends_conditional_request(stub_url, cache, client):
+    url, handler = stub_url
+    client.get_json(url, use_cache=True, ttl_sec=0.2)
+    assert client.get_json(url, use_cache=True, ttl_sec=0.2) == STUB_BODY
+    assert len(handler.requests) == 1
+
+    time.sleep(0.3)
+    assert client.get_json(url, use_cache=True, ttl_sec=0.2) == STUB_BODY
+    assert len(handler.requests) == 2
+    assert handler.requests[1].get("If-None-Match") == STUB_ETAG
+    assert handler.requests[1].get("If-Modified-Since") == STUB_LAST_MODIFIED
+
+
+def test_stale_body_is_served_on_failure(stub_url, cache, client):
+    url, handler = stub_url
+    client.get_json(url, use_cache=True, ttl_sec=0)
+    handler.failing = True
+
+    assert client.get_json(url, use_cache=True, ttl_sec=0) == STUB_BODY
+    assert len(handler.requests) == 2
+
+
+def test_failure_without_entry_returns_none(stub_url, client):
+    url, handler = stub_url
+    handler.failing = True
+
+    assert client.get_json(url, use_cache=True, ttl_sec=0) is None
@@ -0,0 +1,141 @@
+# ----- ----- ----- -----
+# test_job_scheduler.py
+# For Albion Online "Griffin Empire" Guild only
+# Do not distribute or modify
+# Author: DragonTaki (https://github.com/DragonTaki)
+# Create Date: 2026/10/19
+# Update Date: 2026/10/19
+# Version: v1.0
+# ----- ----- ----- -----
+
+# Dependencies, exclusivity, de-duplication and cancellation of scheduled jobs.
+
+import threading
+import time
+
+import pytest
+
+from botcore.utils.job_scheduler import JobScheduler, JobState, check_cancelled
+
+# ----- Constants ----- #
+TIMEOUT_SEC = 5
+
+
+@pytest.fixture
+def scheduler():
+    return JobScheduler(max_workers=3, dependencies={"report": ("fetch",)}, exclusive={"clear"})
+
+
+def _blocking_task(release: threading.Event, started: threading.Event = None, result=None):
+    def task():
+        if started:
+            started.set()
+        while not release.wait(0.01):
+            check_cancelled()
+        return result
+    return task
+
+
+# ----- Tests ----- #
+def test_job_records_result(scheduler):
+    job = scheduler.submit("fetch", lambda: 42)
+    assert job.wait(TIMEOUT_SEC)
+    assert job.state == JobState.DONE
+    assert job.result == 42
+
+
+def test_failed_job_records_error(scheduler):
+    def fail():
+        raise ValueError("boom")
+
+    job = scheduler.submit("fetch", fail)
+    assert job.wait(TIMEOUT_SEC)
+    assert job.state == JobState.FAILED
+    assert isinstance(job.error, ValueError)
+
+
+def test_duplicate_name_returns_active_job(scheduler):
+    release = threading.Event()
+    first = scheduler.submit("fetch", _blocking_task(release))
+    assert scheduler.submit("fetch", lambda: None) is first
+
+    release.set()
+    assert first.wait(TIMEOUT_SEC)
+    second = scheduler.submit("fetch", lambda: None)
+    assert second is not first
+
+
+def test_dependent_job_waits_for_earlier_job(scheduler):
+    release = threading.Event()
+    order = []
+    fetch = scheduler.submit("fetch", lambda: (release.wait(TIMEOUT_SEC), order.append("fetch")))
+    report = scheduler.submit("report", lambda: order.append("report"))
+
+    time.sleep(0.05)
+    assert report.state == JobState.PENDING
+    release.set()
+
+    assert report.wait(TIMEOUT_SEC) and fetch.wait(TIMEOUT_SEC)
+    assert order == ["fetch", "report"]
+
+
+def test_independent_jobs_run_concurrently(scheduler):
+    release = threading.Event()
+    started = [threading.Event(), threading.Event()]
+    jobs = [scheduler.submit(name, _blocking_task(release, event)) for name, event in zip(("a", "b"), started)]
+
+    assert all(event.wait(TIMEOUT_SEC) for event in started)
+    release.set()
+    assert all(job.wait(TIMEOUT_SEC) for job in jobs)
+
+
+def test_exclusive_job_runs_alone(scheduler):
+    release = threading.Event()
+    fetch = scheduler.submit("fetch", _blocking_task(release))
+    clear = scheduler.submit("clear", lambda: None)
+    later = scheduler.submit("other", lambda: None)
+
+    time.sleep(0.05)
+    assert clear.state == JobState.PENDING
+    assert later.state == JobState.PENDING  # Submitted after the exclusive job
+    release.set()
+
+    assert all(job.wait(TIMEOUT_SEC) for job in (fetch, clear, later))
+    assert clear.finished_at <= later.started_at
+
+
+def test_cancel_pending_job_finishes_it(scheduler):
+    release = threading.Event()
+    fetch = scheduler.submit("fetch", _blocking_task(release))
+    report = scheduler.submit("report", lambda: None)
+
+    scheduler.cancel(report.id)
+
+    assert report.wait(TIMEOUT_SEC)
+    assert report.state == JobState.CANCELLED
+    release.set()
+    assert fetch.wait(TIMEOUT_SEC)
+
+
+def test_cancel_running_job_stops_at_next_check(scheduler):
+    started = threading.Event()
+    job = scheduler.submit("fetch", _blocking_task(threading.Event(), started))
+    assert started.wait(TIMEOUT_SEC)
+
+    scheduler.cancel(job.id)
+
+    assert job.wait(TIMEOUT_SEC)
+    assert job.state == JobState.CANCELLED
+    assert scheduler.active_jobs() == []
+
+
+def test_max_workers_limits_running_jobs():
+    scheduler = JobScheduler(max_workers=1)
+    release = threading.Event()
+    first = scheduler.submit("a", _blocking_task(release))
+    second = scheduler.submit("b", lambda: None)
+
+    time.sleep(0.05)
+    assert second.state == JobState.PENDING
+    release.set()
+    assert first.wait(TIMEOUT_SEC) and second.wait(TIMEOUT_SEC)
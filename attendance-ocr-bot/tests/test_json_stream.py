@@ -0,0 +1,66 @@
+# ----- ----- ----- -----
+# test_json_stream.py
+# For Albion Online "Griffin Empire" Guild only
+# Do not distribute or modify
+# Author: DragonTaki (https://github.com/DragonTaki)
+# Create Date: 2026/10/19
+# Update Date: 2026/10/19
+# Version: v1.0
+# ----- ----- ----- -----
+
+# Incremental JSON array decoding, fed in chunks of every size.
+
+import json
+
+import pytest
+
+from botcore.utils.json_stream import JsonStreamError, iter_json_array, iter_projected
+
+# ----- Constants ----- #
+SAMPLE = [{"Name": "Ünïcödé", "Id": "a,b]"}, 12345, -1.5e3, True, None, "x", [], {}]
+
+
+def _chunked(text: str, size: int) -> list[bytes]:
+    data = text.encode("utf-8")
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+# ----- Tests ----- #
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 10 ** 6])
+def test_decodes_any_chunking(size):
+    text = " " + json.dumps(SAMPLE, ensure_ascii=False) + "\n"
+    assert list(iter_json_array(_chunked(text, size))) == SAMPLE
+
+
+@pytest.mark.parametrize("size", [1, 2, 64])
+def test_number_split_across_chunks(size):
+    assert list(iter_json_array(_chunked("[123456789, 42]", size))) == [123456789, 42]
+
+
+def test_empty_array():
+    assert list(iter_json_array([b"[ ]"])) == []
+
+
+@pytest.mark.parametrize("body", [
+    "[1,]",        # Trailing comma
+    "[,1]",
+    "[1 2]",
+    "[1]x",        # Data after the array
+    "[1] [2]",
+    "[1",          # Truncated
+    "[{\"a\": 1",
+    "{\"a\": 1}",  # Not an array
+    "",
+])
+@pytest.mark.parametrize("size", [1, 64])
+def test_malformed_body_raises(body, size):
+    with pytest.raises(JsonStreamError):
+        list(iter_json_array(_chunked(body, size)))
+
+
+def test_projection_keeps_fields_and_skips_non_objects():
+    records = iter_json_array([json.dumps(SAMPLE).encode("utf-8")])
+    assert list(iter_projected(records, ["Name", "Missing"])) == [
+        {"Name": "Ünïcödé", "Missing": None},
+        {"Name": None, "Missing": None},
+    ]
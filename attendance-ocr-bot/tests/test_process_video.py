@@ -0,0 +1,63 @@
+# ----- ----- ----- -----
+# test_process_video.py
+# For Albion Online "Griffin Empire" Guild only
+# Do not distribute or modify
+# Author: DragonTaki (https://github.com/DragonTaki)
+# Create Date: 2026/10/19
+# Update Date: 2026/10/19
+# Version: v1.0
+# ----- ----- ----- -----
+
+# Name row de-duplication across video frames.
+
+import numpy as np
+from PIL import Image
+
+from botcore.core.process_video import RowTracker, collapse_video_matches, region_dhash
+
+
+def _row_image(seed: int, noise: int = 0) -> Image.Image:
+    rng = np.random.default_rng(seed)
+    pixels = rng.integers(0, 256, size=(24, 160), dtype=np.int16)
+    if noise:
+        pixels += np.random.default_rng(seed + 1000).integers(-noise, noise + 1, size=pixels.shape, dtype=np.int16)
+    return Image.fromarray(np.clip(pixels, 0, 255).astype(np.uint8))
+
+
+# ----- Tests ----- #
+def test_same_row_with_noise_hashes_nearly_the_same():
+    distance = (region_dhash(_row_image(1)) ^ region_dhash(_row_image(1, noise=3))).bit_count()
+    different = (region_dhash(_row_image(1)) ^ region_dhash(_row_image(2))).bit_count()
+    assert distance <= 4 < different
+
+
+def test_tracker_matches_within_distance():
+    tracker = RowTracker(max_rows=10, max_distance=2)
+    assert tracker.seen(0b1111_0000) is False
+    assert tracker.seen(0b1111_0011) is True   # 2 bits apart
+    assert tracker.seen(0b1111_0111) is False  # 3 bits apart, remembered as new
+
+
+def test_tracker_forgets_least_recently_seen():
+    tracker = RowTracker(max_rows=2, max_distance=0)
+    tracker.seen(1)
+    tracker.seen(2)
+    tracker.seen(1)      # Refreshes 1, so 2 is now the oldest
+    tracker.seen(4)      # Evicts 2
+
+    assert tracker.seen(1) is True
+    assert tracker.seen(2) is False
+
+
+def test_collapse_counts_each_player_once():
+    matches = [
+        {"PlayerOne": {"v1"}},
+        {"PlayerTwo": {"v1"}},
+        {},
+        {"PlayerOne": {"v2"}},  # Same row read again after scrolling back
+    ]
+
+    assert collapse_video_matches(matches) == [
+        {"PlayerOne": {"v1", "v2"}},
+        {"PlayerTwo": {"v1"}},
+    ]
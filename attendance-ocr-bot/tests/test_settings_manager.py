@@ -0,0 +1,85 @@
+# ----- ----- ----- -----
+# test_settings_manager.py
+# For Albion Online "Griffin Empire" Guild only
+# Do not distribute or modify
+# Author: DragonTaki (https://github.com/DragonTaki)
+# Create Date: 2026/10/19
+# Update Date: 2026/10/19
+# Version: v1.0
+# ----- ----- ----- -----
+
+# Recovery of broken settings files and merging with the defaults.
+
+from botcore.config.settings_manager import _merge_settings, _recover_partial_json5, _split_top_level_members
+from botcore.safe_namespace import SafeNamespace
+
+# ----- Constants ----- #
+DEFAULT_RATE_LIMIT = {
+    "default": {"rate_per_sec": 2.0, "burst": 4},
+    "known.example.com": {"rate_per_sec": 1.0, "burst": 3},
+}
+
+
+# ----- Recovery ----- #
+def test_split_ignores_separators_in_strings_and_comments():
+    text = '''{
+        "a": "x, y } z",  // comment, with } and ,
+        "b": [1, {"c": 2}],
+        /* "d": 3, */ "e": 'it\\'s, fine'
+    }'''
+    members = [member.strip() for member in _split_top_level_members(text)]
+    assert len(members) == 3
+    assert members[0] == '"a": "x, y } z"'
+    assert members[1].endswith('"b": [1, {"c": 2}]')
+    assert members[2].endswith("'it\\'s, fine'")
+
+
+def test_split_keeps_last_member_of_truncated_file():
+    members = _split_top_level_members('{"a": 1, "b": 2')
+    assert [member.strip() for member in members] == ['"a": 1', '"b": 2']
+
+
+def test_recover_keeps_valid_members(tmp_path):
+    path = tmp_path / "settings.json"
+    path.write_text('{"a": 1, "broken": [1, , "c": {"d": "e, f"}, "g": tru}', encoding="utf-8")
+
+    recovered = _recover_partial_json5(str(path))
+
+    assert recovered["a"] == 1
+    assert "g" not in recovered
+
+
+def test_recover_missing_file_is_empty(tmp_path):
+    assert _recover_partial_json5(str(tmp_path / "missing.json")) == {}
+
+
+# ----- Merge ----- #
+def test_merge_fills_missing_and_drops_unknown_keys():
+    defaults = {"group": SafeNamespace(a=1, b=2), "flag": False}
+    merged = _merge_settings({"group": {"a": 10, "unknown": 3}, "other": 1}, defaults)
+    assert merged == {"group": {"a": 10, "b": 2}, "flag": False}
+
+
+def test_merge_keeps_user_added_map_entries():
+    defaults = {"rate_limit": DEFAULT_RATE_LIMIT}
+    user = {"rate_limit": {
+        "default": {"burst": 8},
+        "custom.example.com": {"rate_per_sec": 0.5},
+    }}
+
+    merged = _merge_settings(user, defaults)["rate_limit"]
+
+    assert merged["default"] == {"rate_per_sec": 2.0, "burst": 8}
+    assert merged["known.example.com"] == {"rate_per_sec": 1.0, "burst": 3}
+    # Filled from the merged "default" entry, including the user's own change to it
+    assert merged["custom.example.com"] == {"rate_per_sec": 0.5, "burst": 8}
+
+
+def test_merge_map_inside_namespace():
+    # Loaded settings become SafeNamespaces, nested maps included
+    defaults = {"network": SafeNamespace(rate_limit=DEFAULT_RATE_LIMIT)}
+    user = SafeNamespace(network=SafeNamespace(rate_limit=SafeNamespace(**{"custom.example.com": SafeNamespace(burst=1)})))
+
+    merged = _merge_settings(user, defaults)["network"]["rate_limit"]
+
+    assert merged["custom.example.com"] == {"rate_per_sec": 2.0, "burst": 1}
@@ -0,0 +1,43 @@
+# ----- ----- ----- -----
+# test_task_profiler.py
+# For Albion Online "Griffin Empire" Guild only
+# Do not distribute or modify
+# Author: DragonTaki (https://github.com/DragonTaki)
+# Create Date: 2026/10/19
+# Update Date: 2026/10/19
+# Version: v1.0
+# ----- ----- ----- -----
+
+# Profiled tasks share process-wide tracemalloc state, so they must not overlap.
+
+import threading
+import time
+import tracemalloc
+
+import botcore.utils.task_profiler as task_profiler
+from botcore.utils.task_profiler import run_profiled
+
+
+def test_profiled_tasks_run_one_at_a_time(tmp_path, monkeypatch):
+    monkeypatch.setattr(task_profiler.settings.folder_paths, "log", str(tmp_path))
+    active, overlaps = [], []
+
+    def task():
+        active.append(1)
+        if len(active) > 1:
+            overlaps.append(len(active))
+        time.sleep(0.05)
+        active.pop()
+        return "done"
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(run_profiled("task", task))) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+
+    assert results == ["done"] * 3
+    assert overlaps == []
+    assert not tracemalloc.is_tracing()
+    assert len(list(tmp_path.glob("profile_task_*.txt"))) >= 1